@@ -1,59 +1,224 @@
 """
 安全审计脚本
+
+用法:
+    python security_audit.py <目录路径>
+    python security_audit.py <目录路径> --workers 8              # 多进程检查
+    python security_audit.py <目录路径> --cache .audit_cache.json  # 跳过未修改的文件
+    python security_audit.py <目录路径> --benchmark              # 比较冷启动与缓存命中的耗时
+
+缓存按文件路径记录修改时间、大小与内容哈希：修改时间和大小都未变时不读取文件，
+否则比较内容哈希，内容未变时同样复用上次的检查结果。检查规则变化后缓存自动失效。
+报告与不使用缓存、单进程检查时完全相同。
 """
 import os
 import sys
 import ast
 import re
-from typing import List, Dict, Any
+import argparse
+import hashlib
+import io
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+# 缓存文件格式版本，格式或检查逻辑变化时递增
+CACHE_VERSION = 1
+
+# 字符串模式及对应的问题说明，按报告中的顺序排列
+PATTERNS = {
+    r"eval\(": "使用eval可能导致代码注入",
+    r"exec\(": "使用exec可能导致代码注入",
+    r"os\.system\(": "使用os.system可能存在命令注入风险",
+    r"subprocess\.": "使用subprocess需要注意命令注入",
+    r"input\(": "直接使用input可能存在安全风险",
+    r"\.format\(.*\)": "使用字符串format需要注意格式化字符串漏洞",
+    r"%[sd]": "使用%格式化需要注意格式化字符串漏洞"
+}
+
+DANGEROUS_CALLS = ['eval', 'exec']
+DANGEROUS_MODULES = ['pickle', 'marshal']
+
+# 预编译的模式。逐个 search 在首次命中时即停止，并且能按字面前缀快速跳过，
+# 比合并成一个正则扫描全文更快
+_COMPILED_PATTERNS = [(re.compile(pattern), message) for pattern, message in PATTERNS.items()]
+
+
+def _rules_fingerprint() -> str:
+    """检查规则的指纹，规则变化后旧的缓存自动失效"""
+    rules = repr((CACHE_VERSION, PATTERNS, DANGEROUS_CALLS, DANGEROUS_MODULES))
+    return hashlib.sha256(rules.encode("utf-8")).hexdigest()
+
+
+def scan_file(filepath: str) -> List[Dict[str, Any]]:
+    """
+    检查单个文件
+
+    Returns:
+        List[Dict[str, Any]]: 按报告顺序排列的问题，先是语法树检查，后是字符串模式
+    """
+    return scan_file_entry(filepath)[0]
+
+
+def scan_file_entry(filepath: str) -> Tuple[List[Dict[str, Any]], str, int, int]:
+    """
+    检查单个文件，同时返回所检查内容的哈希与文件状态（可在工作进程中执行）
+
+    文件只读取一次：哈希就是所检查字节的哈希，修改时间与大小取自同一个打开的文件，
+    写入缓存的记录与检查结果一定对应同一份内容。
+
+    Returns:
+        Tuple: (问题列表, 内容的 sha256, 修改时间 ns, 大小)
+    """
+    with open(filepath, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    # 与文本模式打开时相同的编码与换行处理
+    content = io.TextIOWrapper(io.BytesIO(data)).read()
+
+    # 检查AST
+    tree = ast.parse(content)
+    visitor = SecurityVisitor(filepath)
+    visitor.visit(tree)
+    issues = visitor.issues + check_patterns(content, filepath)
+    return issues, hashlib.sha256(data).hexdigest(), stat.st_mtime_ns, stat.st_size
+
+
+def check_patterns(content: str, filepath: str) -> List[Dict[str, Any]]:
+    """检查常见的安全问题模式，每个模式最多报告一次"""
+    return [{'file': filepath, 'type': 'pattern_match', 'message': message}
+            for pattern, message in _COMPILED_PATTERNS if pattern.search(content)]
+
+
+class AuditCache:
+    """按文件路径缓存的检查结果（JSON 文件）"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("rules") == _rules_fingerprint():
+            self.entries = data.get("files", {})
+
+    def lookup(self, filepath: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        查找未修改文件的检查结果
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 文件未修改时为上次的问题列表，否则为 None
+        """
+        self.seen.add(filepath)
+        entry = self.entries.get(filepath)
+        if entry is None:
+            self.misses += 1
+            return None
+        stat = os.stat(filepath)
+        if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.hits += 1
+            return entry["issues"]
+        # 修改时间变化但内容可能未变（例如切换分支后又切回），比较内容哈希
+        if entry["sha256"] == _file_hash(filepath):
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self.hits += 1
+            return entry["issues"]
+        self.misses += 1
+        return None
+
+    def store(self, filepath: str, issues: List[Dict[str, Any]], sha256: str,
+              mtime_ns: int, size: int):
+        """
+        记录文件的检查结果
+
+        Args:
+            filepath: 文件路径
+            issues: 检查结果
+            sha256 / mtime_ns / size: 所检查内容的哈希与读取时的文件状态，见 scan_file_entry
+        """
+        self.entries[filepath] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha256": sha256,
+            "issues": issues,
+        }
+
+    def save(self):
+        """写回缓存文件，只保留本次检查过的文件"""
+        files = {path: entry for path, entry in self.entries.items() if path in self.seen}
+        # 先写临时文件再替换，避免中断时留下不完整的缓存
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"rules": _rules_fingerprint(), "files": files}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def _file_hash(filepath: str) -> str:
+    with open(filepath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
 
 class SecurityAuditor:
-    def __init__(self):
+    def __init__(self, workers: int = 1, cache: Optional[AuditCache] = None):
+        """
+        Args:
+            workers: 检查文件的进程数，1 表示在当前进程中检查
+            cache: 检查结果缓存，默认不使用
+        """
         self.issues = []
+        self.workers = workers
+        self.cache = cache
         
     def check_file(self, filepath: str):
         """检查单个文件的安全问题"""
-        with open(filepath, 'r') as f:
-            content = f.read()
-            
-        # 检查源代码
-        tree = ast.parse(content)
-        
-        # 检查AST
-        visitor = SecurityVisitor(filepath)
-        visitor.visit(tree)
-        self.issues.extend(visitor.issues)
-        
-        # 检查字符串模式
-        self._check_patterns(content, filepath)
+        self.issues.extend(scan_file(filepath))
     
     def _check_patterns(self, content: str, filepath: str):
         """检查常见的安全问题模式"""
-        patterns = {
-            r"eval\(": "使用eval可能导致代码注入",
-            r"exec\(": "使用exec可能导致代码注入",
-            r"os\.system\(": "使用os.system可能存在命令注入风险",
-            r"subprocess\.": "使用subprocess需要注意命令注入",
-            r"input\(": "直接使用input可能存在安全风险",
-            r"\.format\(.*\)": "使用字符串format需要注意格式化字符串漏洞",
-            r"%[sd]": "使用%格式化需要注意格式化字符串漏洞"
-        }
-        
-        for pattern, message in patterns.items():
-            if re.search(pattern, content):
-                self.issues.append({
-                    'file': filepath,
-                    'type': 'pattern_match',
-                    'message': message
-                })
+        self.issues.extend(check_patterns(content, filepath))
     
     def audit_directory(self, directory: str):
         """审计整个目录"""
+        filepaths = []
         for root, _, files in os.walk(directory):
             for file in files:
                 if file.endswith('.py'):
-                    filepath = os.path.join(root, file)
-                    self.check_file(filepath)
+                    filepaths.append(os.path.join(root, file))
+
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(filepaths)
+        pending = []
+        for index, filepath in enumerate(filepaths):
+            if self.cache is not None:
+                results[index] = self.cache.lookup(filepath)
+            if results[index] is None:
+                pending.append(index)
+
+        paths = [filepaths[index] for index in pending]
+        if self.workers > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                chunksize = max(1, len(paths) // (self.workers * 4))
+                scanned = list(executor.map(scan_file_entry, paths, chunksize=chunksize))
+        else:
+            scanned = [scan_file_entry(filepath) for filepath in paths]
+
+        for index, (issues, sha256, mtime_ns, size) in zip(pending, scanned):
+            results[index] = issues
+            if self.cache is not None:
+                self.cache.store(filepaths[index], issues, sha256, mtime_ns, size)
+        if self.cache is not None:
+            self.cache.save()
+
+        # 按遍历顺序合并，报告与逐个检查时相同
+        for issues in results:
+            self.issues.extend(issues)
     
     def generate_report(self) -> str:
         """生成审计报告"""
@@ -78,7 +243,7 @@ class SecurityVisitor(ast.NodeVisitor):
     def visit_Call(self, node: ast.Call):
         """检查函数调用"""
         if isinstance(node.func, ast.Name):
-            if node.func.id in ['eval', 'exec']:
+            if node.func.id in DANGEROUS_CALLS:
                 self.issues.append({
                     'file': self.filepath,
                     'type': 'dangerous_call',
@@ -88,9 +253,8 @@ class SecurityVisitor(ast.NodeVisitor):
     
     def visit_Import(self, node: ast.Import):
         """检查导入"""
-        dangerous_modules = ['pickle', 'marshal']
         for name in node.names:
-            if name.name in dangerous_modules:
+            if name.name in DANGEROUS_MODULES:
                 self.issues.append({
                     'file': self.filepath,
                     'type': 'dangerous_import',
@@ -98,21 +262,70 @@ class SecurityVisitor(ast.NodeVisitor):
                 })
         self.generic_visit(node)
 
-def main():
+
+def audit(directory: str, workers: int = 1, cache_path: Optional[str] = None) -> str:
+    """审计目录并返回报告"""
+    cache = AuditCache(cache_path) if cache_path else None
+    auditor = SecurityAuditor(workers=workers, cache=cache)
+    auditor.audit_directory(directory)
+    return auditor.generate_report()
+
+
+def benchmark(directory: str, workers: int) -> List[str]:
+    """
+    比较冷启动（单进程、多进程）与缓存命中时的耗时，并确认各方式的报告相同
+
+    Returns:
+        List[str]: 便于阅读的结果行
+    """
+    def timed(**options):
+        start = time.perf_counter()
+        report = audit(directory, **options)
+        return report, time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "audit_cache.json")
+        runs = [("冷启动，单进程", timed())]
+        if workers > 1:
+            runs.append((f"冷启动，{workers} 个进程", timed(workers=workers)))
+        runs.append(("冷启动，写入缓存", timed(workers=workers, cache_path=cache_path)))
+        runs.append(("缓存命中", timed(workers=workers, cache_path=cache_path)))
+
+    reference = runs[0][1][0]
+    lines = [f"{name:<16}{elapsed * 1000:>10.1f} ms" for name, (_, elapsed) in runs]
+    same = all(report == reference for _, (report, _) in runs)
+    lines.append("各方式的报告" + ("相同" if same else "不同"))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None):
     """主函数"""
-    if len(sys.argv) != 2:
-        print("使用方法: python security_audit.py <目录路径>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(prog="python security_audit.py", description="安全审计")
+    parser.add_argument("directory", help="待审计的目录")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="检查文件的进程数（默认1）")
+    parser.add_argument("--cache", help="检查结果缓存文件，未修改的文件直接复用上次的结果")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="比较冷启动与缓存命中的耗时")
+    args = parser.parse_args(argv)
     
-    directory = sys.argv[1]
+    directory = args.directory
     if not os.path.exists(directory):
         print(f"错误: 目录不存在: {directory}")
         sys.exit(1)
+    if args.workers < 1:
+        parser.error("--workers 必须大于0")
     
-    auditor = SecurityAuditor()
+    if args.benchmark:
+        print("\n".join(benchmark(directory, args.workers)))
+        return
+    cache = AuditCache(args.cache) if args.cache else None
+    auditor = SecurityAuditor(workers=args.workers, cache=cache)
     auditor.audit_directory(directory)
-    report = auditor.generate_report()
-    print(report)
+    print(auditor.generate_report())
+    if cache is not None:
+        # 输出到标准错误，标准输出的报告与不使用缓存时相同
+        print(f"缓存: 复用 {cache.hits} 个文件，检查 {cache.misses} 个文件", file=sys.stderr)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+异步转换模块 - 在 asyncio 服务中批量转换而不阻塞事件循环
+
+一次转换几十万个金额会让事件循环停顿数百毫秒。aconvert_chunks 把输入切成小块，
+每块转换完成后让出控制权：
+
+    在事件循环中转换（默认）: 按上一块的实际耗时调整下一块的大小，
+        使每块的耗时不超过 budget（秒），事件循环的停顿与批量大小无关
+    交给 executor 转换: 固定大小的块提交到线程池或进程池，
+        事件循环只负责切块与收集结果，同时在途的块数不超过 max_pending
+
+取消正在等待的任务时，尚未开始执行的块随之取消。转换不经过共享的结果缓存，
+大批量输入不会把热点挤出缓存。
+
+用法:
+    results = await aconvert_many(amounts)
+    results = await aconvert_many(amounts, executor=process_pool)
+
+    async for results in aconvert_chunks(amounts, budget=0.002):
+        ...   # 每块的结果，顺序与输入一致
+"""
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import AsyncIterator, Iterable, List, Optional
+
+from .parser import Amount
+from .threaded import DEFAULT_CHUNK_SIZE, convert_uncached
+from .validation import ROUNDING_DOWN
+
+# 每块在事件循环中占用的默认时间上限（秒）
+DEFAULT_BUDGET = 0.005
+
+# 在事件循环中转换时第一块的大小，之后按实测耗时调整
+INITIAL_CHUNK_SIZE = 32
+
+# 交给 executor 时同时在途的默认块数
+DEFAULT_MAX_PENDING = 4
+
+
+def _convert_chunk(chunk: List[Amount], rounding: str) -> List[str]:
+    """转换一块输入（在 executor 中执行，须为模块级函数以便进程池序列化）"""
+    return [convert_uncached(number, rounding) for number in chunk]
+
+
+async def _convert_inline(iterator, budget: float, rounding: str) -> AsyncIterator[List[str]]:
+    """在事件循环中按时间预算分块转换"""
+    size = INITIAL_CHUNK_SIZE
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        start = time.perf_counter()
+        results = _convert_chunk(chunk, rounding)
+        elapsed = time.perf_counter() - start
+        yield results
+        await asyncio.sleep(0)
+        # 按本块的单项耗时估算下一块的大小，留两成余量，每次最多翻倍
+        if elapsed > 0:
+            size = max(1, min(size * 2, int(len(chunk) * budget * 0.8 / elapsed)))
+        else:
+            size *= 2
+
+
+async def _convert_offloaded(iterator, executor: Executor, chunk_size: int, max_pending: int,
+                             rounding: str) -> AsyncIterator[List[str]]:
+    """把固定大小的块交给 executor，按输入顺序产出结果"""
+    loop = asyncio.get_running_loop()
+    pending: deque = deque()
+    try:
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            pending.append(loop.run_in_executor(executor, _convert_chunk, chunk, rounding))
+            if len(pending) >= max_pending:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        # 被取消或提前结束时，撤销尚未开始执行的块
+        for future in pending:
+            future.cancel()
+
+
+def aconvert_chunks(numbers: Iterable[Amount], budget: float = DEFAULT_BUDGET,
+                    executor: Optional[Executor] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    max_pending: int = DEFAULT_MAX_PENDING,
+                    rounding: str = ROUNDING_DOWN) -> AsyncIterator[List[str]]:
+    """
+    分块异步转换，逐块产出结果
+
+    提前结束迭代时请关闭生成器（例如使用 contextlib.aclosing），以便及时撤销在途的块。
+
+    Args:
+        numbers: 金额序列，元素类型见 parser.split_value
+        budget: 在事件循环中转换时每块耗时的上限（秒）；传入 executor 时不使用
+        executor: 线程池或进程池，默认在事件循环中转换
+        chunk_size: 交给 executor 时每块的输入个数
+        max_pending: 交给 executor 时同时在途的块数
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        AsyncIterator[List[str]]: 按输入顺序产出每块的中文大写金额
+
+    Raises:
+        ConversionError: 含有不合法的输入（迭代到出错的块时抛出）
+        ValueError: budget、chunk_size 或 max_pending 不是正数
+    """
+    if budget <= 0:
+        raise ValueError(f"budget 必须为正数: {budget}")
+    if chunk_size < 1 or max_pending < 1:
+        raise ValueError(f"chunk_size 与 max_pending 必须为正数: {chunk_size}, {max_pending}")
+    iterator = iter(numbers)
+    if executor is None:
+        return _convert_inline(iterator, budget, rounding)
+    return _convert_offloaded(iterator, executor, chunk_size, max_pending, rounding)
+
+
+async def aconvert_many(numbers: Iterable[Amount], budget: float = DEFAULT_BUDGET,
+                        executor: Optional[Executor] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        max_pending: int = DEFAULT_MAX_PENDING,
+                        rounding: str = ROUNDING_DOWN) -> List[str]:
+    """
+    异步批量转换，转换期间事件循环的停顿不超过 budget
+
+    Args:
+        numbers / budget / executor / chunk_size / max_pending / rounding: 见 aconvert_chunks
+
+    Returns:
+        List[str]: 与输入顺序一致的中文大写金额
+
+    Raises:
+        ConversionError: 含有不合法的输入
+        ValueError: budget、chunk_size 或 max_pending 不是正数
+    """
+    results: List[str] = []
+    chunks = aconvert_chunks(numbers, budget, executor, chunk_size, max_pending, rounding)
+    try:
+        async for chunk in chunks:
+            results.extend(chunk)
+    finally:
+        await chunks.aclose()
+    return results
@@ -0,0 +1,228 @@
+"""
+批量转换模块 - 以"分"为单位的整数批量转换为中文大写金额
+
+安装 NumPy 时使用向量化的整数运算与查表；否则退化为纯 Python 循环，
+两条路径的输出完全一致。查询表在锁内构建一次，发布后只读，可在多个线程中共用。
+"""
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .converter import CHINESE_DIGITS, LARGE_UNITS
+from .group_table import get_group_texts
+from .validation import MAX_CENTS, validate_cents
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 取决于运行环境
+    np = None
+
+# 列表输入中不能走向量化路径的布尔类型
+_BOOL_TYPES = frozenset((bool, np.bool_) if np is not None else (bool,))
+
+# 查询表：(个组文本, 万组文本, 亿组文本, "元"+角分文本)
+Tables = Tuple[List[str], List[str], List[str], List[str]]
+
+# 查表数据，首次使用时构建，发布后只读
+_TABLES = None
+_NUMPY_TABLES = None
+_LOCK = threading.Lock()
+
+
+def make_tables(groups: Sequence[str], large_units: Sequence[str],
+                decimals: Sequence[str]) -> Tables:
+    """
+    由分组文本、大单位与角分文本组装查询表（供其他字形、币种复用）
+
+    Args:
+        groups: 0-9999 的分组文本，0 对应空字符串
+        large_units: 大单位，下标 1、2 分别为万、亿
+        decimals: 0-99 分对应的"元"+角分文本
+
+    Returns:
+        Tables: 组文本表的下标为0-9999，角分表的下标为0-99
+    """
+    groups = list(groups)
+    wan = [""] + [text + large_units[1] for text in groups[1:]]
+    yi = [""] + [text + large_units[2] for text in groups[1:]]
+    return groups, wan, yi, list(decimals)
+
+
+def _build_tables() -> Tables:
+    """
+    构建批量转换所需的查询表
+
+    Returns:
+        Tables: 组文本表的下标为0-9999，角分表的下标为0-99
+    """
+    global _TABLES
+    tables = _TABLES
+    if tables is None:
+        with _LOCK:
+            if _TABLES is None:
+                _TABLES = _make_default_tables()
+            tables = _TABLES
+    return tables
+
+
+def _make_default_tables() -> Tables:
+    """人民币简体的查询表"""
+    decimals = []
+    for cents in range(100):
+        jiao, fen = divmod(cents, 10)
+        if cents == 0:
+            decimals.append("元整")
+            continue
+        text = "元"
+        if jiao > 0:
+            text += CHINESE_DIGITS[jiao] + "角"
+        else:
+            text += CHINESE_DIGITS[0]
+        if fen > 0:
+            text += CHINESE_DIGITS[fen] + "分"
+        decimals.append(text)
+    return make_tables(get_group_texts(), LARGE_UNITS, decimals)
+
+
+def _convert_many_python(cents: Iterable[int], tables: Optional[Tables] = None,
+                         zero: str = CHINESE_DIGITS[0]) -> List[str]:
+    """纯 Python 实现的批量转换，tables / zero 默认为人民币简体"""
+    groups, wan, yi, decimals = tables or _build_tables()
+
+    results = []
+    append = results.append
+    for value in cents:
+        yuan, rest = divmod(validate_cents(value), 100)
+        if yuan == 0:
+            append(zero + decimals[rest])
+            continue
+
+        high, g0 = divmod(yuan, 10000)
+        g2, g1 = divmod(high, 10000)
+
+        text = yi[g2]
+        if g1:
+            if g2 and g1 < 1000:
+                text += zero
+            text += wan[g1]
+        if g0:
+            if (high and g0 < 1000) or (g2 and not g1):
+                text += zero
+            text += groups[g0]
+        append(text + decimals[rest])
+    return results
+
+
+def make_numpy_tables(tables: Tables, zero: str = CHINESE_DIGITS[0]) -> tuple:
+    """
+    由查询表生成 NumPy 对象数组
+
+    万组与个组各附带一份前面补"零"的版本（下标加 10000），
+    个组表末尾追加整数部分为零时的"零"
+    """
+    groups, wan, yi, decimals = tables
+    return (
+        np.array(yi, dtype=object),
+        np.array(wan + [zero + text for text in wan], dtype=object),
+        np.array(groups + [zero + text for text in groups] + [zero], dtype=object),
+        np.array(decimals, dtype=object),
+    )
+
+
+def _numpy_tables():
+    """NumPy 查询表，首次使用时构建"""
+    global _NUMPY_TABLES
+    numpy_tables = _NUMPY_TABLES
+    if numpy_tables is None:
+        tables = _build_tables()
+        with _LOCK:
+            if _NUMPY_TABLES is None:
+                _NUMPY_TABLES = make_numpy_tables(tables)
+            numpy_tables = _NUMPY_TABLES
+    return numpy_tables
+
+
+def _numpy_indices(values):
+    """
+    向量化计算每行在查询表中的下标
+
+    Returns:
+        Tuple: (亿组, 万组, 个组, 角分) 四个 int64 数组，万组与个组已按需加上
+        "补零"的偏移，与 _numpy_tables 的布局一致
+
+    Raises:
+        NegativeNumberError / OverflowError: 含有越界的分值
+    """
+    if values.size and values.min() < 0:
+        validate_cents(int(values[values < 0][0]))
+    if values.size and values.max() > MAX_CENTS:
+        validate_cents(int(values[values > MAX_CENTS][0]))
+    values = values.astype(np.int64, copy=False)
+
+    yuan, rest = np.divmod(values, 100)
+    high, g0 = np.divmod(yuan, 10000)
+    g2, g1 = np.divmod(high, 10000)
+
+    has_g2 = g2 > 0
+    zero_before_g1 = has_g2 & (g1 > 0) & (g1 < 1000)
+    zero_before_g0 = (g0 > 0) & (((high > 0) & (g0 < 1000)) | (has_g2 & (g1 == 0)))
+
+    g1 += zero_before_g1 * 10000
+    g0 += zero_before_g0 * 10000
+    g0[yuan == 0] = 20000
+    return g2, g1, g0, rest
+
+
+def _convert_many_numpy(values, numpy_tables: Optional[tuple] = None) -> List[str]:
+    """基于 NumPy 的向量化批量转换，numpy_tables 默认为人民币简体"""
+    if values.size == 0:
+        return []
+    yi, wan, groups, decimals = numpy_tables or _numpy_tables()
+    g2, g1, g0, rest = _numpy_indices(values)
+    return (yi[g2] + wan[g1] + groups[g0] + decimals[rest]).tolist()
+
+
+def _as_int_array(cents):
+    """
+    尽量把输入转为一维整数数组
+
+    Returns:
+        一维整数 NumPy 数组；未安装 NumPy，或输入含浮点数、布尔值、超大整数等时返回 None
+    """
+    if np is None:
+        return None
+    if isinstance(cents, np.ndarray):
+        values = cents
+    else:
+        try:
+            values = np.array(cents)
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+        # np.array 会把混有 True/False 的整数列表转为整数数组，而逐个检查时布尔值是格式错误
+        if values.dtype.kind in "iu" and not _BOOL_TYPES.isdisjoint(map(type, cents)):
+            return None
+    if values.ndim == 1 and values.dtype.kind in "iu":
+        return values
+    return None
+
+
+def convert_many(cents: Sequence[int]) -> List[str]:
+    """
+    批量将以"分"为单位的整数转换为中文大写金额
+
+    Args:
+        cents: 分值序列，可以是 int64 的 NumPy 数组或任意整数序列
+               例如 12345 表示 123.45 元
+
+    Returns:
+        List[str]: 与输入顺序一致的中文大写金额列表
+
+    Raises:
+        InvalidFormatError: 含有非整数元素
+        NegativeNumberError: 含有负数
+        OverflowError: 超出 999999999999.99 元
+    """
+    # 只有一维整数数组走向量化路径，浮点数、超大整数等交给逐个检查报错
+    values = _as_int_array(cents)
+    if values is not None:
+        return _convert_many_numpy(values)
+    return _convert_many_python(cents)
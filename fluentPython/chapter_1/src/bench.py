@@ -0,0 +1,540 @@
+"""
+基准测试模块 - 按负载类型测量各转换入口的延迟、吞吐、内存与导入耗时
+
+用法:
+    python -m src.bench                                  # 运行全部负载
+    python -m src.bench --profiles retail,repeated --targets convert_optimized
+    python -m src.bench --output bench.json              # 输出JSON结果
+    python -m src.bench --baseline bench.json            # 与基线对比，超出阈值时退出码为1
+    python -m src.bench --threads 8 --profiles retail     # 1-8 个线程的吞吐扩展
+
+每个样本连续执行 --sample-size 次转换并取平均，避免计时本身的开销主导结果；
+延迟分位数基于这些样本计算。
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .batch import convert_many
+from .converter import convert
+from .extended import convert_extended
+from .optimized_converter import convert_optimized
+from .parser import split_number
+from .threaded import convert_many_threaded
+from .validation import ConversionError
+
+# 结果文件格式版本
+RESULT_VERSION = 1
+
+# 默认回归阈值：比基线慢10%以上视为回归
+DEFAULT_THRESHOLD = 0.10
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _format_amount(integer: int, cents: int) -> str:
+    return f"{integer}.{cents:02d}"
+
+
+def _profile_retail(rng: random.Random, count: int) -> List[str]:
+    """零售小额：0.01-9999.99，以百元以内为主"""
+    amounts = []
+    for _ in range(count):
+        integer = int(rng.paretovariate(1.2)) - 1 if rng.random() < 0.9 else rng.randint(0, 9999)
+        amounts.append(_format_amount(min(integer, 9999), rng.randint(0, 99)))
+    return amounts
+
+
+def _profile_max_range(rng: random.Random, count: int) -> List[str]:
+    """满量程：千亿级的大额"""
+    return [
+        _format_amount(rng.randint(10 ** 11, 999999999999), rng.randint(0, 99))
+        for _ in range(count)
+    ]
+
+
+def _profile_zero_heavy(rng: random.Random, count: int) -> List[str]:
+    """多零：各位数字有80%的概率为零，覆盖补零规则"""
+    amounts = []
+    for _ in range(count):
+        digits = "".join("0" if rng.random() < 0.8 else str(rng.randint(1, 9)) for _ in range(12))
+        cents = rng.choice((0, 0, 5, 50))
+        amounts.append(_format_amount(int(digits), cents))
+    return amounts
+
+
+def _profile_repeated(rng: random.Random, count: int) -> List[str]:
+    """重复账目：少量金额反复出现（幂律分布）"""
+    distinct = _profile_retail(rng, 200) + _profile_max_range(rng, 50)
+    weights = [1 / (rank + 1) for rank in range(len(distinct))]
+    return rng.choices(distinct, weights=weights, k=count)
+
+
+def _profile_extended_range(rng: random.Random, count: int) -> List[str]:
+    """扩展量程：13-30位的超大额，只有扩展模式能转换"""
+    return [
+        _format_amount(rng.randint(10 ** (digits - 1), 10 ** digits - 1), rng.randint(0, 99))
+        for digits in (rng.randint(13, 30) for _ in range(count))
+    ]
+
+
+def _profile_invalid(rng: random.Random, count: int) -> List[str]:
+    """非法输入：负数、非法字符、超出范围"""
+    samples = [
+        "-1.23", "abc", "1,234.56", "12。34", "", ".5", "1e5",
+        "1000000000000", "99999999999999.99", "¥100",
+    ]
+    return [rng.choice(samples) for _ in range(count)]
+
+
+PROFILES: Dict[str, Callable[[random.Random, int], List[str]]] = {
+    "retail": _profile_retail,
+    "max_range": _profile_max_range,
+    "zero_heavy": _profile_zero_heavy,
+    "repeated": _profile_repeated,
+    "extended_range": _profile_extended_range,
+    "invalid": _profile_invalid,
+}
+
+
+def _per_call(func: Callable[[str], str]) -> Callable[[list], int]:
+    """将单次转换函数包装为处理一个样本的函数，返回出错的个数"""
+    def run(sample: list) -> int:
+        errors = 0
+        for number in sample:
+            try:
+                func(number)
+            except ConversionError:
+                errors += 1
+        return errors
+    return run
+
+
+def _run_batch(sample: list) -> int:
+    convert_many(sample)
+    return 0
+
+
+def _to_cents(amounts: List[str]) -> Optional[List[int]]:
+    """将金额字符串转换为分值，含非法输入时返回 None（该负载不适用）"""
+    try:
+        return [integer * 100 + decimal for integer, decimal in map(split_number, amounts)]
+    except ConversionError:
+        return None
+
+
+# 转换入口：(输入预处理, 样本执行函数)
+TARGETS: Dict[str, Tuple[Callable[[List[str]], Optional[list]], Callable[[list], int]]] = {
+    "convert": (list, _per_call(convert)),
+    "convert_optimized": (list, _per_call(convert_optimized)),
+    "convert_many": (_to_cents, _run_batch),
+    "convert_extended": (list, _per_call(convert_extended)),
+}
+
+# 只适用于部分转换入口的负载：标准转换器会拒绝扩展量程的全部输入，只能测到错误路径
+PROFILE_TARGETS: Dict[str, Tuple[str, ...]] = {
+    "extended_range": ("convert_extended",),
+}
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """线性插值的分位数"""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def measure(run: Callable[[list], int], inputs: list, repeat: int = 5,
+            warmup: int = 1, sample_size: int = 100, memory: bool = True) -> Dict[str, float]:
+    """
+    测量一个转换入口在一组输入上的表现
+
+    Args:
+        run: 处理一个样本的函数
+        inputs: 输入数据
+        repeat: 计时轮数
+        warmup: 预热轮数（不计时）
+        sample_size: 每个样本包含的输入个数
+        memory: 是否用 tracemalloc 测量峰值内存（单独一轮，不影响计时）
+
+    Returns:
+        Dict[str, float]: 每次转换的延迟分位数（纳秒）、吞吐、峰值内存等
+    """
+    samples = [inputs[i:i + sample_size] for i in range(0, len(inputs), sample_size)]
+
+    for _ in range(warmup):
+        for sample in samples:
+            run(sample)
+
+    per_call_ns = []
+    errors = 0
+    total_ns = 0
+    for _ in range(repeat):
+        for sample in samples:
+            start = time.perf_counter_ns()
+            errors += run(sample)
+            elapsed = time.perf_counter_ns() - start
+            total_ns += elapsed
+            per_call_ns.append(elapsed / len(sample))
+
+    per_call_ns.sort()
+    calls = len(inputs) * repeat
+    result = {
+        "calls": calls,
+        "errors": errors // repeat,
+        "mean_ns": total_ns / calls,
+        "p50_ns": _percentile(per_call_ns, 0.50),
+        "p95_ns": _percentile(per_call_ns, 0.95),
+        "p99_ns": _percentile(per_call_ns, 0.99),
+        "max_ns": per_call_ns[-1],
+        "ops_per_sec": calls / (total_ns / 1e9) if total_ns else float("inf"),
+    }
+
+    if memory:
+        tracemalloc.start()
+        try:
+            for sample in samples:
+                run(sample)
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def import_times(module: str = "src.optimized_converter") -> Dict[str, Tuple[int, int]]:
+    """
+    在新解释器中以 -X importtime 导入模块，解析各模块的导入耗时
+
+    Returns:
+        Dict[str, Tuple[int, int]]: 模块名 -> (自身耗时, 累计耗时)，单位为微秒；
+        不含解释器启动本身的开销
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, check=True
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def measure_import_time(module: str = "src.optimized_converter", repeat: int = 5) -> float:
+    """
+    测量在新解释器中导入模块的累计耗时（秒，取中位数，来自 -X importtime）
+
+    Args:
+        module: 模块名
+        repeat: 重复次数
+    """
+    timings = [import_times(module)[module][1] / 1e6 for _ in range(repeat)]
+    return statistics.median(timings)
+
+
+def batch_speedups(results: Dict[str, dict]) -> Dict[str, float]:
+    """各负载中批量转换（convert_many）相对逐个转换（convert_optimized）的吞吐倍数"""
+    speedups = {}
+    for key, result in results.items():
+        profile, target = key.split("/")
+        per_item = results.get(f"{profile}/convert_optimized")
+        if target == "convert_many" and per_item:
+            speedups[profile] = result["ops_per_sec"] / per_item["ops_per_sec"]
+    return speedups
+
+
+def run_benchmarks(profiles: Optional[List[str]] = None, targets: Optional[List[str]] = None,
+                   size: int = 20000, repeat: int = 5, warmup: int = 1, sample_size: int = 100,
+                   seed: int = 0, memory: bool = True, import_time: bool = True) -> dict:
+    """
+    运行基准测试
+
+    Args:
+        profiles: 负载名称列表，默认全部
+        targets: 转换入口名称列表，默认全部；PROFILE_TARGETS 中的负载只运行其列出的入口
+        size: 每种负载的输入个数
+        repeat / warmup / sample_size / memory: 见 measure
+        seed: 生成负载的随机种子
+        import_time: 是否测量导入耗时
+
+    Returns:
+        dict: 可直接序列化为JSON的结果
+    """
+    results = {}
+    for profile in profiles or list(PROFILES):
+        amounts = PROFILES[profile](random.Random(f"{seed}:{profile}"), size)
+        for target in targets or list(TARGETS):
+            if target not in PROFILE_TARGETS.get(profile, TARGETS):
+                continue
+            prepare, run = TARGETS[target]
+            inputs = prepare(amounts)
+            if inputs is None:
+                continue
+            results[f"{profile}/{target}"] = measure(
+                run, inputs, repeat=repeat, warmup=warmup,
+                sample_size=sample_size, memory=memory
+            )
+
+    report = {
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "size": size, "repeat": repeat, "warmup": warmup,
+            "sample_size": sample_size, "seed": seed,
+        },
+        "results": results,
+    }
+    speedups = batch_speedups(results)
+    if speedups:
+        report["batch_speedup"] = speedups
+    if import_time:
+        report["import_time_sec"] = measure_import_time()
+    return report
+
+
+def thread_counts(max_threads: int) -> List[int]:
+    """1 到 max_threads 之间按 2 的幂取的线程数，包含 max_threads"""
+    counts = []
+    threads = 1
+    while threads < max_threads:
+        counts.append(threads)
+        threads *= 2
+    counts.append(max(max_threads, 1))
+    return counts
+
+
+def measure_scaling(amounts: List[str], max_threads: int, repeat: int = 3,
+                    chunk_size: Optional[int] = None) -> List[Dict[str, float]]:
+    """
+    测量 threaded.convert_many_threaded 在不同线程数下的吞吐
+
+    每个线程数使用复用的线程池，先预热一轮，再取 repeat 轮中最快的一次。
+
+    Args:
+        amounts: 输入数据（应全部合法）
+        max_threads: 最大线程数
+        repeat: 计时轮数
+        chunk_size: 每个任务的输入个数，默认按线程数均分为每线程4块
+
+    Returns:
+        List[Dict[str, float]]: 每个线程数的 threads、ops_per_sec 与相对单线程的 speedup
+    """
+    results = []
+    for threads in thread_counts(max_threads):
+        size = chunk_size or max(1, len(amounts) // (threads * 4))
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            convert_many_threaded(amounts, chunk_size=size, executor=executor)
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                convert_many_threaded(amounts, chunk_size=size, executor=executor)
+                best = min(best, time.perf_counter() - start)
+        results.append({"threads": threads, "ops_per_sec": len(amounts) / best})
+    for result in results:
+        result["speedup"] = result["ops_per_sec"] / results[0]["ops_per_sec"]
+    return results
+
+
+def _gil_enabled() -> bool:
+    """当前解释器是否启用了 GIL（3.13 之前总是启用）"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run_scaling(profiles: Optional[List[str]] = None, max_threads: int = 0, size: int = 20000,
+                repeat: int = 3, seed: int = 0) -> dict:
+    """
+    运行线程扩展测试
+
+    Args:
+        profiles: 负载名称列表，默认为 retail；非法输入与扩展量程负载会被跳过
+        max_threads: 最大线程数，默认为 CPU 核数
+        size / repeat / seed: 见 run_benchmarks
+
+    Returns:
+        dict: 可直接序列化为JSON的结果
+    """
+    max_threads = max_threads or os.cpu_count() or 1
+    scaling = {}
+    for profile in profiles or ["retail"]:
+        if profile in ("invalid", "extended_range"):
+            continue
+        amounts = PROFILES[profile](random.Random(f"{seed}:{profile}"), size)
+        scaling[profile] = measure_scaling(amounts, max_threads, repeat=repeat)
+    return {
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "gil_enabled": _gil_enabled(),
+        "cpu_count": os.cpu_count(),
+        "config": {"size": size, "repeat": repeat, "seed": seed, "max_threads": max_threads},
+        "scaling": scaling,
+    }
+
+
+def format_scaling(report: dict) -> str:
+    """生成线程扩展测试的结果表格"""
+    gil = "启用" if report["gil_enabled"] else "关闭"
+    lines = [
+        f"Python {report['python']}，GIL {gil}，CPU 核数 {report['cpu_count']}",
+        f"{'负载':<16}{'线程数':>8}{'吞吐(次/秒)':>16}{'加速比':>10}",
+        "-" * 52,
+    ]
+    for profile, results in report["scaling"].items():
+        for result in results:
+            lines.append(f"{profile:<16}{result['threads']:>8}{result['ops_per_sec']:>16.0f}"
+                         f"{result['speedup']:>10.2f}")
+    return "\n".join(lines)
+
+
+# 与基线对比的指标：越大越差
+_COMPARED_METRICS = ("p50_ns", "p95_ns", "p99_ns")
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    与基线结果对比
+
+    Args:
+        current: 本次结果
+        baseline: 基线结果
+        threshold: 允许的相对变慢比例
+
+    Returns:
+        List[str]: 回归项的描述，为空表示没有回归
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if not base:
+            continue
+        for metric in _COMPARED_METRICS:
+            if base.get(metric) and result[metric] > base[metric] * (1 + threshold):
+                ratio = result[metric] / base[metric]
+                regressions.append(
+                    f"{key} {metric}: {base[metric]:.0f} -> {result[metric]:.0f} ({ratio:.2f}x)"
+                )
+
+    # 批量转换的提升倍数越小越差
+    for profile, base_speedup in baseline.get("batch_speedup", {}).items():
+        speedup = current.get("batch_speedup", {}).get(profile)
+        if speedup and speedup * (1 + threshold) < base_speedup:
+            regressions.append(f"{profile} batch_speedup: {base_speedup:.2f}x -> {speedup:.2f}x")
+
+    base_import = baseline.get("import_time_sec")
+    if base_import and "import_time_sec" in current:
+        if current["import_time_sec"] > base_import * (1 + threshold):
+            regressions.append(
+                f"import_time_sec: {base_import:.4f} -> {current['import_time_sec']:.4f}"
+            )
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    """生成可读的结果表格"""
+    lines = [
+        f"{'负载/入口':<32}{'p50(us)':>10}{'p95(us)':>10}{'p99(us)':>10}"
+        f"{'吞吐(次/秒)':>14}{'峰值内存(KB)':>14}",
+        "-" * 90,
+    ]
+    for key, result in report["results"].items():
+        memory = result.get("peak_memory_bytes")
+        lines.append(
+            f"{key:<32}{result['p50_ns'] / 1000:>10.2f}{result['p95_ns'] / 1000:>10.2f}"
+            f"{result['p99_ns'] / 1000:>10.2f}{result['ops_per_sec']:>14.0f}"
+            f"{(memory / 1024 if memory is not None else float('nan')):>14.1f}"
+        )
+    for profile, speedup in report.get("batch_speedup", {}).items():
+        lines.append(f"\n{profile}: 批量转换相对逐个转换提升 {speedup:.1f}x")
+    if "import_time_sec" in report:
+        lines.append(f"\n导入 src.optimized_converter 耗时: {report['import_time_sec'] * 1000:.2f}ms")
+    return "\n".join(lines)
+
+
+def _split_names(value: Optional[str], known: Dict) -> Optional[List[str]]:
+    if not value:
+        return None
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"未知名称: {', '.join(unknown)}")
+    return names
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(prog="python -m src.bench", description="转换性能基准测试")
+    parser.add_argument("--profiles", help=f"负载，逗号分隔（{','.join(PROFILES)}）")
+    parser.add_argument("--targets", help=f"转换入口，逗号分隔（{','.join(TARGETS)}）")
+    parser.add_argument("--size", type=int, default=20000, help="每种负载的输入个数")
+    parser.add_argument("--repeat", type=int, default=5, help="计时轮数")
+    parser.add_argument("--warmup", type=int, default=1, help="预热轮数")
+    parser.add_argument("--sample-size", type=int, default=100, help="每个计时样本的输入个数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--no-memory", action="store_true", help="不测量峰值内存")
+    parser.add_argument("--no-import-time", action="store_true", help="不测量导入耗时")
+    parser.add_argument("-o", "--output", help="将结果写入JSON文件")
+    parser.add_argument("--baseline", help="与基线JSON文件对比")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"回归阈值（默认{DEFAULT_THRESHOLD}，即慢10%%）")
+    parser.add_argument("--threads", type=int, metavar="N",
+                        help="改为测量 1-N 个线程的吞吐扩展（0 表示 CPU 核数）")
+    args = parser.parse_args(argv)
+
+    try:
+        profiles = _split_names(args.profiles, PROFILES)
+        targets = _split_names(args.targets, TARGETS)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    if args.threads is not None:
+        report = run_scaling(profiles=profiles, max_threads=args.threads, size=args.size,
+                             repeat=args.repeat, seed=args.seed)
+        print(format_scaling(report))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        return
+
+    report = run_benchmarks(
+        profiles=profiles, targets=targets, size=args.size, repeat=args.repeat,
+        warmup=args.warmup, sample_size=args.sample_size, seed=args.seed,
+        memory=not args.no_memory, import_time=not args.no_import_time
+    )
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print("\n性能回归:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\n与基线相比无性能回归")
+
+
+if __name__ == "__main__":
+    main()
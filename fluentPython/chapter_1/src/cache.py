@@ -0,0 +1,247 @@
+"""
+缓存模块 - 可配置、可观测的转换结果缓存
+
+缓存粒度（key_level）:
+    input:   以输入字符串为键，缓存完整的转换结果
+    integer: 以整数部分为键，缓存整数部分的大写文本（默认）
+    group:   以（分组位置, 分组数值）为键，缓存带大单位的分组文本，
+             键空间最多 30000 个，适合金额随机分布、整数缓存命中率低的场景
+
+淘汰策略（policy）:
+    lru:  淘汰最久未使用的条目
+    fifo: 淘汰最早写入的条目，命中时不调整顺序
+
+准入（doorkeeper）:
+    开启时键第二次未命中才写入缓存。金额随机分布时绝大多数键只出现一次，
+    直接写入只会不断淘汰真正的热点，还要付出写入和淘汰的开销。
+
+线程安全:
+    写入与淘汰在缓存自身的锁内完成，计算缺失的值在锁外进行，并发未命中同一个键时
+    可能各自计算一次，结果相同。命中路径不加锁：单个字典操作本身是原子的，
+    LRU 调整顺序时该键恰好被其他线程淘汰则忽略；因此并发时命中计数只是近似值。
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+KEY_INPUT = "input"
+KEY_INTEGER = "integer"
+KEY_GROUP = "group"
+KEY_LEVELS = (KEY_INPUT, KEY_INTEGER, KEY_GROUP)
+
+POLICY_LRU = "lru"
+POLICY_FIFO = "fifo"
+POLICIES = (POLICY_LRU, POLICY_FIFO)
+
+# 热点文件格式版本
+HOT_SET_VERSION = 1
+
+# 未命中标记
+_MISSING = object()
+
+
+class ConversionCache:
+    """带命中、未命中、淘汰计数的缓存"""
+
+    def __init__(self, maxsize: int = 10000, key_level: str = KEY_INTEGER,
+                 policy: str = POLICY_LRU, doorkeeper: bool = True):
+        """
+        Args:
+            maxsize: 最大条目数，0 表示不缓存
+            key_level: 缓存粒度，见 KEY_LEVELS
+            policy: 淘汰策略，见 POLICIES
+            doorkeeper: 是否只缓存第二次未命中的键
+
+        Raises:
+            ValueError: 参数不合法
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize 不能为负数: {maxsize}")
+        if key_level not in KEY_LEVELS:
+            raise ValueError(f"未知的缓存粒度: {key_level}")
+        if policy not in POLICIES:
+            raise ValueError(f"未知的淘汰策略: {policy}")
+
+        self.maxsize = maxsize
+        self.key_level = key_level
+        self.policy = policy
+        self.doorkeeper = doorkeeper
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._touch = policy == POLICY_LRU
+        # 见过一次但尚未写入缓存的键
+        self._seen: set = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        查询缓存
+
+        Returns:
+            缓存的值，未命中时返回 None
+        """
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return None
+        self._hit(key)
+        return value
+
+    def _hit(self, key: Hashable):
+        self.hits += 1
+        if self._touch:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                # 其他线程刚刚淘汰了该键
+                pass
+
+    def put(self, key: Hashable, value: Any):
+        """写入缓存，超出容量时按策略淘汰"""
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: Hashable, value: Any):
+        """写入并淘汰（调用方持有锁）"""
+        data = self._data
+        data[key] = value
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[Hashable], Any]) -> Any:
+        """查询缓存，未命中时在锁外计算并写入"""
+        data = self._data
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            # 与 _hit 相同，内联以减少命中时的调用开销
+            self.hits += 1
+            if self._touch:
+                try:
+                    data.move_to_end(key)
+                except KeyError:
+                    pass
+            return value
+        value = compute(key)
+        with self._lock:
+            self.misses += 1
+            if self.doorkeeper:
+                seen = self._seen
+                if key not in seen:
+                    if len(seen) >= self.maxsize:
+                        seen.clear()
+                    seen.add(key)
+                    return value
+                seen.discard(key)
+            if self.maxsize:
+                self._store(key, value)
+        return value
+
+    def clear(self):
+        """清空缓存与计数"""
+        with self._lock:
+            self._data.clear()
+            self._seen.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def reset_stats(self):
+        """只清空计数"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计
+
+        Returns:
+            Dict[str, Any]: 命中、未命中、淘汰次数，命中率与当前配置
+        """
+        with self._lock:
+            hits, misses, evictions, size = self.hits, self.misses, self.evictions, len(self._data)
+        lookups = hits + misses
+        return {
+            "key_level": self.key_level,
+            "policy": self.policy,
+            "doorkeeper": self.doorkeeper,
+            "maxsize": self.maxsize,
+            "size": size,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def hot_keys(self, limit: Optional[int] = None) -> list:
+        """按最近使用（fifo 为最近写入）从新到旧返回键"""
+        with self._lock:
+            keys = list(reversed(self._data))
+        return keys if limit is None else keys[:limit]
+
+    def save(self, path: str, limit: Optional[int] = None):
+        """
+        将热点键保存到文件，值在加载时重新计算
+
+        Args:
+            path: 输出路径
+            limit: 最多保存的键数，默认全部
+        """
+        keys = [list(key) if isinstance(key, tuple) else key for key in self.hot_keys(limit)]
+        data = {"version": HOT_SET_VERSION, "key_level": self.key_level, "keys": keys}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str, compute: Callable[[Hashable], Any]) -> int:
+        """
+        从热点文件预热缓存
+
+        Args:
+            path: 热点文件路径
+            compute: 由键计算值的函数
+
+        Returns:
+            int: 写入的条目数
+
+        Raises:
+            ValueError: 文件版本或缓存粒度不匹配
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != HOT_SET_VERSION:
+            raise ValueError(f"热点文件版本不匹配: {path}")
+        if data.get("key_level") != self.key_level:
+            raise ValueError(
+                f"热点文件的缓存粒度为 {data.get('key_level')}，当前为 {self.key_level}"
+            )
+        keys = [tuple(key) if isinstance(key, list) else key for key in data["keys"]]
+        return self.seed(keys, compute)
+
+    def seed(self, keys: Iterable[Hashable], compute: Callable[[Hashable], Any]) -> int:
+        """
+        按给定的键预热缓存，不计入命中统计
+
+        Args:
+            keys: 从新到旧排列的键
+            compute: 由键计算值的函数
+
+        Returns:
+            int: 写入的条目数
+        """
+        keys = list(keys)[:self.maxsize]
+        # 从旧到新写入，使最热的键排在最后、最晚被淘汰
+        for key in reversed(keys):
+            self.put(key, compute(key))
+        return len(keys)
@@ -1,26 +1,271 @@
 """
 命令行接口模块
+
+用法:
+    python -m src.cli 123.45                 # 转换单个数字
+    python -m src.cli 1.23 4.56              # 依次转换多个数字
+    python -m src.cli -f amounts.txt         # 逐行转换文件，"-" 表示标准输入
+    cat amounts.txt | python -m src.cli --workers 4
+    cat amounts.txt | python -m src.cli --workers 4 --shared-table   # 工作进程共享一份分组表
+    python -m src.cli --daemon --prefork 4   # 启动常驻的守护进程
+    python -m src.cli --client 123.45        # 交给守护进程转换，不可用时在本进程转换
+    python -m src.cli -f amounts.txt --stats # 结束后输出各阶段耗时、错误与缓存统计
+    python -m src.cli -f amounts.txt --profile run.pstats
+
+更轻量的客户端见 src.client。
 """
+import argparse
 import sys
-from .converter import convert
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from . import stats
+from .client import ERROR_PREFIXES, DaemonClient, socket_path, stream_lines
+from .optimized_converter import convert_optimized
+from .group_table import shared_group_table, use_shared_group_table
 from .validation import ConversionError
 
-def main():
+# 每个任务包含的行数
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def convert_line(line: str) -> str:
+    """
+    转换一行输入，错误以文本形式返回而不是抛出异常
+
+    Args:
+        line: 输入行（两端空白会被忽略）
+
+    Returns:
+        str: 转换结果，或以"错误: "开头的错误信息；空行返回空字符串
+    """
+    number = line.strip()
+    if not number:
+        return ""
+    try:
+        return convert_optimized(number)
+    except ConversionError as e:
+        return f"错误: {e.message}"
+    except Exception as e:
+        return f"未知错误: {str(e)}"
+
+
+def convert_lines(lines: List[str]) -> List[str]:
+    """转换一批输入行（进程池的任务单元）"""
+    return [convert_line(line) for line in lines]
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    """将输入行按固定大小分块"""
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_convert(lines: Iterable[str], workers: int = 1,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, shared_table: bool = False) -> Iterator[str]:
+    """
+    流式转换输入行，按输入顺序产出结果
+
+    Args:
+        lines: 输入行
+        workers: 工作进程数，1 表示在当前进程中转换
+        chunk_size: 每个任务包含的行数
+        shared_table: 多进程时在父进程中生成一次分组表放入共享内存，工作进程直接附加
+
+    Yields:
+        str: 与输入行一一对应的转换结果
+    """
+    if workers <= 1:
+        for line in lines:
+            yield convert_line(line)
+        return
+
+    table = shared_group_table() if shared_table else nullcontext()
+    with table as table_name, ProcessPoolExecutor(
+            max_workers=workers, initializer=use_shared_group_table if table_name else None,
+            initargs=(table_name,) if table_name else ()) as executor:
+        # 限制同时在途的任务数，保证内存占用与输入规模无关
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(executor.submit(convert_lines, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _read_inputs(files: List[str]) -> Iterator[str]:
+    """依次读取各输入文件的行，"-" 表示标准输入"""
+    for path in files:
+        if path == "-":
+            yield from sys.stdin
+            continue
+        with open(path, encoding="utf-8") as f:
+            yield from f
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="人民币数字金额转大写",
+    )
+    parser.add_argument("numbers", nargs="*", help="待转换的数字")
+    parser.add_argument("-f", "--file", action="append", dest="files", default=[],
+                        help="逐行读取待转换数字的文件，\"-\" 表示标准输入，可多次指定")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="并行转换的进程数（默认1）")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"每个并行任务的行数（默认{DEFAULT_CHUNK_SIZE}）")
+    parser.add_argument("--shared-table", action="store_true",
+                        help="并行转换时在共享内存中生成一次分组表，各工作进程直接附加")
+    parser.add_argument("--daemon", action="store_true",
+                        help="以守护进程方式在 Unix socket 上提供转换服务")
+    parser.add_argument("--prefork", type=int, default=0,
+                        help="守护进程预派生的工作进程数（默认0，即单进程）")
+    parser.add_argument("--client", action="store_true",
+                        help="交给守护进程转换，守护进程不可用时在本进程转换")
+    parser.add_argument("--socket", help=f"守护进程的 socket 路径（默认{socket_path()}）")
+    parser.add_argument("--stats", action="store_true",
+                        help="结束后向标准错误输出各阶段耗时、错误与缓存统计（只统计当前进程）")
+    parser.add_argument("--profile", nargs="?", const="-", metavar="PATH",
+                        help="用 cProfile 分析本次运行，指定 PATH 时保存 pstats 文件，"
+                             "否则向标准错误输出累计耗时最多的函数")
+    return parser
+
+
+def _write_results(results: Iterable[str], out: TextIO) -> bool:
+    """输出结果，返回是否出现错误"""
+    failed = False
+    for result in results:
+        if result.startswith(ERROR_PREFIXES):
+            failed = True
+        out.write(result + "\n")
+    out.flush()
+    return failed
+
+
+def _run_daemon(path: str, prefork: int):
+    """运行守护进程；单次请求不需要凑批，因此不等待"""
+    # 只有守护进程需要 asyncio，延迟导入以免拖慢普通调用的启动
+    import asyncio
+    from .server import serve, serve_prefork
+
+    if prefork > 0:
+        serve_prefork(path, prefork, max_delay=0)
+        return
+    try:
+        asyncio.run(serve(path=path, max_delay=0))
+    except KeyboardInterrupt:
+        pass
+
+
+def _connect(path: str) -> Optional[DaemonClient]:
+    """连接守护进程，不可用时返回 None"""
+    try:
+        return DaemonClient(path)
+    except OSError:
+        return None
+
+
+def _profile(run, path: str):
+    """在 cProfile 下运行，结束后保存或输出结果"""
+    # 只有分析时才需要，延迟导入
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run)
+    finally:
+        if path == "-":
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+        else:
+            profiler.dump_stats(path)
+
+
+def main(argv: Optional[List[str]] = None):
     """主函数"""
-    if len(sys.argv) != 2:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.stats:
+        stats.enable()
+    try:
+        if args.profile:
+            _profile(lambda: _run(parser, args), args.profile)
+        else:
+            _run(parser, args)
+    finally:
+        if args.stats:
+            sys.stdout.flush()
+            for line in stats.format_stats(stats.get_stats()):
+                print(line, file=sys.stderr)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """按解析后的参数执行"""
+    if args.workers < 1:
+        parser.error("--workers 必须大于0")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size 必须大于0")
+    if args.prefork < 0:
+        parser.error("--prefork 不能为负数")
+
+    path = args.socket or socket_path()
+    if args.daemon:
+        _run_daemon(path, args.prefork)
+        return
+    client = _connect(path) if args.client else None
+
+    # 单个数字：保持原有行为，出错时立即退出
+    if len(args.numbers) == 1 and not args.files:
+        try:
+            if client is not None:
+                with client:
+                    results = list(stream_lines(client, args.numbers, convert_line))
+                print(results[0])
+                if results[0].startswith(ERROR_PREFIXES):
+                    sys.exit(1)
+                return
+            result = convert_optimized(args.numbers[0])
+            print(result)
+        except ConversionError as e:
+            print(f"错误: {e.message}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"未知错误: {str(e)}")
+            sys.exit(1)
+        return
+
+    if args.numbers:
+        lines = args.numbers
+    elif args.files:
+        lines = _read_inputs(args.files)
+    elif not sys.stdin.isatty():
+        lines = sys.stdin
+    else:
         print("使用方法: python -m src.cli <数字>")
         print("示例: python -m src.cli 123.45")
+        print("批量转换: python -m src.cli -f <文件> [--workers N]")
         sys.exit(1)
-    
-    try:
-        result = convert(sys.argv[1])
-        print(result)
-    except ConversionError as e:
-        print(f"错误: {e.message}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"未知错误: {str(e)}")
+
+    if client is not None:
+        with client:
+            failed = _write_results(stream_lines(client, lines, convert_line), sys.stdout)
+    else:
+        results = stream_convert(lines, workers=args.workers, chunk_size=args.chunk_size,
+                                 shared_table=args.shared_table)
+        failed = _write_results(results, sys.stdout)
+    if failed:
         sys.exit(1)
 
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,230 @@
+"""
+轻量客户端 - 把命令行参数或标准输入转发给常驻的转换进程
+
+只依赖标准库、不导入转换模块，启动开销只有解释器本身；
+守护进程不可用、或在转换中途断开时，退回到进程内转换（等同于 python -m src.cli）。
+
+用法:
+    python -m src.cli --daemon                  # 先启动守护进程
+    python -m src.client 123.45
+    cat amounts.txt | python -m src.client
+
+环境变量 RMB_DAEMON_SOCKET 指定 socket 路径。默认放在当前用户私有的目录中：
+$XDG_RUNTIME_DIR，未设置时为临时目录下权限为 0700 的 rmb-converter-<uid>。
+连接前检查 socket 属于当前用户，避免连到其他用户抢先创建的 socket。
+"""
+import json
+import os
+import socket
+import stat
+import sys
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+SOCKET_ENV = "RMB_DAEMON_SOCKET"
+SOCKET_NAME = "rmb-converter.sock"
+
+# 每个批量请求包含的行数
+CHUNK_SIZE = 1000
+
+# 与 src.cli 一致的错误前缀
+ERROR_PREFIXES = ("错误: ", "未知错误: ")
+
+
+def _private_dir() -> str:
+    """未设置 XDG_RUNTIME_DIR 时使用的私有目录"""
+    tmp = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(tmp, f"rmb-converter-{os.getuid()}")
+
+
+def default_socket_path() -> str:
+    """默认的 socket 路径，位于当前用户私有的目录中"""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return os.path.join(runtime, SOCKET_NAME)
+    return os.path.join(_private_dir(), SOCKET_NAME)
+
+
+def socket_path() -> str:
+    """守护进程的 socket 路径"""
+    return os.environ.get(SOCKET_ENV) or default_socket_path()
+
+
+def ensure_socket_dir(path: str):
+    """
+    创建（或检查）默认的私有目录，其他路径不做处理
+
+    Raises:
+        PermissionError: 目录不属于当前用户，或其他用户可以访问
+    """
+    directory = os.path.dirname(path)
+    if directory != _private_dir():
+        return
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"socket 目录不属于当前用户或权限过宽: {directory}")
+
+
+def check_socket_owner(path: str):
+    """
+    检查 path 是属于当前用户的 Unix socket
+
+    Raises:
+        FileNotFoundError: socket 不存在
+        PermissionError: 不是 socket，或属于其他用户
+    """
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"不是当前用户的 socket: {path}")
+
+
+class DaemonClient:
+    """与守护进程的一个连接"""
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 30.0):
+        """
+        Args:
+            path: socket 路径，默认见 socket_path()
+            timeout: 读写超时（秒）
+
+        Raises:
+            OSError: 守护进程不可用，或 socket 不属于当前用户
+        """
+        path = path or socket_path()
+        check_socket_owner(path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._file = self._sock.makefile("rwb")
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def convert_many(self, numbers: List[str]) -> List[Dict]:
+        """
+        批量转换
+
+        Returns:
+            List[Dict]: 与输入对应的 {"result": ...} 或 {"error": {...}}
+
+        Raises:
+            OSError: 连接中断
+        """
+        request = json.dumps({"numbers": numbers}, ensure_ascii=False)
+        self._file.write(request.encode("utf-8") + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("守护进程关闭了连接")
+        try:
+            response = json.loads(line)
+        except ValueError:
+            # 守护进程在写出响应的中途退出
+            raise ConnectionError("守护进程返回了不完整的响应") from None
+        if "results" not in response:
+            raise ConnectionError(f"守护进程返回了错误: {response}")
+        return response["results"]
+
+
+def format_item(item: Dict) -> str:
+    """将一个结果格式化为与 src.cli 相同的输出"""
+    if "result" in item:
+        return item["result"]
+    return f"错误: {item['error']['message']}"
+
+
+def stream_lines(client: DaemonClient, lines: Iterable[str],
+                 fallback: Optional[Callable[[str], str]] = None) -> Iterator[str]:
+    """
+    分块转发输入行，按输入顺序产出结果，空行输出空行
+
+    Args:
+        client: 守护进程连接
+        lines: 输入行
+        fallback: 连接中断时用于在本进程转换单行的函数（如 cli.convert_line），
+                  转换当前块及其后的全部行；为 None 时抛出 OSError
+    """
+    iterator = iter(lines)
+    while True:
+        chunk = [line.strip() for line in islice(iterator, CHUNK_SIZE)]
+        if not chunk:
+            return
+        try:
+            results = iter(client.convert_many([number for number in chunk if number]))
+        except OSError:
+            if fallback is None:
+                raise
+            yield from map(fallback, chunk)
+            yield from map(fallback, iterator)
+            return
+        for number in chunk:
+            yield format_item(next(results)) if number else ""
+
+
+def _in_process(argv: List[str]):
+    """守护进程不可用时在当前进程中转换"""
+    from .cli import main as cli_main
+    cli_main(argv)
+
+
+def _convert_line(line: str) -> str:
+    """连接中断后在当前进程中转换一行（此时才导入转换模块）"""
+    from .cli import convert_line
+    return convert_line(line)
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    argv = sys.argv[1:] if argv is None else argv
+
+    # 除负数外的选项交给完整的命令行处理；没有输入时由其输出用法说明
+    if any(arg.startswith("-") and not arg[1:2].isdigit() for arg in argv) or \
+            (not argv and sys.stdin.isatty()):
+        _in_process(argv)
+        return
+
+    try:
+        client = DaemonClient()
+    except OSError:
+        _in_process(argv)
+        return
+
+    with client:
+        if len(argv) == 1:
+            try:
+                output = format_item(client.convert_many(argv)[0])
+            except OSError:
+                _in_process(argv)
+                return
+            print(output)
+            if output.startswith(ERROR_PREFIXES):
+                sys.exit(1)
+            return
+
+        failed = False
+        lines = argv if argv else sys.stdin
+        for output in stream_lines(client, lines, _convert_line):
+            failed = failed or output.startswith(ERROR_PREFIXES)
+            sys.stdout.write(output + "\n")
+        sys.stdout.flush()
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,20 @@
 """
 转换器核心模块 - 实现数字到中文大写的转换
 """
-from typing import List
-from .parser import split_number
-
-# 数字到中文大写的映射
-CHINESE_DIGITS = {
-    0: "零", 1: "壹", 2: "贰", 3: "叁", 4: "肆",
-    5: "伍", 6: "陆", 7: "柒", 8: "捌", 9: "玖"
-}
-
-# 位值单位
-UNITS = ["", "拾", "佰", "仟"]
-
-# 大单位
-LARGE_UNITS = ["", "万", "亿"]
-
-def _convert_4digits(num: int) -> str:
-    """
-    转换4位以内的数字
-    
-    Args:
-        num: 0-9999之间的整数
-    
-    Returns:
-        str: 转换后的中文大写
-    """
-    if num == 0:
-        return ""
-    
-    result = []
-    num_str = str(num)
-    num_len = len(num_str)
-    
-    # 补齐4位
-    num_str = num_str.zfill(4)
-    
-    # 处理每一位
-    last_is_zero = True  # 上一位是否为零
-    for i, digit in enumerate(num_str):
-        digit_int = int(digit)
-        
-        # 当前数字是0的情况
-        if digit_int == 0:
-            if not last_is_zero and i < len(num_str) - 1 and any(int(d) > 0 for d in num_str[i+1:]):
-                result.append(CHINESE_DIGITS[0])
-            last_is_zero = True
-            continue
-            
-        # 当前数字非0
-        if digit_int > 0:
-            result.append(CHINESE_DIGITS[digit_int])
-            result.append(UNITS[4 - i - 1])
-            last_is_zero = False
-    
-    return "".join(result)
+from time import perf_counter_ns
+from . import stats
+from .group_table import LEADING_ZERO, get_group_flags, get_group_texts
+from .parser import Amount, split_value
+from .symbols import CHINESE_DIGITS, LARGE_UNITS
+from .validation import ROUNDING_DOWN, ConversionError
 
 def convert_integer(num: int) -> str:
     """
     转换整数部分
     
+    按万分组查表：每组的文本和"前导零"标志都已预先计算，
+    组与组之间只需判断是否补一个"零"，最后一次拼接。
+    
     Args:
         num: 待转换的整数
     
@@ -69,26 +24,29 @@ def convert_integer(num: int) -> str:
     if num == 0:
         return CHINESE_DIGITS[0]
     
-    result = []
-    
-    # 按4位分组处理
+    # 按4位分组，低位在前
     groups = []
     while num > 0:
-        groups.append(num % 10000)
-        num //= 10000
+        num, group = divmod(num, 10000)
+        groups.append(group)
+    
+    texts = get_group_texts()
+    flags = get_group_flags()
+    zero = CHINESE_DIGITS[0]
     
-    # 处理每个分组
-    for i, group in enumerate(groups):
+    result = []
+    zero_pending = False
+    for i in range(len(groups) - 1, -1, -1):
+        group = groups[i]
         if group == 0:
-            # 处理全零的组
-            if i < len(groups) - 1 and groups[i+1] > 0:
-                result.insert(0, CHINESE_DIGITS[0])
+            # 全零的组不输出，由下一个非零组补"零"
+            zero_pending = True
             continue
-        
-        # 转换当前组
-        group_chinese = _convert_4digits(group)
-        if group_chinese:
-            result.insert(0, group_chinese + LARGE_UNITS[i])
+        if result and (zero_pending or flags[group] & LEADING_ZERO):
+            result.append(zero)
+        result.append(texts[group])
+        result.append(LARGE_UNITS[i])
+        zero_pending = False
     
     return "".join(result)
 
@@ -118,32 +76,60 @@ def convert_decimal(jiao: int, fen: int) -> str:
     
     return "".join(result)
 
-def convert(number: str) -> str:
+def _assemble(integer_chinese: str, decimal_part: int) -> str:
+    """转换小数部分并与整数部分组合"""
+    # 转换小数部分
+    jiao = decimal_part // 10
+    fen = decimal_part % 10
+    decimal_chinese = convert_decimal(jiao, fen)
+    
+    # 组合结果
+    result = integer_chinese + "元"
+    if decimal_chinese != "整":
+        result += decimal_chinese
+    else:
+        result += "整"
+    
+    return result
+
+def _convert_instrumented(number: Amount, rounding: str = ROUNDING_DOWN) -> str:
+    """与 convert 相同，同时记录各阶段耗时与错误"""
+    start = perf_counter_ns()
+    try:
+        integer_part, decimal_part = split_value(number, rounding=rounding)
+    except ConversionError as e:
+        stats.record_error(e.code)
+        raise
+    parsed = perf_counter_ns()
+    integer_chinese = convert_integer(integer_part)
+    converted = perf_counter_ns()
+    result = _assemble(integer_chinese, decimal_part)
+    end = perf_counter_ns()
+    stats.record("parse", parsed - start)
+    stats.record("integer", converted - parsed)
+    stats.record("assemble", end - converted)
+    stats.record("total", end - start)
+    return result
+
+def convert(number: Amount, rounding: str = ROUNDING_DOWN) -> str:
     """
     将数字转换为中文大写金额
     
     Args:
-        number: 待转换的数字字符串
+        number: 待转换的数字字符串，也可以是 int（元）、Decimal、float 或
+                ASCII 数字的 bytes / memoryview，见 parser.split_value
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES，默认截断
     
     Returns:
         str: 转换后的中文大写金额
     """
+    if stats.ENABLED:
+        return _convert_instrumented(number, rounding)
+    
     # 分离整数和小数部分
-    integer_part, decimal_part = split_number(number)
+    integer_part, decimal_part = split_value(number, rounding=rounding)
     
     # 转换整数部分
     integer_chinese = convert_integer(integer_part)
     
-    # 转换小数部分
-    jiao = decimal_part // 10
-    fen = decimal_part % 10
-    decimal_chinese = convert_decimal(jiao, fen)
-    
-    # 组合结果
-    result = integer_chinese + "元"
-    if decimal_chinese != "整":
-        result += decimal_chinese
-    else:
-        result += "整"
-    
-    return result 
\ No newline at end of file
+    return _assemble(integer_chinese, decimal_part)
@@ -0,0 +1,266 @@
+"""
+CSV 列转换模块 - 为大型 CSV 文件追加一列大写金额
+
+输入文件以内存映射方式打开，按字节数切分成以换行符结尾的分块；
+工作进程在初始化时各自映射同一文件并加载分组表（设置了 RMB_GROUP_TABLE 时
+直接映射预生成的表文件；使用 --shared-table 时附加父进程生成在共享内存中的表），
+任务只传递分块的起止位置，结果按输入顺序流式写出，
+同时在途的分块数有上限，内存占用与文件大小无关。
+
+限制: 字段内不能含有换行符（引号内的换行会被当作行尾切开）。
+
+用法:
+    python -m src.csv_column ledger.csv --column amount -o ledger_out.csv --workers 8
+    python -m src.csv_column ledger.csv --column 2 --no-header --encoding gbk -o -
+"""
+import argparse
+import csv
+import io
+import mmap
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from .group_table import get_group_texts, shared_group_table, use_shared_group_table
+from .optimized_converter import convert_optimized, initialize_cache
+from .validation import ConversionError
+
+# 每个分块的目标字节数
+DEFAULT_CHUNK_BYTES = 4 << 20
+
+# 新增列的默认列名后缀
+COLUMN_SUFFIX = "_大写"
+
+# 工作进程的状态：(内存映射, 编码, 列下标, 分隔符, 行尾)
+_WORKER: Optional[Tuple[mmap.mmap, str, int, str, str]] = None
+
+
+def convert_cell(cell: str) -> str:
+    """
+    转换一个单元格，错误以文本形式返回
+
+    与 cli.convert_line 相同，意外的异常也以文本返回，一个单元格出错不会中断整个文件。
+
+    Returns:
+        str: 转换结果，或以"错误: "、"未知错误: "开头的错误信息；空单元格返回空字符串
+    """
+    number = cell.strip()
+    if not number:
+        return ""
+    try:
+        return convert_optimized(number)
+    except ConversionError as e:
+        return f"错误: {e.message}"
+    except Exception as e:
+        return f"未知错误: {str(e)}"
+
+
+def _init_worker(path: str, encoding: str, index: int, delimiter: str, lineterminator: str,
+                 table_name: Optional[str] = None):
+    """工作进程初始化：映射输入文件，加载（或附加共享的）分组表与缓存"""
+    global _WORKER
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if table_name:
+        use_shared_group_table(table_name)
+    get_group_texts()
+    initialize_cache()
+    _WORKER = (mapped, encoding, index, delimiter, lineterminator)
+
+
+def _close_worker():
+    global _WORKER
+    if _WORKER is not None:
+        _WORKER[0].close()
+        _WORKER = None
+
+
+def _convert_range(start: int, end: int) -> Tuple[bytes, int, int]:
+    """
+    转换输入文件中 [start, end) 的行（进程池的任务单元）
+
+    Returns:
+        Tuple[bytes, int, int]: (编码后的输出, 行数, 出错行数)
+    """
+    mapped, encoding, index, delimiter, lineterminator = _WORKER
+    text = mapped[start:end].decode(encoding)
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=delimiter, lineterminator=lineterminator)
+    rows = errors = 0
+    for row in csv.reader(io.StringIO(text, newline=""), delimiter=delimiter):
+        if not row:
+            out.write(lineterminator)
+            continue
+        result = convert_cell(row[index] if index < len(row) else "")
+        if result.startswith(("错误: ", "未知错误: ")):
+            errors += 1
+        row.append(result)
+        writer.writerow(row)
+        rows += 1
+    return out.getvalue().encode(encoding), rows, errors
+
+
+def split_ranges(mapped: mmap.mmap, start: int, chunk_bytes: int) -> Iterator[Tuple[int, int]]:
+    """
+    从 start 开始按换行符把文件切成约 chunk_bytes 大小的分块
+
+    Yields:
+        Tuple[int, int]: 分块的起止位置，每块（最后一块除外）以换行符结尾
+    """
+    size = len(mapped)
+    while start < size:
+        end = mapped.find(b"\n", min(start + chunk_bytes, size) - 1)
+        end = size if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+def _resolve_column(header: Optional[List[str]], column: Union[int, str],
+                    width: Optional[int] = None) -> int:
+    """
+    把列名或从0开始的列号解析为列下标
+
+    Args:
+        header: 表头，没有表头时为 None
+        column: 列名或列号
+        width: 第一行的列数，列号不能超出
+
+    Raises:
+        ValueError: 找不到指定的列
+    """
+    if isinstance(column, int) or (isinstance(column, str) and column.isdigit()):
+        index = int(column)
+        if width is not None and index >= width:
+            raise ValueError(f"找不到列: {column}")
+        return index
+    if header is None or column not in header:
+        raise ValueError(f"找不到列: {column}")
+    return header.index(column)
+
+
+def convert_csv(path: str, output: BinaryIO, column: Union[int, str], workers: int = 1,
+                encoding: str = "utf-8", header: bool = True, output_column: Optional[str] = None,
+                delimiter: str = ",", chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                shared_table: bool = False) -> Dict[str, int]:
+    """
+    为 CSV 文件追加一列大写金额
+
+    Args:
+        path: 输入文件路径
+        output: 以二进制方式打开的输出文件
+        column: 金额所在的列名，或从0开始的列号
+        workers: 工作进程数，1 表示在当前进程中转换
+        encoding: 输入与输出的编码
+        header: 第一行是否为表头
+        output_column: 新增列的列名，默认为原列名加"_大写"
+        delimiter: 分隔符
+        chunk_bytes: 每个分块的目标字节数
+        shared_table: 多进程时在父进程中生成一次分组表放入共享内存，工作进程直接附加
+
+    Returns:
+        Dict[str, int]: {"rows": 转换的行数, "errors": 出错的行数}
+
+    Raises:
+        ValueError: 找不到指定的列
+    """
+    stats = {"rows": 0, "errors": 0}
+    if os.path.getsize(path) == 0:
+        return stats
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        first_end = mapped.find(b"\n")
+        lineterminator = "\r\n" if first_end > 0 and mapped[first_end - 1] == 0x0D else "\n"
+        line_end = len(mapped) if first_end < 0 else first_end + 1
+        first_row = next(csv.reader([mapped[:line_end].decode(encoding)], delimiter=delimiter), [])
+        body_start = 0
+        header_row = None
+        if header:
+            body_start = line_end
+            header_row = first_row
+        index = _resolve_column(header_row, column, len(first_row))
+        if header_row is not None:
+            name = output_column or f"{header_row[index]}{COLUMN_SUFFIX}"
+            line = io.StringIO()
+            csv.writer(line, delimiter=delimiter, lineterminator=lineterminator).writerow(
+                header_row + [name])
+            output.write(line.getvalue().encode(encoding))
+        ranges = list(split_ranges(mapped, body_start, chunk_bytes))
+    finally:
+        mapped.close()
+
+    def collect(result: Tuple[bytes, int, int]):
+        data, rows, errors = result
+        output.write(data)
+        stats["rows"] += rows
+        stats["errors"] += errors
+
+    initargs = (path, encoding, index, delimiter, lineterminator)
+    if workers <= 1:
+        _init_worker(*initargs)
+        try:
+            for start, end in ranges:
+                collect(_convert_range(start, end))
+        finally:
+            _close_worker()
+        return stats
+
+    table = shared_group_table() if shared_table else nullcontext()
+    with table as table_name, ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                  initargs=initargs + (table_name,)) as executor:
+        # 限制同时在途的分块数，按提交顺序写出
+        pending = deque()
+        for start, end in ranges:
+            pending.append(executor.submit(_convert_range, start, end))
+            if len(pending) >= workers * 2:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+    return stats
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(prog="python -m src.csv_column",
+                                     description="为 CSV 文件追加一列大写金额")
+    parser.add_argument("input", help="输入的 CSV 文件")
+    parser.add_argument("-c", "--column", required=True, help="金额所在的列名，或从0开始的列号")
+    parser.add_argument("-o", "--output", default="-", help="输出文件，\"-\" 表示标准输出（默认）")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="工作进程数（默认为 CPU 核数）")
+    parser.add_argument("--encoding", default="utf-8", help="文件编码（默认utf-8）")
+    parser.add_argument("--delimiter", default=",", help="分隔符（默认逗号）")
+    parser.add_argument("--no-header", action="store_true", help="第一行不是表头")
+    parser.add_argument("--name", help=f"新增列的列名（默认为原列名加\"{COLUMN_SUFFIX}\"）")
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES / (1 << 20),
+                        help="每个分块的大小（MB）")
+    parser.add_argument("--shared-table", action="store_true",
+                        help="在共享内存中生成一次分组表，各工作进程直接附加")
+    args = parser.parse_args(argv)
+
+    options = dict(column=args.column, workers=args.workers, encoding=args.encoding,
+                   header=not args.no_header, output_column=args.name,
+                   delimiter=args.delimiter, chunk_bytes=max(1, int(args.chunk_mb * (1 << 20))),
+                   shared_table=args.shared_table)
+    try:
+        if args.output == "-":
+            stats = convert_csv(args.input, sys.stdout.buffer, **options)
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.output, "wb") as output:
+                stats = convert_csv(args.input, output, **options)
+    except (OSError, ValueError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(f"已转换 {stats['rows']} 行，出错 {stats['errors']} 行", file=sys.stderr)
+    if stats["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
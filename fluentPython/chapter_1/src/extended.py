@@ -0,0 +1,146 @@
+"""
+扩展量程模块 - 可配置大单位的转换（兆、京……）
+
+默认的转换只到亿（整数部分最多12位）。扩展模式按万进制逐级使用配置的大单位，
+默认为 EXTENDED_LARGE_UNITS（万、亿、兆、京、垓、秭、穰），整数部分最多32位。
+
+整数部分从高位到低位单遍处理：按四位切分数字串，每组查预先生成的分组表，
+补零规则与 converter.convert_integer 相同，耗时与位数成线性关系。
+
+用法:
+    convert_extended("1234567890123456789.01")
+    ExtendedConverter(["", "万", "亿", "兆"]).convert("1000000000000000")
+"""
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+from .converter import _assemble
+from .group_table import LEADING_ZERO, get_group_flags, get_group_texts
+from .parser import Amount, overflow_message, split_value
+from .symbols import CHINESE_DIGITS, EXTENDED_LARGE_UNITS
+from .validation import ROUNDING_DOWN, validate_cents
+
+
+class ExtendedConverter:
+    """使用给定大单位序列的转换器"""
+
+    def __init__(self, large_units: Sequence[str] = EXTENDED_LARGE_UNITS):
+        """
+        Args:
+            large_units: 从个位组开始的大单位，第一项必须为空字符串，
+                         例如 ["", "万", "亿", "兆"]
+
+        Raises:
+            ValueError: 大单位序列不合法
+        """
+        if not large_units or large_units[0] != "":
+            raise ValueError("大单位序列的第一项必须为空字符串")
+        if len(set(large_units)) != len(large_units) or not all(large_units[1:]):
+            raise ValueError(f"大单位不能为空或重复: {list(large_units)}")
+        self.large_units: Tuple[str, ...] = tuple(large_units)
+        self.max_digits = 4 * len(self.large_units)
+        self.max_integer = 10 ** self.max_digits - 1
+
+    def convert_integer(self, num: int) -> str:
+        """
+        转换整数部分
+
+        Args:
+            num: 0 到 max_integer 之间的整数
+
+        Returns:
+            str: 转换后的中文大写
+        """
+        return self.convert_digits(str(num))
+
+    def convert_digits(self, digits: str) -> str:
+        """
+        转换不带前导零的十进制数字串表示的整数部分
+
+        Args:
+            digits: ASCII数字串，不超过 max_digits 位
+
+        Returns:
+            str: 转换后的中文大写
+        """
+        if digits == "0":
+            return CHINESE_DIGITS[0]
+
+        texts = get_group_texts()
+        flags = get_group_flags()
+        units = self.large_units
+        zero = CHINESE_DIGITS[0]
+
+        position = (len(digits) - 1) // 4
+        start = 0
+        end = len(digits) - 4 * position
+        result = []
+        zero_pending = False
+        while position >= 0:
+            group = int(digits[start:end])
+            if group:
+                if result and (zero_pending or flags[group] & LEADING_ZERO):
+                    result.append(zero)
+                result.append(texts[group])
+                result.append(units[position])
+                zero_pending = False
+            else:
+                # 全零的组不输出，由下一个非零组补"零"
+                zero_pending = True
+            start, end = end, end + 4
+            position -= 1
+        return "".join(result)
+
+    def convert(self, number: Amount, rounding: str = ROUNDING_DOWN) -> str:
+        """
+        将数字转换为中文大写金额
+
+        Args:
+            number: 待转换的数字，支持的类型见 parser.split_value
+            rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+        Returns:
+            str: 转换后的中文大写金额
+
+        Raises:
+            InvalidFormatError: 格式错误
+            OverflowError: 整数部分超过 max_digits 位
+            NegativeNumberError: 负数错误
+        """
+        integer_part, decimal_part = split_value(number, self.max_digits, rounding)
+        return _assemble(self.convert_integer(integer_part), decimal_part)
+
+    def convert_cents(self, cents: int) -> str:
+        """
+        转换以"分"为单位的整数金额
+
+        Raises:
+            InvalidFormatError: 非整数（包括布尔值和浮点数）
+            OverflowError: 整数部分超过 max_digits 位
+            NegativeNumberError: 负数
+        """
+        value = validate_cents(cents, self.max_integer * 100 + 99, overflow_message(self.max_digits))
+        integer_part, decimal_part = divmod(value, 100)
+        return _assemble(self.convert_integer(integer_part), decimal_part)
+
+
+@lru_cache(maxsize=8)
+def get_converter(large_units: Tuple[str, ...] = tuple(EXTENDED_LARGE_UNITS)) -> ExtendedConverter:
+    """获取（并缓存）使用给定大单位的转换器"""
+    return ExtendedConverter(large_units)
+
+
+def convert_extended(number: Amount, large_units: Sequence[str] = EXTENDED_LARGE_UNITS,
+                     rounding: str = ROUNDING_DOWN) -> str:
+    """
+    扩展量程的数字转换
+
+    Args:
+        number: 待转换的数字字符串
+        large_units: 大单位序列，见 ExtendedConverter
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        str: 转换后的中文大写金额
+    """
+    return get_converter(tuple(large_units)).convert(number, rounding)
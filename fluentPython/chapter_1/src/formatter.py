@@ -0,0 +1,182 @@
+"""
+格式化模块 - 一次解析，渲染多种金额格式
+
+打印支票、发票时同一金额需要多种写法：大写金额、"¥1,234,567.89" 形式的数字金额，
+以及支票上按位填写的大写格子。tokenize 只解析一次，得到 AmountTokens：
+元、分与按位对齐的数字串（从最高位到"分"），各渲染函数都从它生成结果，不再重复解析。
+
+按位的单位依次为 POSITION_UNITS（仟亿……元、角、分），与支票格子的标签一致，
+因此 AmountTokens.pairs() 给出的 (数字, 单位) 对可以直接对应到格子。
+
+用法:
+    tokens = tokenize("1234567.89")
+    render_uppercase(tokens)     # 壹佰贰拾叁万肆仟伍佰陆拾柒元捌角玖分
+    render_numeric(tokens)       # ¥1,234,567.89
+    render_grid(tokens)          # ['零', '零', '壹', '贰', '叁', '肆', '伍', '陆', '柒', '捌', '玖']
+    format_many(amounts)         # 每个金额一次解析，返回各格式的元组
+"""
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .extended import get_converter
+from .optimized_converter import _DECIMAL_SUFFIXES
+from .parser import Amount, split_value
+from .symbols import CHINESE_DIGITS, LARGE_UNITS
+from .validation import ROUNDING_DOWN, OverflowError, validate_cents
+
+# 从仟亿到分的各位单位
+POSITION_UNITS = ("仟亿", "佰亿", "拾亿", "亿", "仟万", "佰万", "拾万", "万",
+                  "仟", "佰", "拾", "元", "角", "分")
+
+# 常见支票大写金额栏的格子（亿位到分位）
+CHEQUE_GRID = POSITION_UNITS[3:]
+
+# 仟亿以内的大单位，供逐组渲染大写金额
+_LARGE_UNITS = tuple(LARGE_UNITS)
+
+# ASCII数字 -> 大写数字
+_UPPER_DIGITS = str.maketrans("0123456789", "".join(CHINESE_DIGITS[i] for i in range(10)))
+
+
+class AmountTokens:
+    """一个金额的结构化表示，渲染各种格式时共用"""
+
+    __slots__ = ("integer", "cents", "positions")
+
+    def __init__(self, integer: int, cents: int):
+        """
+        Args:
+            integer: 整数部分（元）
+            cents: 小数部分（0-99 分）
+        """
+        self.integer = integer
+        self.cents = cents
+        # 从最高位到分位的数字，与 POSITION_UNITS 的末尾对齐
+        self.positions = f"{integer}{cents:02d}"
+
+    def __repr__(self) -> str:
+        return f"AmountTokens({self.integer}, {self.cents})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AmountTokens):
+            return NotImplemented
+        return self.integer == other.integer and self.cents == other.cents
+
+    def pairs(self) -> List[Tuple[int, str]]:
+        """
+        按位的 (数字, 单位) 对
+
+        Returns:
+            List[Tuple[int, str]]: 从最高位到分位，例如 1005.6 ->
+            [(1, "仟"), (0, "佰"), (0, "拾"), (5, "元"), (6, "角"), (0, "分")]
+        """
+        units = POSITION_UNITS[len(POSITION_UNITS) - len(self.positions):]
+        return list(zip(map(int, self.positions), units))
+
+
+def tokenize(number: Amount, rounding: str = ROUNDING_DOWN) -> AmountTokens:
+    """
+    解析金额
+
+    Args:
+        number: 金额，支持的类型见 parser.split_value
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        AmountTokens: 结构化表示
+
+    Raises:
+        ConversionError: 输入不合法
+    """
+    return AmountTokens(*split_value(number, rounding=rounding))
+
+
+def tokenize_cents(cents: int) -> AmountTokens:
+    """
+    由以"分"为单位的整数生成结构化表示
+
+    Raises:
+        ConversionError: 分值不合法
+    """
+    return AmountTokens(*divmod(validate_cents(cents), 100))
+
+
+def render_uppercase(tokens: AmountTokens) -> str:
+    """大写金额，由 tokens.positions 逐组查表生成，与 convert_optimized 的结果相同"""
+    positions = tokens.positions
+    integer_text = get_converter(_LARGE_UNITS).convert_digits(positions[:-2])
+    return integer_text + _DECIMAL_SUFFIXES[int(positions[-2:])]
+
+
+def render_numeric(tokens: AmountTokens, symbol: str = "¥") -> str:
+    """
+    千位分隔的数字金额
+
+    Args:
+        tokens: 结构化表示
+        symbol: 货币符号，可以为空字符串
+
+    Returns:
+        str: 例如 "¥1,234,567.89"
+    """
+    return f"{symbol}{tokens.integer:,}.{tokens.cents:02d}"
+
+
+def render_grid(tokens: AmountTokens, labels: Sequence[str] = CHEQUE_GRID,
+                fill: str = CHINESE_DIGITS[0]) -> List[str]:
+    """
+    支票格子，每格一个大写数字
+
+    Args:
+        tokens: 结构化表示
+        labels: 格子的标签，须为 POSITION_UNITS 的末尾若干项，默认为亿位到分位
+        fill: 最高位之前的空格子填写的内容，默认为"零"，传入空字符串则留空
+
+    Returns:
+        List[str]: 与 labels 一一对应的格子内容；金额内部的零写作"零"
+
+    Raises:
+        OverflowError: 金额的位数超过格子数
+    """
+    positions = tokens.positions
+    blank = len(labels) - len(positions)
+    if blank < 0:
+        raise OverflowError('NUMBER_TOO_LARGE', f'金额超出支票格子（最高位为{labels[0]}）',
+                            f"{tokens.integer}.{tokens.cents:02d}")
+    return [fill] * blank + list(positions.translate(_UPPER_DIGITS))
+
+
+# 内置的渲染函数
+RENDERERS: Dict[str, Callable[[AmountTokens], object]] = {
+    "uppercase": render_uppercase,
+    "numeric": render_numeric,
+    "grid": render_grid,
+}
+
+
+def format_many(numbers: Iterable[Amount], formats: Sequence[str] = tuple(RENDERERS),
+                rounding: str = ROUNDING_DOWN) -> List[tuple]:
+    """
+    批量渲染多种格式，每个金额只解析一次
+
+    Args:
+        numbers: 金额序列
+        formats: 渲染格式，见 RENDERERS
+        rounding: 小数超过两位时的舍入方式
+
+    Returns:
+        List[tuple]: 每个金额一个元组，依次为各格式的结果
+
+    Raises:
+        ConversionError: 含有不合法的输入，或金额超出支票格子
+        ValueError: 未知的格式
+    """
+    unknown = [name for name in formats if name not in RENDERERS]
+    if unknown:
+        raise ValueError(f"未知的格式: {', '.join(unknown)}，可用: {', '.join(RENDERERS)}")
+    renderers = [RENDERERS[name] for name in formats]
+    results = []
+    append = results.append
+    for number in numbers:
+        tokens = AmountTokens(*split_value(number, rounding=rounding))
+        append(tuple([render(tokens) for render in renderers]))
+    return results
@@ -0,0 +1,409 @@
+"""
+分组表模块 - 0-9999 的中文大写文本表
+
+表在首次使用时构建。设置环境变量 RMB_GROUP_TABLE 指向预先生成的表文件时，
+改为内存映射该文件并按需解码，文件的版本或校验和不匹配时退回到现场构建。
+
+多进程时父进程可以用 shared_group_table() 把表（偏移数组 + UTF-8 文本，与表文件
+格式相同）生成到共享内存中，工作进程初始化时调用 use_shared_group_table(名称)
+或设置环境变量 RMB_GROUP_TABLE_SHM 直接附加：不复制表内容，条目在首次访问时解码，
+工作进程的内存占用和启动时间不随进程数增长。
+
+线程安全：首次构建在锁内完成，多个线程同时首次使用时只构建（或映射）一次；
+表构建完成后才发布，发布后只读，之后的读取不加锁。
+
+生成表文件:
+    python -m src.group_table <输出路径>
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+import warnings
+from array import array
+from contextlib import contextmanager
+from typing import Iterator, List, Mapping, Optional, Sequence
+
+from .symbols import CHINESE_DIGITS, UNITS
+
+# 表文件格式版本，格式变化时递增
+TABLE_VERSION = 1
+
+# 环境变量：预生成表文件的路径
+TABLE_ENV = "RMB_GROUP_TABLE"
+
+# 环境变量：父进程共享的分组表所在共享内存段的名称
+SHM_ENV = "RMB_GROUP_TABLE_SHM"
+
+GROUP_SIZE = 10000
+
+# 文件头：魔数、版本、条目数、校验和
+_MAGIC = b"RMBGTBL\0"
+_HEADER = struct.Struct("<8sHI32s")
+
+# 分组标志位
+# LEADING_ZERO: 0 < n < 1000，前面有非零分组时需要补"零"（如 1亿0005 -> 壹亿零伍）
+LEADING_ZERO = 1
+
+# 已加载的表，发布后只读
+_TEXTS: Optional[Sequence[str]] = None
+_FLAGS: Optional[bytes] = None
+_LOCK = threading.Lock()
+
+
+def build_group_texts(digits: Mapping[int, str] = CHINESE_DIGITS,
+                      units: Sequence[str] = UNITS) -> List[str]:
+    """
+    构建 0-9999 的中文大写文本表
+
+    每个数字由最高位加上余数的文本组成，余数位数不足时补一个"零"，
+    因此每个条目只需常数次字符串拼接。
+
+    Args:
+        digits: 0-9 对应的字形，默认为简体大写
+        units: 个、拾、佰、仟位的单位
+
+    Returns:
+        List[str]: 下标为数值的文本列表，0 对应空字符串
+    """
+    texts = [""] * GROUP_SIZE
+    zero = digits[0]
+    for n in range(1, GROUP_SIZE):
+        position = len(str(n)) - 1
+        power = 10 ** position
+        lead, rest = divmod(n, power)
+        text = digits[lead] + units[position]
+        if rest:
+            if rest * 10 < power:
+                text += zero
+            text += texts[rest]
+        texts[n] = text
+    return texts
+
+
+def build_group_flags() -> bytes:
+    """
+    构建 0-9999 的分组标志表
+
+    Returns:
+        bytes: 下标为数值的标志位，见 LEADING_ZERO
+    """
+    flags = bytearray(GROUP_SIZE)
+    for n in range(1, GROUP_SIZE):
+        if n < 1000:
+            flags[n] |= LEADING_ZERO
+    return bytes(flags)
+
+
+def _fingerprint() -> bytes:
+    """构建表所依赖的字符映射，变化后旧的表文件自动失效"""
+    return repr((TABLE_VERSION, CHINESE_DIGITS, UNITS)).encode("utf-8")
+
+
+def _digest(payload) -> bytes:
+    """表内容的校验和"""
+    # 只有读写表文件时才需要，延迟导入以免增加启动时间
+    import hashlib
+    digest = hashlib.sha256(_fingerprint())
+    digest.update(payload)
+    return digest.digest()
+
+
+class MappedGroupTable(Sequence):
+    """内存映射的分组表，直接读取映射的内容，条目在首次访问时解码"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._attach(mapped, memoryview(mapped), path)
+
+    def _attach(self, handle, view: memoryview, source: str):
+        """
+        校验并使用 view 中的表内容
+
+        Args:
+            handle: 提供 view 的对象，close() 时一并关闭
+            view: 文件头 + 偏移数组 + UTF-8 文本，末尾可以有多余的字节
+            source: 出错信息中使用的来源名称
+
+        Raises:
+            ValueError: 内容不完整，或版本、校验和不匹配
+        """
+        self._handle = handle
+        self._view = view
+        self._offsets = None
+        try:
+            if len(view) < _HEADER.size:
+                raise ValueError(f"分组表不完整: {source}")
+            magic, version, count, digest = _HEADER.unpack_from(view, 0)
+            if magic != _MAGIC or version != TABLE_VERSION or count != GROUP_SIZE:
+                raise ValueError(f"分组表版本不匹配: {source}")
+            base = _HEADER.size + (count + 1) * 4
+            if len(view) < base:
+                raise ValueError(f"分组表不完整: {source}")
+            if sys.byteorder == "little":
+                # 直接把映射的内容当作偏移数组，不复制
+                self._offsets = view[_HEADER.size:base].cast("I")
+            else:
+                self._offsets = array("I")
+                self._offsets.frombytes(view[_HEADER.size:base])
+                self._offsets.byteswap()
+            end = base + self._offsets[count]
+            if len(view) < end or _digest(view[_HEADER.size:end]) != digest:
+                raise ValueError(f"分组表校验失败: {source}")
+        except ValueError:
+            self.close()
+            raise
+        self._base = base
+        self._texts: List[Optional[str]] = [None] * count
+
+    def close(self):
+        """释放映射，之后只能读取已解码的条目"""
+        offsets, self._offsets = self._offsets, None
+        if isinstance(offsets, memoryview):
+            offsets.release()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._handle.close()
+
+    def __del__(self):
+        # 先释放视图，否则底层映射（共享内存）无法关闭
+        if getattr(self, "_view", None) is not None:
+            self.close()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        text = self._texts[index]
+        if text is None:
+            # 并发时可能重复解码同一条目，写入的值相同，不需要加锁
+            if index < 0:
+                index += len(self)
+            start = self._base + self._offsets[index]
+            end = self._base + self._offsets[index + 1]
+            text = self._texts[index] = str(self._view[start:end], "utf-8")
+        return text
+
+
+class SharedGroupTable(MappedGroupTable):
+    """附加到共享内存中的分组表（由 create_shared_group_table 生成）"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 共享内存段的名称
+
+        Raises:
+            FileNotFoundError: 共享内存段不存在
+            ValueError: 内容不完整，或版本、校验和不匹配
+        """
+        segment = _open_shared_memory(name)
+        self.name = name
+        self._attach(segment, segment.buf, name)
+
+
+def _open_shared_memory(name: str):
+    """附加到已有的共享内存段，不登记到 resource tracker（段由创建它的进程释放）"""
+    from multiprocessing import resource_tracker, shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    # Python 3.13 之前没有 track 参数，POSIX 上附加时总会登记；独立启动的进程有自己的
+    # resource tracker，退出时会把段删除，因此只取消这一个段的登记
+    segment = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _encode_table() -> bytes:
+    """按表文件格式编码分组表：文件头 + 偏移数组 + UTF-8 文本"""
+    blobs = [text.encode("utf-8") for text in build_group_texts()]
+    offsets = array("I", [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    payload = offsets.tobytes() + b"".join(blobs)
+    return _HEADER.pack(_MAGIC, TABLE_VERSION, len(blobs), _digest(payload)) + payload
+
+
+def save_group_table(path: str):
+    """
+    生成表文件
+
+    Args:
+        path: 输出路径
+    """
+    data = _encode_table()
+
+    # 先写临时文件再替换，避免其他进程读到不完整的文件
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def create_shared_group_table(name: Optional[str] = None):
+    """
+    在共享内存中生成分组表，供工作进程附加
+
+    Args:
+        name: 共享内存段的名称，默认自动生成
+
+    Returns:
+        multiprocessing.shared_memory.SharedMemory: 共享内存段，调用方在工作进程
+        结束后用 release_shared_group_table 释放
+
+    Raises:
+        FileExistsError: 同名的共享内存段已存在
+    """
+    from multiprocessing import shared_memory
+    data = _encode_table()
+    segment = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    segment.buf[:len(data)] = data
+    return segment
+
+
+@contextmanager
+def shared_group_table() -> Iterator[str]:
+    """
+    在父进程中生成共享的分组表，退出时释放
+
+    用法:
+        with shared_group_table() as name, ProcessPoolExecutor(
+                initializer=use_shared_group_table, initargs=(name,)) as executor:
+            ...
+
+    Yields:
+        str: 共享内存段的名称
+    """
+    segment = create_shared_group_table()
+    try:
+        yield segment.name
+    finally:
+        release_shared_group_table(segment)
+
+
+def release_shared_group_table(segment):
+    """
+    关闭并删除 create_shared_group_table 生成的共享内存段
+
+    Python 3.13 之前，与本进程共用 resource tracker 的进程（包括本进程与进程池的
+    工作进程）附加后会取消段的登记（见 _open_shared_memory），这里先重新登记
+    （重复登记没有影响），使 unlink 取消登记时 resource tracker 不报错。
+    """
+    segment.close()
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+        resource_tracker.register(segment._name, "shared_memory")
+    segment.unlink()
+
+
+def load_group_table(path: str) -> MappedGroupTable:
+    """
+    加载表文件
+
+    Args:
+        path: 表文件路径
+
+    Returns:
+        MappedGroupTable: 内存映射的分组表
+
+    Raises:
+        ValueError: 版本或校验和不匹配
+        OSError: 文件无法读取
+    """
+    return MappedGroupTable(path)
+
+
+def get_group_texts() -> Sequence[str]:
+    """
+    获取 0-9999 的中文大写文本表，首次调用时加载或构建
+
+    Returns:
+        Sequence[str]: 下标为数值的文本序列
+    """
+    global _TEXTS
+    texts = _TEXTS
+    if texts is None:
+        with _LOCK:
+            if _TEXTS is None:
+                _TEXTS = _load_texts()
+            texts = _TEXTS
+    return texts
+
+
+def use_shared_group_table(name: str) -> bool:
+    """
+    使用父进程共享的分组表（作为工作进程的 initializer）
+
+    Args:
+        name: 共享内存段的名称，见 shared_group_table
+
+    Returns:
+        bool: 是否附加成功；失败时发出警告，之后按默认方式加载或构建
+    """
+    global _TEXTS
+    try:
+        table = SharedGroupTable(name)
+    except (OSError, ValueError) as e:
+        warnings.warn(f"无法使用共享的分组表: {e}")
+        return False
+    with _LOCK:
+        _TEXTS = table
+    return True
+
+
+def _load_texts() -> Sequence[str]:
+    """附加共享的分组表或加载预生成的表文件，都不可用时现场构建"""
+    name = os.environ.get(SHM_ENV)
+    if name:
+        try:
+            return SharedGroupTable(name)
+        except (OSError, ValueError) as e:
+            warnings.warn(f"无法使用共享的分组表: {e}")
+    path = os.environ.get(TABLE_ENV)
+    if path:
+        try:
+            return load_group_table(path)
+        except (OSError, ValueError) as e:
+            warnings.warn(f"无法使用预生成的分组表，改为现场构建: {e}")
+    return build_group_texts()
+
+
+def get_group_flags() -> bytes:
+    """
+    获取 0-9999 的分组标志表，首次调用时构建
+
+    Returns:
+        bytes: 下标为数值的标志位
+    """
+    global _FLAGS
+    flags = _FLAGS
+    if flags is None:
+        with _LOCK:
+            if _FLAGS is None:
+                _FLAGS = build_group_flags()
+            flags = _FLAGS
+    return flags
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) != 2:
+        print("使用方法: python -m src.group_table <输出路径>")
+        sys.exit(1)
+    save_group_table(sys.argv[1])
+    print(f"已生成分组表: {sys.argv[1]}")
+
+
+if __name__ == "__main__":
+    main()
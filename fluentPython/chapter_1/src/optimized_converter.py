@@ -1,77 +1,176 @@
 """
 优化版转换器 - 包含缓存和预计算功能
+
+线程安全：查询表（分组表、角分后缀）只在首次使用时发布一次，之后只读；
+lru_cache 本身是线程安全的；结果缓存 ConversionCache 的修改在其内部锁中进行。
 """
+import threading
+from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Tuple
-from .converter import CHINESE_DIGITS, UNITS, LARGE_UNITS
-from .parser import split_number
-
-# 预计算常用数字的中文表示（0-9999）
-PRECOMPUTED_NUMBERS: Dict[int, str] = {}
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple
+from . import stats
+from .cache import ConversionCache, KEY_GROUP, KEY_INPUT, KEY_INTEGER, POLICY_LRU
+from .converter import convert_integer
+from .group_table import (
+    LEADING_ZERO, get_group_flags, get_group_texts
+)
+from .parser import Amount, split_number, split_value
+from .symbols import CHINESE_DIGITS, UNITS, LARGE_UNITS
+from .validation import ROUNDING_DOWN, ConversionError, validate_cents, validate_decimal
 
 # 预计算单位组合
 UNIT_COMBINATIONS: List[str] = []
 
+# 0-9999 的中文表示以字典形式提供（兼容旧接口），首次访问时生成
+_PRECOMPUTED_NUMBERS: Dict[int, str] = {}
+
+# 保护上面两个兼容旧接口的表，保证并发初始化时只填充一次
+_INIT_LOCK = threading.Lock()
+
+def __getattr__(name: str):
+    """延迟生成 PRECOMPUTED_NUMBERS，避免导入时构建整张表"""
+    if name == "PRECOMPUTED_NUMBERS":
+        if not _PRECOMPUTED_NUMBERS:
+            texts = get_group_texts()
+            with _INIT_LOCK:
+                if not _PRECOMPUTED_NUMBERS:
+                    _PRECOMPUTED_NUMBERS.update(enumerate(texts))
+        return _PRECOMPUTED_NUMBERS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def initialize_cache():
-    """初始化预计算缓存"""
+    """初始化预计算缓存（可选，未调用时在首次转换时自动完成，可在多个线程中同时调用）"""
     # 预计算0-9999的中文表示
-    for i in range(10000):
-        result = []
-        num_str = str(i).zfill(4)
-        last_is_zero = True
-        
-        for j, digit in enumerate(num_str):
-            digit_int = int(digit)
-            
-            if digit_int == 0:
-                if not last_is_zero and j < len(num_str) - 1 and any(int(d) > 0 for d in num_str[j+1:]):
-                    result.append(CHINESE_DIGITS[0])
-                last_is_zero = True
-                continue
-                
-            if digit_int > 0:
-                result.append(CHINESE_DIGITS[digit_int])
-                result.append(UNITS[4 - j - 1])
-                last_is_zero = False
-        
-        PRECOMPUTED_NUMBERS[i] = "".join(result)
-    
-    # 预计算单位组合
-    for unit in LARGE_UNITS:
-        UNIT_COMBINATIONS.append(unit)
-        for base_unit in UNITS:
-            if base_unit:
-                UNIT_COMBINATIONS.append(base_unit + unit)
-
-@lru_cache(maxsize=10000)
-def _convert_4digits_cached(num: int) -> str:
-    """带缓存的4位数转换"""
-    return PRECOMPUTED_NUMBERS.get(num, "")
-
-@lru_cache(maxsize=10000)
-def convert_integer_cached(num: int) -> str:
-    """带缓存的整数转换"""
+    get_group_texts()
+    
+    # 预计算单位组合，先在本地构建再一次性发布
+    if not UNIT_COMBINATIONS:
+        combinations = []
+        for unit in LARGE_UNITS:
+            combinations.append(unit)
+            for base_unit in UNITS:
+                if base_unit:
+                    combinations.append(base_unit + unit)
+        with _INIT_LOCK:
+            if not UNIT_COMBINATIONS:
+                UNIT_COMBINATIONS.extend(combinations)
+
+# 转换结果缓存，默认按整数部分缓存 10000 条
+_cache = ConversionCache()
+
+def configure_cache(maxsize: int = 10000, key_level: str = KEY_INTEGER,
+                    policy: str = POLICY_LRU, doorkeeper: bool = True,
+                    preload: Optional[str] = None) -> ConversionCache:
+    """
+    替换转换结果缓存
+    
+    Args:
+        maxsize: 最大条目数，0 表示不缓存
+        key_level: 缓存粒度：input（整个输入）、integer（整数部分）、group（万分组）
+        policy: 淘汰策略：lru 或 fifo
+        doorkeeper: 是否只缓存第二次未命中的键（避免随机金额冲刷缓存）
+        preload: 用 save_cache 保存的热点文件预热缓存
+    
+    Returns:
+        ConversionCache: 新的缓存
+    """
+    global _cache
+    cache = ConversionCache(maxsize=maxsize, key_level=key_level, policy=policy,
+                            doorkeeper=doorkeeper)
+    if preload:
+        cache.load(preload, _CACHE_COMPUTE[key_level])
+    _cache = cache
+    return cache
+
+def get_cache() -> ConversionCache:
+    """获取当前的转换结果缓存"""
+    return _cache
+
+def save_cache(path: str, limit: Optional[int] = None):
+    """
+    保存当前缓存的热点键，供 configure_cache(preload=...) 在启动时预热
+    
+    Args:
+        path: 输出路径
+        limit: 最多保存的键数
+    """
+    _cache.save(path, limit)
+
+def _group_text(key: Tuple[int, int]) -> str:
+    """分组缓存的计算函数：（分组位置, 分组数值）-> 带大单位的文本"""
+    position, group = key
+    return get_group_texts()[group] + LARGE_UNITS[position]
+
+def _convert_integer_grouped(num: int, cache: ConversionCache) -> str:
+    """按万分组缓存的整数转换，补零规则与 convert_integer 相同"""
     if num == 0:
         return CHINESE_DIGITS[0]
     
-    # 按4位分组处理
-    groups: List[int] = []
+    groups = []
     while num > 0:
-        groups.append(num % 10000)
-        num //= 10000
+        num, group = divmod(num, 10000)
+        groups.append(group)
     
+    flags = get_group_flags()
     result = []
-    for i, group in enumerate(groups):
+    zero_pending = False
+    for i in range(len(groups) - 1, -1, -1):
+        group = groups[i]
         if group == 0:
+            zero_pending = True
             continue
-        
-        # 使用预计算的结果
-        group_chinese = _convert_4digits_cached(group)
-        if group_chinese:
-            result.insert(0, group_chinese + LARGE_UNITS[i])
+        if result and (zero_pending or flags[group] & LEADING_ZERO):
+            result.append(CHINESE_DIGITS[0])
+        result.append(cache.get_or_compute((i, group), _group_text))
+        zero_pending = False
     
     return "".join(result)
 
+def _convert_integer_fast(num: int) -> str:
+    """
+    展开的三组（亿/万/个）整数转换，查表与补零规则与 convert_integer 相同
+    
+    超出亿级的数值交给 convert_integer 处理。
+    """
+    if num < 10000:
+        return get_group_texts()[num] or CHINESE_DIGITS[0]
+    if num >= 10 ** 12:
+        return convert_integer(num)
+    
+    texts = get_group_texts()
+    flags = get_group_flags()
+    zero = CHINESE_DIGITS[0]
+    
+    # 大单位直接拼接：预先构建带单位的文本表要两万多个字符串，首次调用的开销反而更大
+    high, g0 = divmod(num, 10000)
+    if high < 10000:
+        text = texts[high] + LARGE_UNITS[1]
+    else:
+        g2, g1 = divmod(high, 10000)
+        text = texts[g2] + LARGE_UNITS[2]
+        if g1:
+            if flags[g1] & LEADING_ZERO:
+                text += zero
+            text += texts[g1] + LARGE_UNITS[1]
+        elif g0:
+            # 万组全零
+            return text + zero + texts[g0]
+    if g0:
+        if flags[g0] & LEADING_ZERO:
+            text += zero
+        text += texts[g0]
+    return text
+
+def convert_integer_cached(num: int) -> str:
+    """带缓存的整数转换"""
+    cache = _cache
+    if cache.key_level == KEY_INTEGER:
+        return cache.get_or_compute(num, _convert_integer_fast)
+    if cache.key_level == KEY_GROUP:
+        return _convert_integer_grouped(num, cache)
+    return _convert_integer_fast(num)
+
 @lru_cache(maxsize=100)
 def convert_decimal_cached(jiao: int, fen: int) -> str:
     """带缓存的小数部分转换"""
@@ -90,27 +189,98 @@ def convert_decimal_cached(jiao: int, fen: int) -> str:
     
     return "".join(result)
 
-def convert_optimized(number: str) -> str:
-    """优化版的数字转换函数"""
+def _build_decimal_suffixes() -> List[str]:
+    """预计算"元"加角分部分的100种组合，下标为小数部分*100"""
+    suffixes = []
+    for decimal_part in range(100):
+        jiao, fen = divmod(decimal_part, 10)
+        decimal_chinese = convert_decimal_cached(jiao, fen)
+        suffixes.append("元" + decimal_chinese)
+    return suffixes
+
+_DECIMAL_SUFFIXES = _build_decimal_suffixes()
+
+def _assemble(integer_part: int, decimal_part: int) -> str:
+    """由整数部分和小数部分*100组合出完整金额"""
+    return convert_integer_cached(integer_part) + _DECIMAL_SUFFIXES[decimal_part]
+
+def _convert_uncached(number: str) -> str:
+    """解析并转换，不查询整个输入的缓存"""
     # 分离整数和小数部分
     integer_part, decimal_part = split_number(number)
-    
-    # 转换整数部分
+    return _assemble(integer_part, decimal_part)
+
+def _convert_instrumented(number: Amount, rounding: str = ROUNDING_DOWN) -> str:
+    """与 convert_optimized 相同，同时记录各阶段耗时与错误"""
+    start = perf_counter_ns()
+    try:
+        # 按整个输入缓存时各阶段不可分，只记录总耗时
+        if _cache.key_level == KEY_INPUT and rounding == ROUNDING_DOWN and type(number) is str:
+            result = _cache.get_or_compute(number, _convert_uncached)
+            stats.record("total", perf_counter_ns() - start)
+            return result
+        integer_part, decimal_part = split_value(number, rounding=rounding)
+    except ConversionError as e:
+        stats.record_error(e.code)
+        raise
+    parsed = perf_counter_ns()
     integer_chinese = convert_integer_cached(integer_part)
+    converted = perf_counter_ns()
+    result = integer_chinese + _DECIMAL_SUFFIXES[decimal_part]
+    end = perf_counter_ns()
+    stats.record("parse", parsed - start)
+    stats.record("integer", converted - parsed)
+    stats.record("assemble", end - converted)
+    stats.record("total", end - start)
+    return result
+
+def convert_optimized(number: Amount, rounding: str = ROUNDING_DOWN) -> str:
+    """
+    优化版的数字转换函数
+
+    Args:
+        number: 待转换的数字字符串，也可以是 int（元）、Decimal、float 或
+                ASCII 数字的 bytes / memoryview，见 parser.split_value
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES，默认截断
+    """
+    if stats.ENABLED:
+        return _convert_instrumented(number, rounding)
+    if rounding != ROUNDING_DOWN or type(number) is not str:
+        # 整个输入的缓存只保存字符串按截断方式的结果（0.29 与 Decimal(0.29) 相等但结果不同）
+        return _assemble(*split_value(number, rounding=rounding))
+    cache = _cache
+    if cache.key_level == KEY_INPUT:
+        return cache.get_or_compute(number, _convert_uncached)
+    return _convert_uncached(number)
+
+def convert_cents(cents: int) -> str:
+    """
+    转换以"分"为单位的整数金额，不经过字符串解析
     
-    # 转换小数部分
-    jiao = decimal_part // 10
-    fen = decimal_part % 10
-    decimal_chinese = convert_decimal_cached(jiao, fen)
+    Args:
+        cents: 分值，例如 12345 表示 123.45 元
     
-    # 组合结果
-    result = integer_chinese + "元"
-    if decimal_chinese != "整":
-        result += decimal_chinese
-    else:
-        result += "整"
+    Returns:
+        str: 转换后的中文大写金额
+    """
+    return _assemble(*divmod(validate_cents(cents), 100))
+
+def convert_decimal_value(value: Decimal, rounding: str = ROUNDING_DOWN) -> str:
+    """
+    转换 Decimal 金额，小数位数超过两位时按 rounding 舍入（默认截断），不经过字符串解析
     
-    return result
+    Args:
+        value: Decimal 金额
+        rounding: 舍入方式，见 validation.ROUNDING_MODES
+    
+    Returns:
+        str: 转换后的中文大写金额
+    """
+    return _assemble(*divmod(validate_decimal(value, rounding), 100))
 
-# 初始化缓存
-initialize_cache() 
\ No newline at end of file
+# 各缓存粒度下由键计算值的函数，用于预热
+_CACHE_COMPUTE = {
+    KEY_INPUT: _convert_uncached,
+    KEY_INTEGER: _convert_integer_fast,
+    KEY_GROUP: _group_text,
+}
@@ -1,17 +1,141 @@
 """
 数值解析模块 - 处理数字的分割与格式化
+
+split_number 解析数字字符串；split_value 按输入类型分派，int、Decimal 直接做数值的
+范围检查，bytes / bytearray / memoryview 中的ASCII数字不经解码直接解析。
+
+浮点数的约定：按其最短十进制表示（repr）解释，即 0.1 视为 0.10，而不是其二进制值
+0.1000000000000000055…；NaN、无穷大为格式错误，-0.0 为负数。需要精确金额时请传入
+Decimal、整数分值或字符串。
 """
-from decimal import Decimal, ROUND_DOWN
-from typing import Tuple
-from .validation import validate
+import operator
+from decimal import Decimal
+from functools import singledispatch
+from typing import Tuple, Union
+from .validation import (
+    MAX_INTEGER,
+    NEGATIVE_MESSAGE,
+    FORMAT_MESSAGE,
+    OVERFLOW_MESSAGE,
+    ROUNDING_DOWN,
+    STATUS_INVALID_FORMAT,
+    STATUS_NEGATIVE,
+    STATUS_OK,
+    STATUS_OVERFLOW,
+    InvalidFormatError,
+    NegativeNumberError,
+    OverflowError,
+    clamp_decimal,
+    round_fraction,
+    scan_decimal,
+)
+
+# split_value 接受的金额类型
+Amount = Union[str, int, Decimal, float, bytes, bytearray, memoryview]
+
+# 整数部分的最大位数（不含前导零）
+_MAX_INTEGER_DIGITS = len(str(MAX_INTEGER))
+
 
-def split_number(input_str: str) -> Tuple[int, int]:
+def _is_digits(s: Union[str, bytes]) -> bool:
+    """是否为非空的ASCII数字串"""
+    return s.isdigit() and s.isascii()
+
+
+def overflow_message(max_digits: int) -> str:
+    """整数部分超过 max_digits 位时的错误消息"""
+    if max_digits == _MAX_INTEGER_DIGITS:
+        return OVERFLOW_MESSAGE
+    return f'数字超出范围，整数部分不能超过{max_digits}位，小数部分会自动截断到两位'
+
+
+def _scan_digits(text: Union[str, bytes], max_digits: int,
+                 rounding: str) -> Tuple[int, int, int]:
+    """
+    scan_number、split_number 与字节串解析共用的单遍扫描
+
+    text 为 str 或 bytes，两者都只接受ASCII数字。整数部分按去掉前导零后的数字
+    转换，超长的前导零不会触发 int() 的位数上限。
+
+    Returns:
+        Tuple[int, int, int]: (状态码, 整数部分, 小数部分*100)，出错时两部分均为0
+    """
+    if type(text) is str:
+        minus, dot_char, zero = '-', '.', '0'
+    else:
+        minus, dot_char, zero = b'-', b'.', b'0'
+
+    if text.startswith(minus):
+        return STATUS_NEGATIVE, 0, 0
+
+    integer_str, dot, fraction_str = text.partition(dot_char)
+    if not _is_digits(integer_str) or (dot and not _is_digits(fraction_str)):
+        return STATUS_INVALID_FORMAT, 0, 0
+
+    # 先按位数判断，避免对超长输入做整数转换
+    integer_str = integer_str.lstrip(zero) or zero
+    if len(integer_str) > max_digits:
+        return STATUS_OVERFLOW, 0, 0
+
+    if rounding == ROUNDING_DOWN:
+        # 截断到两位小数，不足两位补零
+        decimal_part = int(fraction_str[:2].ljust(2, zero)) if dot else 0
+        return STATUS_OK, int(integer_str), decimal_part
+
+    if type(fraction_str) is not str:
+        fraction_str = fraction_str.decode('ascii')
+    # 舍入可能向整数部分进位，进位后再检查范围（999999999999.995 四舍五入后溢出）
+    integer_part, decimal_part = divmod(int(integer_str) * 100 + round_fraction(fraction_str, rounding), 100)
+    if integer_part >= 10 ** max_digits:
+        return STATUS_OVERFLOW, 0, 0
+    return STATUS_OK, integer_part, decimal_part
+
+
+def _raise_status(status: int, input_str: str, max_digits: int):
+    """把 _scan_digits 的错误状态转换为对应的 ConversionError"""
+    if status == STATUS_NEGATIVE:
+        raise NegativeNumberError('NEGATIVE_NUMBER', NEGATIVE_MESSAGE, input_str)
+    if status == STATUS_INVALID_FORMAT:
+        raise InvalidFormatError('INVALID_FORMAT', FORMAT_MESSAGE, input_str)
+    raise OverflowError('NUMBER_TOO_LARGE', overflow_message(max_digits), input_str)
+
+
+def scan_number(input_str: str, max_digits: int = _MAX_INTEGER_DIGITS,
+                rounding: str = ROUNDING_DOWN) -> Tuple[int, int, int]:
+    """
+    与 split_number 相同的单遍扫描，但不抛出异常，以状态码表示错误
+
+    Args:
+        input_str: 输入的数字字符串
+        max_digits: 整数部分的最大位数（不含前导零）
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        Tuple[int, int, int]: (状态码, 整数部分, 小数部分*100)，状态码见
+        validation.STATUS_CODES；出错时整数部分与小数部分均为0
+
+    Raises:
+        ValueError: 未知的舍入方式
+    """
+    if not isinstance(input_str, str):
+        input_str = str(input_str)
+    return _scan_digits(input_str, max_digits, rounding)
+
+
+def split_number(input_str: str, max_digits: int = _MAX_INTEGER_DIGITS,
+                 rounding: str = ROUNDING_DOWN) -> Tuple[int, int]:
     """
     处理输入的数字字符串，返回整数部分和小数部分
-    
+
+    单遍扫描完成验证与解析：检查符号、格式与范围，按 rounding 舍入到两位小数
+    （默认截断），全程只使用整数运算，不构造 Decimal。只接受ASCII数字。
+
     Args:
         input_str: 输入的数字字符串
-    
+        max_digits: 整数部分的最大位数（不含前导零），默认为千亿级的12位
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES，
+                  范围检查在舍入之后进行
+
     Returns:
         Tuple[int, int]: (整数部分, 小数部分*100)
         例如：
@@ -20,22 +144,135 @@ def split_number(input_str: str) -> Tuple[int, int]:
         "123" -> (123, 0)
         "123.456" -> (123, 45)  # 自动截断到两位小数
         "012.300" -> (12, 30)   # 自动清理多余的零
+        "0.125", rounding="half_even" -> (0, 12)
+
+    Raises:
+        InvalidFormatError: 格式错误
+        OverflowError: 数值超出范围
+        NegativeNumberError: 负数错误
+        ValueError: 未知的舍入方式
+    """
+    if not isinstance(input_str, str):
+        input_str = str(input_str)
+    status, integer_part, decimal_part = _scan_digits(input_str, max_digits, rounding)
+    if status:
+        _raise_status(status, input_str, max_digits)
+    return integer_part, decimal_part
+
+
+def _scan_integer(value: int, max_digits: int) -> Tuple[int, int, int]:
+    """整数元的范围检查"""
+    if value < 0:
+        return STATUS_NEGATIVE, 0, 0
+    if value >= 10 ** max_digits:
+        return STATUS_OVERFLOW, 0, 0
+    return STATUS_OK, value, 0
+
+
+@singledispatch
+def _scan_typed(value, max_digits: int, rounding: str) -> Tuple[int, int, int]:
+    """其他类型：实现了 __index__ 的整数类型（如 NumPy 整数）按整数处理，其余转为字符串"""
+    if hasattr(type(value), '__index__'):
+        return _scan_integer(operator.index(value), max_digits)
+    return scan_number(str(value), max_digits, rounding)
+
+
+@_scan_typed.register
+def _(value: str, max_digits: int, rounding: str) -> Tuple[int, int, int]:
+    return _scan_digits(value, max_digits, rounding)
+
+
+@_scan_typed.register
+def _(value: int, max_digits: int, rounding: str) -> Tuple[int, int, int]:
+    return _scan_integer(value, max_digits)
+
+
+@_scan_typed.register
+def _(value: bool, max_digits: int, rounding: str) -> Tuple[int, int, int]:
+    return STATUS_INVALID_FORMAT, 0, 0
+
+
+@_scan_typed.register
+def _(value: Decimal, max_digits: int, rounding: str) -> Tuple[int, int, int]:
+    if max_digits == _MAX_INTEGER_DIGITS:
+        status, cents = scan_decimal(value, rounding)
+        return (status,) + divmod(cents, 100)
+    # 扩展量程按定点字符串解析（NaN、无穷大同样是格式错误），指数极端的值先收敛，
+    # 以免展开成上亿位的字符串
+    if value.is_finite():
+        value = clamp_decimal(value, max_digits)
+    return _scan_digits(format(value, 'f'), max_digits, rounding)
+
+
+@_scan_typed.register
+def _(value: float, max_digits: int, rounding: str) -> Tuple[int, int, int]:
+    # 见模块说明：按最短十进制表示解释（NumPy 浮点数的 repr 带类型名，因此直接调用 float.__repr__）
+    return _scan_typed(Decimal(float.__repr__(value)), max_digits, rounding)
+
+
+@_scan_typed.register(bytes)
+@_scan_typed.register(bytearray)
+@_scan_typed.register(memoryview)
+def _(value: Union[bytes, bytearray, memoryview], max_digits: int,
+      rounding: str) -> Tuple[int, int, int]:
+    """ASCII数字的字节串，规则与 split_number 相同，不解码为字符串"""
+    return _scan_digits(value if type(value) is bytes else bytes(value), max_digits, rounding)
+
+
+def _error_input(value: Amount) -> str:
+    """错误信息中记录的输入文本"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode('ascii', 'backslashreplace')
+    return str(value)
+
+
+def split_value(value: Amount, max_digits: int = _MAX_INTEGER_DIGITS,
+                rounding: str = ROUNDING_DOWN) -> Tuple[int, int]:
+    """
+    按输入类型解析金额，返回整数部分和小数部分
+
+    Args:
+        value: 金额，支持以下类型：
+               str: 同 split_number
+               int: 整数元（不是分），直接检查范围；bool 为格式错误
+               Decimal: 数值检查范围并舍入到分
+               float: 按最短十进制表示解释，见模块说明
+               bytes / bytearray / memoryview: ASCII数字，规则同 split_number
+        max_digits: 整数部分的最大位数
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        Tuple[int, int]: (整数部分, 小数部分*100)
+
+    Raises:
+        InvalidFormatError: 格式错误
+        OverflowError: 数值超出范围
+        NegativeNumberError: 负数错误
+        ValueError: 未知的舍入方式
+    """
+    if type(value) is str:
+        return split_number(value, max_digits, rounding)
+    status, integer_part, decimal_part = scan_value(value, max_digits, rounding)
+    if status:
+        _raise_status(status, _error_input(value), max_digits)
+    return integer_part, decimal_part
+
+
+def scan_value(value: Amount, max_digits: int = _MAX_INTEGER_DIGITS,
+               rounding: str = ROUNDING_DOWN) -> Tuple[int, int, int]:
+    """
+    与 split_value 接受相同的输入类型，但以状态码表示错误
+
+    各类型都直接计算状态码，失败路径上不构造异常。
+
+    Returns:
+        Tuple[int, int, int]: (状态码, 整数部分, 小数部分*100)，见 scan_number
+
+    Raises:
+        ValueError: 未知的舍入方式
     """
-    # 首先验证输入
-    validate(input_str)
-    
-    # 转换为Decimal并截断到两位小数
-    number = Decimal(input_str)
-    number = number.quantize(Decimal('0.01'), rounding=ROUND_DOWN)
-    
-    # 规范化处理（移除不必要的零和小数点）
-    number_str = str(number.normalize())
-    if '.' in number_str and number_str.endswith('0'):
-        number_str = number_str.rstrip('0').rstrip('.')
-        number = Decimal(number_str)
-    
-    # 分离整数和小数部分
-    integer_part = int(number)
-    decimal_part = int((number % 1) * 100)
-    
-    return integer_part, decimal_part
\ No newline at end of file
+    if type(value) is str:
+        return _scan_digits(value, max_digits, rounding)
+    # 先按精确类型查注册表，子类（如 NumPy 浮点数）再按 MRO 分派
+    scanner = _scan_typed.registry.get(type(value)) or _scan_typed.dispatch(type(value))
+    return scanner(value, max_digits, rounding)
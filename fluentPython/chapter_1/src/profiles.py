@@ -0,0 +1,206 @@
+"""
+币种配置模块 - 不同币种、字形的大写金额
+
+每个 CurrencyProfile 描述一种写法：数字字形、位值单位、大单位、元角分的名称、
+无角分时的后缀（整/正）以及可选的币种前缀。查询表在首次使用时编译一次，
+之后在所有线程间共享；转换走与 batch.convert_many 相同的查表路径。
+
+内置配置:
+    CNY: 人民币，简体，元角分，"整"
+    HKD: 港币，繁体，元毫仙，"正"
+    TWD: 新台币，繁体，元角分，"整"
+    MOP: 澳门币，繁体，元毫仙，"正"
+
+用法:
+    convert_currency("123.45", "HKD")      # 港幣壹佰貳拾參元肆毫伍仙
+    get_profile("TWD").convert_many([100, 5])
+"""
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from .batch import (
+    Tables,
+    _as_int_array,
+    _convert_many_numpy,
+    _convert_many_python,
+    make_numpy_tables,
+    make_tables,
+)
+from .group_table import build_group_texts, get_group_texts
+from .parser import Amount, split_value
+from .symbols import CHINESE_DIGITS, LARGE_UNITS, UNITS
+from .validation import ROUNDING_DOWN
+
+# 繁体大写数字
+TRADITIONAL_DIGITS = {
+    0: "零", 1: "壹", 2: "貳", 3: "參", 4: "肆",
+    5: "伍", 6: "陸", 7: "柒", 8: "捌", 9: "玖"
+}
+
+TRADITIONAL_LARGE_UNITS = ["", "萬", "億"]
+
+
+class CurrencyProfile:
+    """一种币种与字形的写法，查询表延迟编译、线程间共享"""
+
+    def __init__(self, name: str, digits: Mapping[int, str] = CHINESE_DIGITS,
+                 units: Sequence[str] = UNITS, large_units: Sequence[str] = LARGE_UNITS,
+                 yuan: str = "元", jiao: str = "角", fen: str = "分", whole: str = "整",
+                 prefix: str = ""):
+        """
+        Args:
+            name: 配置名称，例如 "HKD"
+            digits: 0-9 的字形
+            units: 个、拾、佰、仟位的单位
+            large_units: 个、万、亿组的大单位
+            yuan / jiao / fen: 元、角（毫）、分（仙）的名称
+            whole: 没有角分时的后缀，例如"整"或"正"
+            prefix: 币种前缀，例如"港幣"
+
+        Raises:
+            ValueError: 字形或单位不完整
+        """
+        if sorted(digits) != list(range(10)):
+            raise ValueError(f"{name}: digits 必须包含 0-9 的字形")
+        if len(units) != 4 or len(large_units) != 3:
+            raise ValueError(f"{name}: units 需要4项，large_units 需要3项")
+        self.name = name
+        self.digits = dict(digits)
+        self.units = list(units)
+        self.large_units = list(large_units)
+        self.yuan = yuan
+        self.jiao = jiao
+        self.fen = fen
+        self.whole = whole
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._tables: Optional[Tables] = None
+        self._numpy_tables: Optional[tuple] = None
+
+    def __repr__(self) -> str:
+        return f"CurrencyProfile({self.name!r})"
+
+    def _group_texts(self) -> Sequence[str]:
+        # 与默认字形相同时直接复用（可能是预生成的）全局分组表
+        if self.digits == CHINESE_DIGITS and self.units == UNITS:
+            return get_group_texts()
+        return build_group_texts(self.digits, self.units)
+
+    def _decimal_texts(self) -> List[str]:
+        """0-99 分对应的"元"+角分文本"""
+        zero = self.digits[0]
+        texts = []
+        for cents in range(100):
+            jiao, fen = divmod(cents, 10)
+            text = self.yuan
+            if cents == 0:
+                text += self.whole
+            else:
+                text += self.digits[jiao] + self.jiao if jiao else zero
+                if fen:
+                    text += self.digits[fen] + self.fen
+            texts.append(text)
+        return texts
+
+    def tables(self) -> Tables:
+        """获取查询表，首次调用时编译（多个线程同时首次调用时只编译一次）"""
+        tables = self._tables
+        if tables is None:
+            with self._lock:
+                if self._tables is None:
+                    self._tables = make_tables(self._group_texts(), self.large_units,
+                                               self._decimal_texts())
+                tables = self._tables
+        return tables
+
+    def _get_numpy_tables(self) -> tuple:
+        tables = self._numpy_tables
+        if tables is None:
+            compiled = self.tables()
+            with self._lock:
+                if self._numpy_tables is None:
+                    self._numpy_tables = make_numpy_tables(compiled, self.digits[0])
+                tables = self._numpy_tables
+        return tables
+
+    def convert_many(self, cents: Sequence[int]) -> List[str]:
+        """
+        批量转换以"分"为单位的整数
+
+        Raises:
+            ConversionError: 含有不合法的分值
+        """
+        values = _as_int_array(cents)
+        if values is not None:
+            results = _convert_many_numpy(values, self._get_numpy_tables())
+        else:
+            results = _convert_many_python(cents, self.tables(), self.digits[0])
+        if self.prefix:
+            prefix = self.prefix
+            results = [prefix + text for text in results]
+        return results
+
+    def convert_cents(self, cents: int) -> str:
+        """转换以"分"为单位的整数"""
+        return self.prefix + _convert_many_python((cents,), self.tables(), self.digits[0])[0]
+
+    def convert(self, number: Amount, rounding: str = ROUNDING_DOWN) -> str:
+        """
+        将数字转换为该币种的大写金额
+
+        Args:
+            number: 待转换的数字，支持的类型见 parser.split_value
+            rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+        Raises:
+            ConversionError: 输入不合法
+        """
+        integer_part, decimal_part = split_value(number, rounding=rounding)
+        return self.prefix + _convert_many_python((integer_part * 100 + decimal_part,),
+                                                  self.tables(), self.digits[0])[0]
+
+
+PROFILES: Dict[str, CurrencyProfile] = {}
+
+
+def register_profile(profile: CurrencyProfile) -> CurrencyProfile:
+    """注册（或替换）一个币种配置"""
+    PROFILES[profile.name] = profile
+    return profile
+
+
+def get_profile(name: str) -> CurrencyProfile:
+    """
+    按名称获取币种配置
+
+    Raises:
+        ValueError: 未知的配置
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"未知的币种配置: {name}，可用: {', '.join(PROFILES)}") from None
+
+
+def convert_currency(number: Amount, currency: str = "CNY", rounding: str = ROUNDING_DOWN) -> str:
+    """
+    按币种配置转换
+
+    Args:
+        number: 待转换的数字字符串
+        currency: 配置名称，见 PROFILES
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        str: 转换后的大写金额
+    """
+    return get_profile(currency).convert(number, rounding)
+
+
+register_profile(CurrencyProfile("CNY"))
+register_profile(CurrencyProfile("HKD", TRADITIONAL_DIGITS, large_units=TRADITIONAL_LARGE_UNITS,
+                                 jiao="毫", fen="仙", whole="正", prefix="港幣"))
+register_profile(CurrencyProfile("TWD", TRADITIONAL_DIGITS, large_units=TRADITIONAL_LARGE_UNITS,
+                                 prefix="新臺幣"))
+register_profile(CurrencyProfile("MOP", TRADITIONAL_DIGITS, large_units=TRADITIONAL_LARGE_UNITS,
+                                 jiao="毫", fen="仙", whole="正", prefix="澳門幣"))
@@ -0,0 +1,143 @@
+"""
+字典编码的批量结果模块 - 相同金额的大写文本只保存一份
+
+实际账目中金额大量重复，逐行保存结果字符串会占用数 GB 内存。
+convert_unique 按分值去重后每个不同的金额只转换一次，结果保存为:
+    values: 去重后的大写文本列表
+    codes:  每行对应 values 下标的 array，按不同金额的个数选用 1/2/4/8 字节
+按行访问、迭代时才取出对应文本；安装 pyarrow / pandas 时可导出为字典列。
+"""
+from array import array
+from typing import Iterable, Iterator, List, Sequence, Union
+
+from .batch import _as_int_array, _convert_many_python, convert_many, np
+from .validation import validate_cents
+
+
+def _typecode(count: int) -> str:
+    """能容纳 count 个下标的最小无符号 array 类型"""
+    for typecode in ("B", "H", "I", "Q"):
+        if count <= 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError(f"不同金额过多: {count}")
+
+
+class ConversionColumn(Sequence):
+    """字典编码的大写金额列"""
+
+    def __init__(self, values: List[str], codes: array):
+        """
+        Args:
+            values: 去重后的大写文本
+            codes: 每行对应 values 的下标
+        """
+        self.values = values
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "ConversionColumn"]:
+        """按行取文本；切片返回共用同一份文本的新列"""
+        if isinstance(index, slice):
+            return ConversionColumn(self.values, self.codes[index])
+        return self.values[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.values.__getitem__, self.codes)
+
+    def __repr__(self) -> str:
+        return f"ConversionColumn(rows={len(self)}, unique={len(self.values)})"
+
+    def to_list(self) -> List[str]:
+        """展开为普通列表（每行引用同一个字符串对象，不复制文本）"""
+        return list(self)
+
+    def nbytes(self) -> int:
+        """
+        估算占用的内存
+
+        Returns:
+            int: 下标数组与去重文本的字节数
+        """
+        from sys import getsizeof
+        return (self.codes.itemsize * len(self.codes) + getsizeof(self.values)
+                + sum(getsizeof(value) for value in self.values))
+
+    def to_arrow(self):
+        """
+        导出为 pyarrow.DictionaryArray
+
+        Raises:
+            ImportError: 未安装 pyarrow
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("导出 Arrow 字典列需要安装 pyarrow") from None
+        # 下标数组直接作为 Arrow 缓冲区，不复制
+        index_type = getattr(pa, f"uint{self.codes.itemsize * 8}")()
+        indices = pa.Array.from_buffers(index_type, len(self.codes), [None, pa.py_buffer(self.codes)])
+        return pa.DictionaryArray.from_arrays(indices, pa.array(self.values, type=pa.string()))
+
+    def to_pandas(self):
+        """
+        导出为 category 类型的 pandas.Series
+
+        Raises:
+            ImportError: 未安装 pandas
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("导出 pandas 字典列需要安装 pandas") from None
+        # 同一文本只对应一个下标，可以直接作为类别
+        codes = np.frombuffer(self.codes, dtype=f"u{self.codes.itemsize}").astype(np.int64)
+        return pd.Series(pd.Categorical.from_codes(codes, self.values))
+
+
+def _unique_python(cents: Iterable[int]) -> ConversionColumn:
+    """纯 Python 实现的去重转换，单遍处理，下标数组从1字节开始按需加宽"""
+    index = {}
+    keys = []
+    codes = array("B")
+    limit = 1 << 8
+    append = codes.append
+    for value in cents:
+        # bool、float 与 int 哈希相同，只有真正的 int 才能直接作为键
+        key = value if type(value) is int else validate_cents(value)
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(keys)
+            keys.append(validate_cents(key))
+            if code >= limit:
+                codes = array(_typecode(code + 1), codes)
+                limit = 1 << (8 * codes.itemsize)
+                append = codes.append
+        append(code)
+    return ConversionColumn(_convert_many_python(keys), codes)
+
+
+def convert_unique(cents: Sequence[int]) -> ConversionColumn:
+    """
+    批量转换并按金额去重
+
+    Args:
+        cents: 分值序列，可以是 NumPy 整数数组或任意整数序列
+
+    Returns:
+        ConversionColumn: 与输入顺序一致的字典编码结果
+
+    Raises:
+        InvalidFormatError: 含有非整数元素
+        NegativeNumberError: 含有负数
+        OverflowError: 超出 999999999999.99 元
+    """
+    values = _as_int_array(cents)
+    if values is None:
+        return _unique_python(cents)
+    unique, inverse = np.unique(values, return_inverse=True)
+    texts = convert_many(unique)
+    codes = array(_typecode(len(texts)))
+    codes.frombytes(inverse.astype(f"u{codes.itemsize}").tobytes())
+    return ConversionColumn(texts, codes)
@@ -0,0 +1,194 @@
+"""
+反向解析模块 - 将中文大写金额解析回以"分"为单位的整数
+
+解析不使用正则回溯，而是按大单位逐段切分后查预先编译的表:
+    分组表:   0-9999 的分组文本 -> 数值（由 group_table 的正向表反转得到）
+    小数表:   "整"、"壹角"、"零伍分"等 100 种小数文本 -> 分
+组间的"零"按正向转换的规则校验，因此只接受 convert 的规范输出，
+例如"壹拾元整"可以解析，"拾元整"、"壹万零壹仟元整"会被拒绝。
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from .converter import convert_decimal
+from .group_table import LEADING_ZERO, get_group_flags, get_group_texts
+from .parser import Amount, split_value
+from .symbols import CHINESE_DIGITS, LARGE_UNITS
+from .validation import InvalidFormatError, validate_cents
+
+YUAN = "元"
+ZERO = CHINESE_DIGITS[0]
+
+# 错误消息
+UPPERCASE_MESSAGE = '大写金额格式错误，只接受规范的人民币大写金额，例如"壹佰贰拾叁元肆角伍分"'
+
+# 各大单位对应的倍数
+_SCALES = [10000 ** position for position in range(len(LARGE_UNITS))]
+
+_GROUP_VALUES: Optional[Dict[str, int]] = None
+_DECIMAL_VALUES: Optional[Dict[str, int]] = None
+
+# 保护上面两个表，保证并发初始化时只构建、发布一次
+_LOCK = threading.Lock()
+
+
+def _group_values() -> Dict[str, int]:
+    """分组文本 -> 数值（不含 0），首次调用时构建"""
+    global _GROUP_VALUES
+    values = _GROUP_VALUES
+    if values is None:
+        texts = get_group_texts()
+        with _LOCK:
+            if _GROUP_VALUES is None:
+                _GROUP_VALUES = {texts[value]: value for value in range(1, len(texts))}
+            values = _GROUP_VALUES
+    return values
+
+
+def _decimal_values() -> Dict[str, int]:
+    """小数文本 -> 分，首次调用时构建"""
+    global _DECIMAL_VALUES
+    values = _DECIMAL_VALUES
+    if values is None:
+        with _LOCK:
+            if _DECIMAL_VALUES is None:
+                _DECIMAL_VALUES = {
+                    convert_decimal(cents // 10, cents % 10): cents for cents in range(100)
+                }
+            values = _DECIMAL_VALUES
+    return values
+
+
+def _parse_integer(text: str) -> Optional[int]:
+    """
+    解析"元"之前的整数部分
+
+    Returns:
+        Optional[int]: 整数值，格式不规范时返回 None
+    """
+    if text == ZERO:
+        return 0
+
+    values = _group_values()
+    flags = get_group_flags()
+    total = 0
+    started = False
+    zero_pending = False
+    rest = text
+    for position in range(len(LARGE_UNITS) - 1, -1, -1):
+        if position:
+            head, sep, tail = rest.partition(LARGE_UNITS[position])
+            if not sep:
+                # 全零的组不出现，由下一个非零组补"零"
+                zero_pending = started
+                continue
+            rest = tail
+        else:
+            head = rest
+            if not head:
+                return total if started else None
+
+        leading = head[:1] == ZERO
+        value = values.get(head[1:] if leading else head)
+        if value is None:
+            return None
+        if leading != (started and (zero_pending or bool(flags[value] & LEADING_ZERO))):
+            return None
+        total += value * _SCALES[position]
+        started = True
+        zero_pending = False
+    return total
+
+
+def parse_amount(text: str) -> int:
+    """
+    将中文大写金额解析为以"分"为单位的整数
+
+    Args:
+        text: 大写金额，例如"壹佰贰拾叁元肆角伍分"
+
+    Returns:
+        int: 金额（分）
+
+    Raises:
+        InvalidFormatError: 不是规范的大写金额
+    """
+    if isinstance(text, str):
+        integer_text, sep, decimal_text = text.partition(YUAN)
+        cents = _decimal_values().get(decimal_text)
+        if sep and cents is not None:
+            integer = _parse_integer(integer_text)
+            if integer is not None:
+                return integer * 100 + cents
+    raise InvalidFormatError('INVALID_FORMAT', UPPERCASE_MESSAGE, str(text))
+
+
+def _matches(integer: int, cents: int, text: str) -> bool:
+    """先比较小数部分，不一致时直接返回，再逐组查表解析大写的整数部分与数值比较"""
+    if not isinstance(text, str):
+        return False
+    integer_text, sep, decimal_text = text.partition(YUAN)
+    if not sep or _decimal_values().get(decimal_text) != cents:
+        return False
+    return _parse_integer(integer_text) == integer
+
+
+def verify(amount: Amount, text: str) -> bool:
+    """
+    核对数字金额与大写金额是否一致
+
+    两边都不生成完整文本。amount 的解释与 convert 相同（见 parser.split_value），
+    整数表示"元"；以"分"为单位的整数请使用 verify_cents。
+
+    Args:
+        amount: 数字金额
+        text: 待核对的大写金额
+
+    Returns:
+        bool: 一致时返回 True，大写金额格式不规范时返回 False
+
+    Raises:
+        ConversionError: 数字金额不合法
+    """
+    integer, cents = split_value(amount)
+    return _matches(integer, cents, text)
+
+
+def verify_cents(cents: int, text: str) -> bool:
+    """
+    核对以"分"为单位的整数与大写金额是否一致
+
+    Args:
+        cents: 分值，范围检查同 validation.validate_cents
+        text: 待核对的大写金额
+
+    Returns:
+        bool: 一致时返回 True，大写金额格式不规范时返回 False
+
+    Raises:
+        ConversionError: 分值不合法
+    """
+    integer, cents = divmod(validate_cents(cents), 100)
+    return _matches(integer, cents, text)
+
+
+def verify_many(amounts: Iterable[Amount], texts: Iterable[str]) -> List[bool]:
+    """
+    批量核对
+
+    Args:
+        amounts: 数字金额序列，元素含义同 verify
+        texts: 与 amounts 一一对应的大写金额
+
+    Returns:
+        List[bool]: 每一对的核对结果
+
+    Raises:
+        ValueError: 两个序列长度不同
+        ConversionError: 数字金额不合法
+    """
+    amounts = list(amounts)
+    texts = list(texts)
+    if len(amounts) != len(texts):
+        raise ValueError(f"金额与大写的数量不一致: {len(amounts)} != {len(texts)}")
+    return [verify(amount, text) for amount, text in zip(amounts, texts)]
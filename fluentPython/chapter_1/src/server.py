@@ -0,0 +1,439 @@
+"""
+转换服务模块 - 基于 asyncio 的本地转换服务（仅依赖标准库）
+
+协议为按行分隔的 JSON（每行一个请求，每行一个响应，同一连接上的响应顺序与请求一致）:
+
+    单个转换   {"id": 1, "number": "123.45"}
+            -> {"id": 1, "result": "壹佰贰拾叁元肆角伍分"}
+    批量转换   {"id": 2, "numbers": ["1", "-1"]}
+            -> {"id": 2, "results": [{"result": "壹元整"},
+                                     {"error": {"code": "NEGATIVE_NUMBER", "message": "..."}}]}
+    出错       -> {"id": 1, "error": {"code": "INVALID_FORMAT", "message": "..."}}
+
+转换中意外的异常只影响引发它的请求（错误码 INTERNAL_ERROR），不会中断服务。
+
+各连接的请求进入同一个有界队列，由一个批处理任务取出已在队列中的请求，
+把其中的全部数字合并成一次 status.try_convert_many 调用；默认不为凑批而等待，
+空闲时单个请求没有额外延迟。队列满时停止读取新请求，由 TCP 流量控制把压力传回客户端。
+
+用法:
+    python -m src.server --port 8765
+    python -m src.server --unix /tmp/rmb.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client import check_socket_owner, ensure_socket_dir
+from .optimized_converter import initialize_cache
+from .status import try_convert, try_convert_many
+from .validation import STATUS_CODES, STATUS_MESSAGES
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 默认批处理参数
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY = 0.0
+DEFAULT_QUEUE_SIZE = 4096
+
+# 每个连接最多在途的请求数
+DEFAULT_PIPELINE = 1024
+
+# 单行请求的最大字节数
+MAX_LINE = 1 << 20
+
+
+def _as_text(number: Any) -> str:
+    """JSON 中的非字符串值按其 JSON 文本转换（null、数组等为格式错误）"""
+    return number if isinstance(number, str) else json.dumps(number)
+
+
+def _item(result: Optional[str], status: int) -> Dict[str, Any]:
+    if result is not None:
+        return {"result": result}
+    return {"error": {"code": STATUS_CODES[status], "message": STATUS_MESSAGES[status]}}
+
+
+def convert_item(number: Any) -> Dict[str, Any]:
+    """
+    转换单个数字，错误以字典形式返回
+
+    Returns:
+        Dict[str, Any]: {"result": ...} 或 {"error": {"code": ..., "message": ...}}
+    """
+    return _item(*try_convert(_as_text(number)))
+
+
+def _bad_request(message: str) -> Dict[str, Any]:
+    return {"error": {"code": "BAD_REQUEST", "message": message}}
+
+
+def handle_batch(requests: List[Any]) -> List[Dict[str, Any]]:
+    """
+    处理一批已解析的请求，其中的全部数字合并成一次批量转换
+
+    Returns:
+        List[Dict[str, Any]]: 与请求一一对应的响应内容（id 由调用方回填）
+    """
+    numbers: List[str] = []
+    # 每个请求对应的 (起始下标, 个数, 是否为批量请求)，或格式错误的响应
+    plans: List[Any] = []
+    for request in requests:
+        if not isinstance(request, dict):
+            plans.append(_bad_request("请求必须是JSON对象"))
+        elif "number" in request:
+            plans.append((len(numbers), 1, False))
+            numbers.append(_as_text(request["number"]))
+        elif "numbers" in request:
+            items = request["numbers"]
+            if not isinstance(items, list):
+                plans.append(_bad_request("numbers 必须是数组"))
+                continue
+            plans.append((len(numbers), len(items), True))
+            numbers.extend(_as_text(number) for number in items)
+        else:
+            plans.append(_bad_request("缺少 number 或 numbers 字段"))
+
+    results, statuses = try_convert_many(numbers)
+    responses = []
+    for plan in plans:
+        if isinstance(plan, dict):
+            responses.append(plan)
+            continue
+        start, count, many = plan
+        if many:
+            responses.append({"results": [_item(results[i], statuses[i])
+                                          for i in range(start, start + count)]})
+        else:
+            responses.append(_item(results[start], statuses[start]))
+    return responses
+
+
+def handle_request(request: Any) -> Dict[str, Any]:
+    """
+    处理一个已解析的请求（id 由调用方回填到响应中）
+
+    Returns:
+        Dict[str, Any]: 响应内容
+    """
+    return handle_batch([request])[0]
+
+
+def _handle_isolated(request: Any) -> Dict[str, Any]:
+    """单独处理一个请求，意外的异常转换为 INTERNAL_ERROR 响应"""
+    try:
+        return handle_request(request)
+    except Exception as e:
+        return {"error": {"code": "INTERNAL_ERROR", "message": f"{type(e).__name__}: {e}"}}
+
+
+async def _enqueue(pending: asyncio.Queue, item: Any, writer_task: asyncio.Future) -> bool:
+    """
+    放入连接的在途队列，队列满时等待写任务取走
+
+    写任务因连接断开退出后队列不再被消费，此时放弃等待，返回 False。
+    """
+    if writer_task.done():
+        return False
+    if not pending.full():
+        pending.put_nowait(item)
+        return True
+    put = asyncio.ensure_future(pending.put(item))
+    try:
+        await asyncio.wait((put, writer_task), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if not put.done():
+            put.cancel()
+    return not put.cancelled()
+
+
+class ConversionServer:
+    """合并并发请求、带背压的转换服务"""
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, max_delay: float = DEFAULT_MAX_DELAY,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, pipeline: int = DEFAULT_PIPELINE):
+        """
+        Args:
+            max_batch: 每批最多合并的请求数
+            max_delay: 凑批时最多等待的秒数，默认为0，即只合并已在队列中的请求
+            queue_size: 全局待处理队列的容量
+            pipeline: 每个连接最多在途的请求数
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue_size = queue_size
+        self.pipeline = pipeline
+        self.requests = 0
+        self.batches = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                    path: Optional[str] = None,
+                    sock: Optional[socket.socket] = None) -> asyncio.AbstractServer:
+        """
+        启动服务
+
+        Args:
+            host / port: TCP 地址，port 为 0 时由系统分配
+            path: Unix socket 路径，指定时忽略 host / port
+            sock: 已在监听的 socket（预派生的工作进程共用父进程的 socket）
+        """
+        initialize_cache()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._batcher = asyncio.ensure_future(self._run_batches())
+        if sock is not None:
+            if sock.family == socket.AF_UNIX:
+                self._server = await asyncio.start_unix_server(self._handle_connection, sock=sock,
+                                                               limit=MAX_LINE)
+            else:
+                self._server = await asyncio.start_server(self._handle_connection, sock=sock,
+                                                          limit=MAX_LINE)
+        elif path:
+            # asyncio 会直接删除路径上已有的 socket，先确认它属于当前用户
+            _prepare_socket_path(path)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=path,
+                                                           limit=MAX_LINE)
+            os.chmod(path, 0o600)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port,
+                                                      limit=MAX_LINE)
+        return self._server
+
+    async def close(self):
+        """停止服务"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, request: Any) -> Dict[str, Any]:
+        """提交一个请求，等待所在批次处理完成"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def _run_batches(self):
+        """批处理任务：取出一批请求，合并成一次批量转换后逐个完成"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch: List[Tuple[Any, asyncio.Future]] = [await queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+
+            self.batches += 1
+            self.requests += len(batch)
+            requests = [request for request, _ in batch]
+            try:
+                responses = handle_batch(requests)
+            except Exception:
+                # 逐个重试，只让出错的请求收到错误响应，批处理任务继续运行
+                responses = [_handle_isolated(request) for request in requests]
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """按行读取请求，按请求顺序写回响应"""
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline)
+        writer_task = asyncio.ensure_future(self._write_responses(pending, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    await _enqueue(pending, self._resolved(None, _bad_request("请求过长")),
+                                   writer_task)
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    item = self._resolved(None, _bad_request("无法解析的JSON"))
+                else:
+                    request_id = message.get("id") if isinstance(message, dict) else None
+                    item = (request_id, asyncio.ensure_future(self.submit(message)))
+                if not await _enqueue(pending, item, writer_task):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            try:
+                await _enqueue(pending, None, writer_task)
+                await writer_task
+            except asyncio.CancelledError:
+                writer_task.cancel()
+                raise
+
+    @staticmethod
+    def _resolved(request_id: Any, response: Dict[str, Any]):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(response)
+        return request_id, future
+
+    @staticmethod
+    async def _write_responses(pending: asyncio.Queue, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                request_id, future = item
+                response = await future
+                if request_id is not None:
+                    response = {"id": request_id, **response}
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                if pending.empty():
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, path: Optional[str] = None,
+                sock: Optional[socket.socket] = None, announce: bool = True, **options):
+    """启动服务并一直运行"""
+    server = ConversionServer(**options)
+    listener = await server.start(host, port, path, sock)
+    if announce:
+        address = path or ", ".join(str(s.getsockname()) for s in listener.sockets)
+        print(f"转换服务已启动: {address}", flush=True)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def _remove_stale_socket(path: str):
+    """
+    删除当前用户残留的 Unix socket 文件
+
+    Raises:
+        PermissionError: 路径上是普通文件，或是其他用户的 socket
+    """
+    try:
+        check_socket_owner(path)
+    except FileNotFoundError:
+        return
+    os.unlink(path)
+
+
+def _prepare_socket_path(path: str):
+    """创建默认的私有目录并删除残留的 socket"""
+    ensure_socket_dir(path)
+    _remove_stale_socket(path)
+
+
+def serve_prefork(path: str, workers: int, **options):
+    """
+    在 Unix socket 上以预派生的工作进程提供服务（仅限 POSIX）
+
+    父进程先完成表的初始化再 fork，工作进程以写时复制的方式共享这些表，
+    并共用同一个监听 socket；工作进程意外退出时自动补上，
+    父进程收到 SIGTERM / SIGINT 时结束全部工作进程并删除 socket 文件。
+
+    Args:
+        path: Unix socket 路径
+        workers: 工作进程数
+        **options: 传给 ConversionServer 的参数
+    """
+    _prepare_socket_path(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    os.chmod(path, 0o600)
+    listener.listen(socket.SOMAXCONN)
+    initialize_cache()
+
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                asyncio.run(serve(sock=listener, announce=False, **options))
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+    print(f"转换服务已启动: {path}（{workers} 个工作进程）", flush=True)
+
+    try:
+        while children:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+            children.discard(pid)
+            if not stopping:
+                spawn()
+    finally:
+        listener.close()
+        _remove_stale_socket(path)
+
+
+def main(argv: Optional[List[str]] = None):
+    """主函数"""
+    parser = argparse.ArgumentParser(prog="python -m src.server", description="人民币大写转换服务")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"监听地址（默认{DEFAULT_HOST}）")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"监听端口（默认{DEFAULT_PORT}）")
+    parser.add_argument("--unix", help="改为监听 Unix socket")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="每批最多合并的请求数")
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="凑批时最多等待的毫秒数")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE, help="待处理队列容量")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(
+            args.host, args.port, args.unix, max_batch=args.max_batch,
+            max_delay=args.max_delay_ms / 1000, queue_size=args.queue_size
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
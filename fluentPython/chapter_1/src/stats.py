@@ -0,0 +1,139 @@
+"""
+运行统计模块 - 可选的分阶段计数与延迟直方图
+
+默认关闭：各入口只检查一次 ENABLED 标志，关闭时不计时、不计数。
+开启方式: enable()，或设置环境变量 RMB_STATS=1。
+
+阶段:
+    validate: validation.validate
+    parse:    parser.split_number（含格式与范围检查）
+    integer:  整数部分转换（convert_optimized 中即 convert_integer_cached）
+    assemble: 小数部分转换与结果拼接
+    total:    一次完整转换
+延迟按 2 的幂分桶（纳秒），错误按 ConversionError.code 计数。
+统计只覆盖当前进程，多进程转换时各工作进程分别计数；计数不加锁，
+多线程并发记录时可能有少量丢失，统计结果应视为近似值。
+"""
+import os
+from collections import Counter
+from typing import Any, Dict, List
+
+STATS_ENV = "RMB_STATS"
+
+STAGES = ("validate", "parse", "integer", "assemble", "total")
+
+# 直方图桶数：第 i 个桶统计 [2^(i-1), 2^i) 纳秒，最后一个桶收纳更长的耗时
+BUCKETS = 40
+
+ENABLED = os.environ.get(STATS_ENV, "") not in ("", "0")
+
+
+class StageStats:
+    """单个阶段的调用次数、总耗时与延迟直方图"""
+
+    __slots__ = ("count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKETS
+
+    def add(self, elapsed_ns: int):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.buckets[min(elapsed_ns.bit_length(), BUCKETS - 1)] += 1
+
+    def percentile(self, fraction: float) -> int:
+        """由直方图估算分位数，返回所在桶的上界（纳秒）"""
+        if not self.count:
+            return 0
+        threshold = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= threshold:
+                return min(1 << index, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "p50_ns": self.percentile(0.50),
+            "p90_ns": self.percentile(0.90),
+            "p99_ns": self.percentile(0.99),
+            "max_ns": self.max_ns,
+            "histogram": [[1 << index, count] for index, count in enumerate(self.buckets) if count],
+        }
+
+
+_stages: Dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+_errors: Counter = Counter()
+
+
+def enable():
+    """开启统计"""
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    """关闭统计（已有数据保留）"""
+    global ENABLED
+    ENABLED = False
+
+
+def reset_stats():
+    """清空统计数据"""
+    for stage in STAGES:
+        _stages[stage] = StageStats()
+    _errors.clear()
+
+
+def record(stage: str, elapsed_ns: int):
+    """记录一个阶段的耗时"""
+    _stages[stage].add(elapsed_ns)
+
+
+def record_error(code: str):
+    """记录一次转换错误"""
+    _errors[code] += 1
+
+
+def get_stats() -> Dict[str, Any]:
+    """
+    获取运行统计
+
+    Returns:
+        Dict[str, Any]: enabled、各阶段统计（stages）、按错误码的计数（errors）
+        以及热点路径上转换结果缓存 ConversionCache 的命中情况（caches），
+        可直接序列化为 JSON
+    """
+    # 延迟导入，避免与转换模块循环导入
+    from . import optimized_converter
+
+    return {
+        "enabled": ENABLED,
+        "stages": {stage: _stages[stage].to_dict() for stage in STAGES},
+        "errors": dict(_errors),
+        "caches": {"conversion": optimized_converter.get_cache().stats()},
+    }
+
+
+def format_stats(stats: Dict[str, Any]) -> List[str]:
+    """将 get_stats 的结果格式化为便于阅读的文本行"""
+    lines = ["阶段        次数      平均(ns)    p50(ns)    p99(ns)    最大(ns)"]
+    for stage, data in stats["stages"].items():
+        if data["count"]:
+            lines.append(f"{stage:<10}{data['count']:>8}{data['mean_ns']:>12.0f}"
+                         f"{data['p50_ns']:>11}{data['p99_ns']:>11}{data['max_ns']:>12}")
+    for code, count in sorted(stats["errors"].items()):
+        lines.append(f"错误 {code}: {count}")
+    for name, data in stats["caches"].items():
+        lines.append(f"缓存 {name}: 命中率 {data['hit_rate']:.1%}"
+                     f"（命中 {data['hits']}，未命中 {data['misses']}）")
+    return lines
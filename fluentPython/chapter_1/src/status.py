@@ -0,0 +1,147 @@
+"""
+不抛异常的转换模块 - 以状态码代替异常
+
+批量数据中常有少量非法输入，逐个抛出 ConversionError 并格式化错误消息的开销
+比一次成功的转换还大，调用方也必须为每次调用包上 try/except。本模块的函数
+不构造异常：单个转换返回 (结果, 状态码)，批量转换返回结果列表与每行一个字节的
+状态数组 array('B')。状态码见 validation.STATUS_CODES，出错行的结果为 None。
+
+用法:
+    text, status = try_convert("123.45")
+    results, statuses = try_convert_many(lines)
+    print(count_statuses(statuses))         # {'INVALID_FORMAT': 3, ...}
+"""
+import operator
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .batch import _as_int_array, _convert_many_numpy, np
+from .optimized_converter import _assemble
+from .parser import Amount, scan_value
+from .validation import (
+    MAX_CENTS,
+    ROUNDING_DOWN,
+    STATUS_CODES,
+    STATUS_INVALID_FORMAT,
+    STATUS_NEGATIVE,
+    STATUS_OK,
+    STATUS_OVERFLOW,
+)
+
+
+def try_convert(number: Amount, rounding: str = ROUNDING_DOWN) -> Tuple[Optional[str], int]:
+    """
+    转换数字，不抛出 ConversionError
+
+    Args:
+        number: 待转换的数字，支持的类型与 convert 相同，见 parser.split_value
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        Tuple[Optional[str], int]: (中文大写金额, STATUS_OK)，
+        或出错时的 (None, 状态码)
+    """
+    status, integer_part, decimal_part = scan_value(number, rounding=rounding)
+    if status:
+        return None, status
+    return _assemble(integer_part, decimal_part), STATUS_OK
+
+
+def try_convert_many(numbers: Iterable[Amount],
+                     rounding: str = ROUNDING_DOWN) -> Tuple[List[Optional[str]], array]:
+    """
+    批量转换数字，不抛出 ConversionError
+
+    Args:
+        numbers: 数字序列，元素类型见 parser.split_value
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        Tuple[List[Optional[str]], array]: 与输入顺序一致的结果列表（出错行为 None）
+        与状态数组 array('B')
+    """
+    results = []
+    statuses = array("B")
+    append_result = results.append
+    append_status = statuses.append
+    for number in numbers:
+        status, integer_part, decimal_part = scan_value(number, rounding=rounding)
+        append_status(status)
+        append_result(None if status else _assemble(integer_part, decimal_part))
+    return results, statuses
+
+
+def _cents_status(cents: int) -> Tuple[int, int]:
+    """与 validate_cents 相同的检查，返回 (状态码, 分值)"""
+    if type(cents) is not int:
+        if isinstance(cents, bool):
+            return STATUS_INVALID_FORMAT, 0
+        try:
+            cents = operator.index(cents)
+        except TypeError:
+            return STATUS_INVALID_FORMAT, 0
+    if cents < 0:
+        return STATUS_NEGATIVE, 0
+    if cents > MAX_CENTS:
+        return STATUS_OVERFLOW, 0
+    return STATUS_OK, cents
+
+
+def _try_convert_cents_numpy(values) -> Tuple[List[Optional[str]], array]:
+    """向量化计算状态，只转换合法的行"""
+    codes = np.zeros(len(values), dtype=np.uint8)
+    codes[values > MAX_CENTS] = STATUS_OVERFLOW
+    if values.dtype.kind == "i":
+        codes[values < 0] = STATUS_NEGATIVE
+    statuses = array("B")
+    statuses.frombytes(codes.tobytes())
+
+    valid = codes == STATUS_OK
+    if valid.all():
+        return _convert_many_numpy(values), statuses
+    results = np.full(len(values), None, dtype=object)
+    results[valid] = _convert_many_numpy(values[valid])
+    return results.tolist(), statuses
+
+
+def try_convert_cents(cents: Sequence[int]) -> Tuple[List[Optional[str]], array]:
+    """
+    批量转换以"分"为单位的整数，不抛出 ConversionError
+
+    Args:
+        cents: 分值序列，可以是 NumPy 整数数组或任意序列；非整数元素的状态为
+               INVALID_FORMAT
+
+    Returns:
+        Tuple[List[Optional[str]], array]: 与输入顺序一致的结果列表（出错行为 None）
+        与状态数组 array('B')
+    """
+    values = _as_int_array(cents)
+    if values is not None:
+        return _try_convert_cents_numpy(values)
+
+    results = []
+    statuses = array("B")
+    append_result = results.append
+    append_status = statuses.append
+    for value in cents:
+        status, value = _cents_status(value)
+        append_status(status)
+        append_result(None if status else _assemble(*divmod(value, 100)))
+    return results, statuses
+
+
+def count_statuses(statuses: array) -> Dict[str, int]:
+    """
+    统计状态数组中各错误码的行数
+
+    Returns:
+        Dict[str, int]: 错误码到行数的映射，不含成功的行和未出现的错误码
+    """
+    data = statuses.tobytes()
+    counts = {}
+    for status in range(STATUS_OK + 1, len(STATUS_CODES)):
+        count = data.count(status)
+        if count:
+            counts[STATUS_CODES[status]] = count
+    return counts
@@ -0,0 +1,18 @@
+"""
+字符映射表模块 - 中文大写数字与单位
+"""
+
+# 数字到中文大写的映射
+CHINESE_DIGITS = {
+    0: "零", 1: "壹", 2: "贰", 3: "叁", 4: "肆",
+    5: "伍", 6: "陆", 7: "柒", 8: "捌", 9: "玖"
+}
+
+# 位值单位
+UNITS = ["", "拾", "佰", "仟"]
+
+# 大单位
+LARGE_UNITS = ["", "万", "亿"]
+
+# 扩展量程的大单位（万进制，每级为上一级的一万倍）
+EXTENDED_LARGE_UNITS = ["", "万", "亿", "兆", "京", "垓", "秭", "穰"]
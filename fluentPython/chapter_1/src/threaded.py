@@ -0,0 +1,106 @@
+"""
+多线程批量转换模块 - 在一个进程内用线程池并行转换
+
+转换路径只读取发布后不再修改的查询表（分组表、角分后缀、批量查询表），
+不经过共享的结果缓存，线程之间没有锁竞争。在自由线程（无 GIL）的 CPython 3.13t
+上吞吐随线程数增长；在有 GIL 的解释器上纯 Python 代码只能交替执行，吞吐与单线程
+相当，此时多核并行请使用 cli 的 --workers 或 csv_column 的进程池。
+
+用法:
+    convert_many_threaded(amounts, workers=8)
+
+    with ThreadPoolExecutor(8) as executor:       # 复用线程池，省去每次创建线程的开销
+        convert_cents_threaded(cents, executor=executor)
+
+扩展测试: python -m src.bench --threads 8
+"""
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, List, Optional, Sequence
+
+from .batch import convert_many
+from .optimized_converter import _DECIMAL_SUFFIXES, _convert_integer_fast
+from .parser import Amount, split_value
+from .validation import ROUNDING_DOWN
+
+# 每个任务包含的输入个数
+DEFAULT_CHUNK_SIZE = 2048
+
+
+def convert_uncached(number: Amount, rounding: str = ROUNDING_DOWN) -> str:
+    """
+    与 convert_optimized 结果相同，但不读写结果缓存（只读取不可变的查询表）
+
+    Raises:
+        ConversionError: 输入不合法
+    """
+    integer_part, decimal_part = split_value(number, rounding=rounding)
+    return _convert_integer_fast(integer_part) + _DECIMAL_SUFFIXES[decimal_part]
+
+
+def _map_chunks(func: Callable[[Sequence], List[str]], items: Sequence, workers: Optional[int],
+                chunk_size: int, executor: Optional[Executor]) -> List[str]:
+    """按块分派给线程池，按输入顺序合并结果"""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size 必须为正数: {chunk_size}")
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    if executor is not None:
+        parts = executor.map(func, chunks)
+    elif len(chunks) <= 1 or workers == 1:
+        parts = map(func, chunks)
+    else:
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            parts = list(pool.map(func, chunks))
+    return list(chain.from_iterable(parts))
+
+
+def convert_many_threaded(numbers: Sequence[Amount], workers: Optional[int] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          executor: Optional[Executor] = None,
+                          rounding: str = ROUNDING_DOWN) -> List[str]:
+    """
+    用线程池批量转换金额
+
+    Args:
+        numbers: 金额序列，元素类型见 parser.split_value
+        workers: 线程数，默认为 CPU 核数；传入 executor 时忽略
+        chunk_size: 每个任务包含的输入个数
+        executor: 复用的线程池，默认每次调用创建临时线程池
+        rounding: 小数超过两位时的舍入方式，见 validation.ROUNDING_MODES
+
+    Returns:
+        List[str]: 与输入顺序一致的中文大写金额
+
+    Raises:
+        ConversionError: 含有不合法的输入（按输入顺序第一个出错的块）
+        ValueError: chunk_size 不是正数
+    """
+    def convert_chunk(chunk: Sequence[Amount]) -> List[str]:
+        return [convert_uncached(number, rounding) for number in chunk]
+
+    if not isinstance(numbers, Sequence):
+        numbers = list(numbers)
+    return _map_chunks(convert_chunk, numbers, workers, chunk_size, executor)
+
+
+def convert_cents_threaded(cents: Sequence[int], workers: Optional[int] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           executor: Optional[Executor] = None) -> List[str]:
+    """
+    用线程池批量转换以"分"为单位的整数，每块走 batch.convert_many 的查表路径
+
+    Args:
+        cents: 分值序列，可以是 NumPy 整数数组
+        workers / chunk_size / executor: 见 convert_many_threaded
+
+    Returns:
+        List[str]: 与输入顺序一致的中文大写金额
+
+    Raises:
+        ConversionError: 含有不合法的分值
+        ValueError: chunk_size 不是正数
+    """
+    if not hasattr(cents, "__getitem__"):
+        cents = list(cents)
+    return _map_chunks(convert_many, cents, workers, chunk_size, executor)
@@ -1,9 +1,37 @@
 """
 输入验证模块 - 处理数字输入的合法性检查
 """
-import re
-from decimal import Decimal, ROUND_DOWN
-from typing import Union
+import operator
+from decimal import Decimal
+from time import perf_counter_ns
+from typing import Any, Tuple
+
+from . import stats
+
+# 金额上限（整数部分与以分为单位的数值）
+MAX_INTEGER = 999999999999
+MAX_CENTS = MAX_INTEGER * 100 + 99
+_MAX_INTEGER_DIGITS = len(str(MAX_INTEGER))
+
+# 错误消息
+NEGATIVE_MESSAGE = '不支持负数转换'
+FORMAT_MESSAGE = '数字格式错误，只能包含数字和小数点，小数位数超过两位将自动截断'
+OVERFLOW_MESSAGE = '数字超出范围，整数部分不能超过999999999999（千亿），小数部分会自动截断到两位'
+
+# 小数超过两位时舍入到分的方式
+ROUNDING_DOWN = 'down'            # 截断（默认）
+ROUNDING_HALF_UP = 'half_up'      # 四舍五入
+ROUNDING_HALF_EVEN = 'half_even'  # 银行家舍入（四舍六入五成双）
+ROUNDING_UP = 'up'                # 有余数即进一分
+ROUNDING_MODES = (ROUNDING_DOWN, ROUNDING_HALF_UP, ROUNDING_HALF_EVEN, ROUNDING_UP)
+
+# 不抛异常的批量接口使用的行状态，下标与 STATUS_CODES 中的错误码一一对应
+STATUS_OK = 0
+STATUS_INVALID_FORMAT = 1
+STATUS_NEGATIVE = 2
+STATUS_OVERFLOW = 3
+STATUS_CODES = ('OK', 'INVALID_FORMAT', 'NEGATIVE_NUMBER', 'NUMBER_TOO_LARGE')
+STATUS_MESSAGES = ('', FORMAT_MESSAGE, NEGATIVE_MESSAGE, OVERFLOW_MESSAGE)
 
 class ConversionError(Exception):
     """转换错误基类"""
@@ -25,12 +53,65 @@ class OverflowError(ConversionError):
     """数值溢出错误"""
     pass
 
-def validate(number: Union[str, float, int]) -> bool:
+def _check_rounding(rounding: str):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"未知的舍入方式: {rounding}，可用: {', '.join(ROUNDING_MODES)}")
+
+def round_ratio(numerator: int, denominator: int, rounding: str = ROUNDING_DOWN) -> int:
+    """
+    将非负分数 numerator / denominator 舍入为整数，只用整数运算
+
+    Raises:
+        ValueError: 未知的舍入方式
+    """
+    _check_rounding(rounding)
+    quotient, remainder = divmod(numerator, denominator)
+    if not remainder or rounding == ROUNDING_DOWN:
+        return quotient
+    if rounding == ROUNDING_UP:
+        return quotient + 1
+    twice = remainder * 2
+    if twice > denominator or (twice == denominator and (rounding == ROUNDING_HALF_UP or quotient & 1)):
+        return quotient + 1
+    return quotient
+
+def round_fraction(fraction_str: str, rounding: str = ROUNDING_DOWN) -> int:
+    """
+    将小数部分的ASCII数字串舍入到分，只做字符比较与整数运算
+
+    Args:
+        fraction_str: 小数点后的数字串，可以为空
+        rounding: 舍入方式，见 ROUNDING_MODES
+
+    Returns:
+        int: 0-100 的分值，100 表示需要向整数部分进一
+
+    Raises:
+        ValueError: 未知的舍入方式
+    """
+    _check_rounding(rounding)
+    cents = int(fraction_str[:2].ljust(2, '0')) if fraction_str else 0
+    rest = fraction_str[2:].rstrip('0')
+    if not rest or rounding == ROUNDING_DOWN:
+        return cents
+    if rounding == ROUNDING_UP:
+        return cents + 1
+    first = rest[0]
+    if first < '5':
+        return cents
+    if first > '5' or len(rest) > 1 or rounding == ROUNDING_HALF_UP:
+        return cents + 1
+    # 恰好为一半：五成双
+    return cents + (cents & 1)
+
+def validate(number: Any, rounding: str = ROUNDING_DOWN) -> bool:
     """
     验证输入数字的合法性
     
     Args:
-        number: 输入的数字（字符串或数字类型）
+        number: 输入的数字，与转换入口使用同一解析器（parser.split_value）检查：
+                字符串只接受ASCII数字，int、Decimal、float、bytes 等类型不转为字符串
+        rounding: 小数超过两位时的舍入方式，范围检查在舍入之后进行
     
     Returns:
         bool: 是否合法
@@ -40,35 +121,128 @@ def validate(number: Union[str, float, int]) -> bool:
         OverflowError: 数值超出范围
         NegativeNumberError: 负数错误
     """
-    # 转换为字符串进行处理
-    number_str = str(number)
-    
-    # 检查负数
-    if number_str.startswith('-'):
-        raise NegativeNumberError(
-            'NEGATIVE_NUMBER',
-            '不支持负数转换',
-            number_str
-        )
-    
-    # 格式检查 - 修改正则表达式以允许任意位数的小数
-    pattern = r'^\d+(\.\d+)?$'
-    if not re.match(pattern, number_str):
-        raise InvalidFormatError(
-            'INVALID_FORMAT',
-            '数字格式错误，只能包含数字和小数点，小数位数超过两位将自动截断',
-            number_str
-        )
-    
-    # 范围检查
-    value = Decimal(number_str)
-    # 先截断到两位小数
-    value = value.quantize(Decimal('0.01'), rounding=ROUND_DOWN)
-    if value > Decimal('999999999999.99'):
-        raise OverflowError(
-            'NUMBER_TOO_LARGE',
-            '数字超出范围，整数部分不能超过999999999999（千亿），小数部分会自动截断到两位',
-            number_str
-        )
-    
-    return True 
\ No newline at end of file
+    if stats.ENABLED:
+        start = perf_counter_ns()
+        try:
+            return _validate(number, rounding)
+        except ConversionError as e:
+            stats.record_error(e.code)
+            raise
+        finally:
+            stats.record("validate", perf_counter_ns() - start)
+    return _validate(number, rounding)
+
+def _validate(number: Any, rounding: str = ROUNDING_DOWN) -> bool:
+    """validate 的实现：与转换使用同一个解析器，两者的判断始终一致"""
+    # 延迟导入，parser 依赖本模块
+    from .parser import split_value
+    split_value(number, rounding=rounding)
+    return True
+
+def validate_cents(cents: int, max_cents: int = MAX_CENTS,
+                   overflow_message: str = OVERFLOW_MESSAGE) -> int:
+    """
+    验证以"分"为单位的整数金额
+
+    Args:
+        cents: 分值，接受 int 及实现了 __index__ 的整数类型（如 NumPy 整数）
+        max_cents: 允许的最大分值，默认为 999999999999.99 元
+        overflow_message: 超出 max_cents 时的错误消息
+
+    Returns:
+        int: 转换为 int 的分值
+
+    Raises:
+        InvalidFormatError: 非整数（包括布尔值和浮点数）
+        OverflowError: 超出 max_cents
+        NegativeNumberError: 负数
+    """
+    if isinstance(cents, bool):
+        raise InvalidFormatError('INVALID_FORMAT', FORMAT_MESSAGE, str(cents))
+    try:
+        value = operator.index(cents)
+    except TypeError:
+        raise InvalidFormatError('INVALID_FORMAT', FORMAT_MESSAGE, str(cents)) from None
+    if value < 0:
+        raise NegativeNumberError('NEGATIVE_NUMBER', NEGATIVE_MESSAGE, str(cents))
+    if value > max_cents:
+        raise OverflowError('NUMBER_TOO_LARGE', overflow_message, str(cents))
+    return value
+
+def clamp_decimal(value: Decimal, max_digits: int = _MAX_INTEGER_DIGITS) -> Decimal:
+    """
+    将指数极端的 Decimal 换成位数有限、舍入与范围检查结果都相同的值
+
+    Decimal("1E+999999999") 与 Decimal("1E-999999999") 求分数或展开为定点字符串
+    都需要上亿位的运算，应先调用本函数。
+
+    Args:
+        value: 有限的 Decimal
+        max_digits: 整数部分的最大位数
+
+    Returns:
+        Decimal: 整数部分超过 max_digits 位时为 10 ** max_digits，低于 0.001 的非零值为
+                 0.0001（各舍入方式到分的结果相同），零为不带指数的 0；符号不变，其余原样返回
+    """
+    if not value:
+        return Decimal(0).copy_sign(value)
+    adjusted = value.adjusted()
+    if adjusted >= max_digits:
+        return Decimal(1).scaleb(max_digits).copy_sign(value)
+    if adjusted < -3:
+        return Decimal(1).scaleb(-4).copy_sign(value)
+    return value
+
+def scan_decimal(value: Decimal, rounding: str = ROUNDING_DOWN) -> Tuple[int, int]:
+    """
+    与 validate_decimal 相同的检查与舍入，但不抛出异常，以状态码表示错误
+
+    Returns:
+        Tuple[int, int]: (状态码, 以"分"为单位的金额)，状态码见 STATUS_CODES，出错时分值为0
+
+    Raises:
+        ValueError: 未知的舍入方式
+    """
+    if not value.is_finite():
+        return STATUS_INVALID_FORMAT, 0
+    if value.is_signed():
+        return STATUS_NEGATIVE, 0
+    # 先按数量级判断，避免对指数极端的值求分数
+    if value and value.adjusted() >= _MAX_INTEGER_DIGITS:
+        return STATUS_OVERFLOW, 0
+    # 按精确的分数舍入，不受 Decimal 上下文精度影响
+    numerator, denominator = clamp_decimal(value).as_integer_ratio()
+    if rounding == ROUNDING_DOWN:
+        cents = numerator * 100 // denominator
+    else:
+        cents = round_ratio(numerator * 100, denominator, rounding)
+    if cents > MAX_CENTS:
+        return STATUS_OVERFLOW, 0
+    return STATUS_OK, cents
+
+
+def validate_decimal(value: Decimal, rounding: str = ROUNDING_DOWN) -> int:
+    """
+    验证 Decimal 金额并舍入到分
+
+    Args:
+        value: Decimal 金额
+        rounding: 小数位数超过两位时的舍入方式，默认截断
+
+    Returns:
+        int: 以"分"为单位的金额
+
+    Raises:
+        InvalidFormatError: NaN 或无穷大
+        OverflowError: 超出 999999999999.99 元（舍入之后）
+        NegativeNumberError: 负数（包括 -0）
+        ValueError: 未知的舍入方式
+    """
+    status, cents = scan_decimal(value, rounding)
+    if status == STATUS_INVALID_FORMAT:
+        raise InvalidFormatError('INVALID_FORMAT', FORMAT_MESSAGE, str(value))
+    if status == STATUS_NEGATIVE:
+        raise NegativeNumberError('NEGATIVE_NUMBER', NEGATIVE_MESSAGE, str(value))
+    if status == STATUS_OVERFLOW:
+        raise OverflowError('NUMBER_TOO_LARGE', OVERFLOW_MESSAGE, str(value))
+    return cents
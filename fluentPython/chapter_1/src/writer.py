@@ -0,0 +1,274 @@
+"""
+编码输出模块 - 将以"分"为单位的整数直接写成指定编码的字节
+
+查询表按编码预先编码为 bytes 并缓存，每行只是几段现成字节的拼接，
+不再生成中间字符串、也不再逐行 encode:
+    安装 NumPy 时向量化地计算下标并取出各段，整块一次 join 后写出；
+    否则逐行把各段拷贝进预先分配的缓冲区。
+支持 UTF-8、GBK、GB18030 等能表示人民币大写字符的编码。
+
+定长记录:
+    指定 record_size 时每行占用固定字节数（含换行符），不足部分用 pad 填充，
+    第 i 行位于偏移 i * record_size，可直接随机访问（见 read_record）。
+"""
+import codecs
+import threading
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .batch import _as_int_array, _build_tables, _numpy_indices, np
+from .converter import CHINESE_DIGITS
+from .validation import validate_cents
+
+DEFAULT_ENCODING = "utf-8"
+
+# 写文件时每块包含的行数
+DEFAULT_CHUNK_ROWS = 4096
+
+# 按编码名缓存的字节表
+_ENCODED: Dict[str, Tuple[List[bytes], List[bytes], List[bytes], List[bytes]]] = {}
+_NUMPY_ENCODED: Dict[str, tuple] = {}
+
+# 保护上面两个表，保证并发初始化时每种编码只构建、发布一次
+_LOCK = threading.Lock()
+
+
+def _encoded_tables(encoding: str) -> Tuple[List[bytes], List[bytes], List[bytes], List[bytes]]:
+    """
+    获取指定编码的字节表，首次使用时构建
+
+    Returns:
+        Tuple: (亿组, 万组, 个组, "元"+角分)
+        万组与个组各附带一份前面补"零"的版本（下标加 10000），
+        个组表下标 20000 为整数部分为零时的"零"
+    """
+    name = codecs.lookup(encoding).name
+    tables = _ENCODED.get(name)
+    if tables is None:
+        groups, wan, yi, decimals = _build_tables()
+        with _LOCK:
+            tables = _ENCODED.get(name)
+            if tables is None:
+                zero = CHINESE_DIGITS[0]
+                texts = (
+                    yi,
+                    wan + [zero + text for text in wan],
+                    groups + [zero + text for text in groups] + [zero],
+                    decimals,
+                )
+                tables = tuple([text.encode(name) for text in table] for table in texts)
+                _ENCODED[name] = tables
+    return tables
+
+
+def max_row_bytes(encoding: str = DEFAULT_ENCODING, newline: bytes = b"\n") -> int:
+    """
+    一行（含换行符）可能占用的最大字节数，可用作 record_size
+
+    Args:
+        encoding: 输出编码
+        newline: 行尾
+
+    Returns:
+        int: 字节数
+    """
+    return sum(max(map(len, table)) for table in _encoded_tables(encoding)) + len(newline)
+
+
+def _numpy_encoded(encoding: str) -> tuple:
+    """字节表的 NumPy 版本：((亿组, 万组, 个组, 角分) 对象数组, 对应的字节长度数组)"""
+    name = codecs.lookup(encoding).name
+    tables = _NUMPY_ENCODED.get(name)
+    if tables is None:
+        # 在加锁之前取得字节表，_encoded_tables 自身也需要这把锁
+        encoded = _encoded_tables(name)
+        with _LOCK:
+            tables = _NUMPY_ENCODED.get(name)
+            if tables is None:
+                tables = (
+                    tuple(np.array(table, dtype=object) for table in encoded),
+                    tuple(np.array([len(piece) for piece in table], dtype=np.int64)
+                          for table in encoded),
+                )
+                _NUMPY_ENCODED[name] = tables
+    return tables
+
+
+def _encode_numpy(values, encoding: str, record_size: Optional[int],
+                  newline: bytes, pad: bytes) -> bytes:
+    """向量化取出每行的各段字节，整块拼接一次"""
+    (yi, wan, groups, decimals), lengths = _numpy_encoded(encoding)
+    g2, g1, g0, rest = indices = _numpy_indices(values)
+    pieces = np.empty((len(values), 5), dtype=object)
+    pieces[:, 0] = yi[g2]
+    pieces[:, 1] = wan[g1]
+    pieces[:, 2] = groups[g0]
+    pieces[:, 3] = decimals[rest]
+    if record_size is None:
+        pieces[:, 4] = newline
+    else:
+        template = _record_template(record_size, newline, pad)
+        limit = record_size - len(newline)
+        row_lengths = sum(length[index] for length, index in zip(lengths, indices))
+        if len(values) and row_lengths.max() > limit:
+            row = int(np.argmax(row_lengths > limit))
+            raise ValueError(
+                f"第 {row} 行需要 {int(row_lengths[row])} 字节，超出定长记录 {record_size} 字节"
+            )
+        # 行尾按本行长度取对应长度的填充 + 换行
+        tails = np.array([template[length:] for length in range(limit + 1)], dtype=object)
+        pieces[:, 4] = tails[row_lengths]
+    return b"".join(pieces.ravel().tolist())
+
+
+def _record_template(record_size: int, newline: bytes, pad: bytes) -> bytes:
+    if len(pad) != 1:
+        raise ValueError(f"pad 必须是单个字节: {pad!r}")
+    if record_size <= len(newline):
+        raise ValueError(f"record_size 过小: {record_size}")
+    return pad * (record_size - len(newline)) + newline
+
+
+def _python_indices(cents: Iterable[int]) -> Iterator[Tuple[int, int, int, int]]:
+    """逐个计算每行在字节表中的下标，布局同 batch._numpy_indices"""
+    for value in cents:
+        yuan, rest = divmod(validate_cents(value), 100)
+        high, g0 = divmod(yuan, 10000)
+        g2, g1 = divmod(high, 10000)
+        if yuan == 0:
+            g0 = 20000
+        elif g0 and ((high and g0 < 1000) or (g2 and not g1)):
+            g0 += 10000
+        if g2 and 0 < g1 < 1000:
+            g1 += 10000
+        yield g2, g1, g0, rest
+
+
+def encode_into(cents: Iterable[int], buffer, offset: int = 0,
+                encoding: str = DEFAULT_ENCODING, record_size: Optional[int] = None,
+                newline: bytes = b"\n", pad: bytes = b" ") -> int:
+    """
+    将金额逐行编码写入预先分配的缓冲区
+
+    Args:
+        cents: 分值序列，例如 12345 表示 123.45 元
+        buffer: 可写的缓冲区（bytearray、mmap、可写 memoryview 等），不会扩容
+        offset: 起始写入位置
+        encoding: 输出编码
+        record_size: 定长记录的字节数（含换行符），None 表示变长
+        newline: 行尾
+        pad: 定长记录的填充字节
+
+    Returns:
+        int: 写入结束后的位置
+
+    Raises:
+        ValueError: 缓冲区空间不足，或某行超出 record_size
+        ConversionError: 含有不合法的分值
+    """
+    values = _as_int_array(cents)
+    if values is not None:
+        data = _encode_numpy(values, encoding, record_size, newline, pad)
+        with memoryview(buffer).cast("B") as view:
+            stop = offset + len(data)
+            if stop > len(view):
+                raise ValueError(f"缓冲区空间不足，需要 {stop} 字节，容量 {len(view)}")
+            view[offset:stop] = data
+        return stop
+
+    yi, wan, groups, decimals = _encoded_tables(encoding)
+    if record_size is not None:
+        template = _record_template(record_size, newline, pad)
+        limit = record_size - len(newline)
+
+    view = memoryview(buffer).cast("B")
+    capacity = len(view)
+    pos = offset
+    try:
+        for row, (g2, g1, g0, rest) in enumerate(_python_indices(cents)):
+            a, b, c, d = yi[g2], wan[g1], groups[g0], decimals[rest]
+            length = len(a) + len(b) + len(c) + len(d)
+
+            if record_size is None:
+                stop = pos + length + len(newline)
+            else:
+                if length > limit:
+                    raise ValueError(f"第 {row} 行需要 {length} 字节，超出定长记录 {record_size} 字节")
+                stop = pos + record_size
+            if stop > capacity:
+                raise ValueError(f"缓冲区空间不足，需要 {stop} 字节，容量 {capacity}")
+
+            if record_size is not None:
+                view[pos:stop] = template
+            end = pos + len(a)
+            view[pos:end] = a
+            pos, end = end, end + len(b)
+            view[pos:end] = b
+            pos, end = end, end + len(c)
+            view[pos:end] = c
+            pos, end = end, end + len(d)
+            view[pos:end] = d
+            if record_size is None:
+                view[end:stop] = newline
+            pos = stop
+    finally:
+        view.release()
+    return pos
+
+
+def write_many(cents: Iterable[int], file: BinaryIO, encoding: str = DEFAULT_ENCODING,
+               record_size: Optional[int] = None, newline: bytes = b"\n", pad: bytes = b" ",
+               chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """
+    将金额逐行编码写入二进制文件
+
+    每块整体写出一次；不使用 NumPy 时复用同一个预先分配的缓冲区。
+
+    Args:
+        cents: 分值序列
+        file: 以二进制方式打开的文件对象
+        encoding / record_size / newline / pad: 同 encode_into
+        chunk_rows: 每块的行数
+
+    Returns:
+        int: 写入的字节数
+    """
+    buffer = None
+    iterator = iter(cents)
+    total = 0
+    while True:
+        chunk = list(islice(iterator, chunk_rows))
+        if not chunk:
+            break
+        values = _as_int_array(chunk)
+        if values is not None:
+            data = _encode_numpy(values, encoding, record_size, newline, pad)
+            file.write(data)
+            total += len(data)
+            continue
+        if buffer is None:
+            row_size = record_size or max_row_bytes(encoding, newline)
+            buffer = bytearray(row_size * chunk_rows)
+        size = encode_into(chunk, buffer, 0, encoding, record_size, newline, pad)
+        with memoryview(buffer) as view:
+            file.write(view[:size])
+        total += size
+    return total
+
+
+def read_record(buffer, index: int, record_size: int, encoding: str = DEFAULT_ENCODING,
+                newline: bytes = b"\n", pad: bytes = b" ") -> str:
+    """
+    按行号读取定长记录
+
+    Args:
+        buffer: 定长记录所在的缓冲区（bytes、bytearray、mmap 等）
+        index: 行号，从0开始
+        record_size / encoding / newline / pad: 与写入时一致
+
+    Returns:
+        str: 该行的中文大写金额
+    """
+    start = index * record_size
+    record = bytes(buffer[start:start + record_size - len(newline)])
+    return record.rstrip(pad).decode(encoding)
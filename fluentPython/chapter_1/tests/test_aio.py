@@ -0,0 +1,115 @@
+"""
+异步转换模块的测试用例
+"""
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from src.aio import aconvert_chunks, aconvert_many
+from src.optimized_converter import convert_optimized
+from src.validation import ROUNDING_HALF_UP, InvalidFormatError
+
+
+def _amounts(count: int):
+    rng = random.Random(24)
+    return [f"{rng.randint(0, 999999999)}.{rng.randint(0, 99):02d}" for _ in range(count)]
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def test_aconvert_many_matches_convert():
+    """测试结果与逐个转换一致，保持输入顺序"""
+    amounts = _amounts(3000) + [7, Decimal("1.005")]
+    expected = [convert_optimized(number) for number in amounts]
+    assert asyncio.run(aconvert_many(amounts)) == expected
+    assert asyncio.run(aconvert_many(iter(amounts))) == expected
+    assert asyncio.run(aconvert_many([])) == []
+    assert asyncio.run(aconvert_many(["1.005"], rounding=ROUNDING_HALF_UP)) == ["壹元零壹分"]
+
+
+@pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_aconvert_many_offloaded(executor_type):
+    """测试交给线程池、进程池转换，结果按输入顺序合并"""
+    amounts = _amounts(5000)
+    expected = [convert_optimized(number) for number in amounts]
+    with executor_type(max_workers=2) as executor:
+        results = asyncio.run(aconvert_many(amounts, executor=executor, chunk_size=300,
+                                            max_pending=2))
+    assert results == expected
+
+
+def test_chunks_respect_budget():
+    """测试在事件循环中转换时，块的大小随耗时调整，事件循环的停顿有上限"""
+    amounts = _amounts(50000)
+    budget = 0.002
+
+    async def scenario():
+        gaps = []
+
+        async def ticker():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        chunks = await _collect(aconvert_chunks(amounts, budget=budget))
+        task.cancel()
+        return chunks, max(gaps)
+
+    chunks, max_gap = asyncio.run(scenario())
+    assert sum(len(chunk) for chunk in chunks) == len(amounts)
+    assert len(chunks) > 5
+    assert max(len(chunk) for chunk in chunks) > len(chunks[0])
+    # 留出足够余量，避免在繁忙的机器上误报
+    assert max_gap < budget * 25
+
+
+def test_errors_and_arguments():
+    """测试不合法的输入与参数"""
+    with pytest.raises(InvalidFormatError):
+        asyncio.run(aconvert_many(["1", "abc"]))
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(InvalidFormatError):
+            asyncio.run(aconvert_many(["1"] * 10 + ["abc"], executor=executor, chunk_size=3))
+    with pytest.raises(ValueError):
+        aconvert_chunks([], budget=0)
+    with pytest.raises(ValueError):
+        aconvert_chunks([], chunk_size=0)
+
+
+def test_cancel_offloaded():
+    """测试取消任务时撤销尚未开始执行的块"""
+    started = []
+    release = threading.Event()
+
+    def slow_amounts():
+        for i in range(100):
+            started.append(i)
+            yield str(i)
+
+    async def scenario(executor):
+        gate = executor.submit(release.wait)
+        task = asyncio.ensure_future(aconvert_many(slow_amounts(), executor=executor,
+                                                   chunk_size=10, max_pending=3))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+        gate.result()
+
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(scenario(executor))
+    # 在途块数有上限，取消后不再读取输入
+    assert len(started) <= 40
@@ -0,0 +1,95 @@
+"""
+批量转换模块的测试用例
+"""
+import random
+
+import pytest
+
+from src.batch import convert_many, _convert_many_python
+from src.optimized_converter import convert_optimized
+from src.validation import (
+    InvalidFormatError,
+    OverflowError,
+    NegativeNumberError
+)
+
+EXPECTED = [
+    (0, "零元整"),
+    (1, "零元零壹分"),
+    (10, "零元壹角"),
+    (123, "壹元贰角叁分"),
+    (10005, "壹佰元零伍分"),
+    (100100, "壹仟零壹元整"),
+    (1000110, "壹万零壹元壹角"),
+    (1000000, "壹万元整"),
+    (10005000, "壹拾万零伍拾元整"),
+    (10000000000, "壹亿元整"),
+    (10000000100, "壹亿零壹元整"),
+    (100001000000, "壹拾亿零壹万元整"),
+    (99999999999999, "玖仟玖佰玖拾玖亿玖仟玖佰玖拾玖万玖仟玖佰玖拾玖元玖角玖分"),
+]
+
+
+def test_convert_many_basic():
+    """测试基本的批量转换"""
+    cents = [value for value, _ in EXPECTED]
+    expected = [text for _, text in EXPECTED]
+    assert convert_many(cents) == expected
+    assert convert_many(tuple(cents)) == expected
+    assert _convert_many_python(iter(cents)) == expected
+    assert convert_many([]) == []
+
+
+def test_convert_many_numpy_matches_python():
+    """测试向量化路径与纯 Python 路径结果一致"""
+    np = pytest.importorskip("numpy")
+    rng = random.Random(20240501)
+    cents = [rng.randint(0, 99999999999999) for _ in range(5000)]
+    # 补充各分组为零、以零开头的边界值
+    for g2 in (0, 1, 10, 9999):
+        for g1 in (0, 1, 999, 1000):
+            for g0 in (0, 5, 100, 1000):
+                cents.append(((g2 * 10000 + g1) * 10000 + g0) * 100 + rng.randint(0, 99))
+
+    expected = _convert_many_python(cents)
+    assert convert_many(np.array(cents, dtype=np.int64)) == expected
+    assert convert_many(np.array(cents, dtype=np.uint64)) == expected
+
+
+def test_convert_many_validation():
+    """测试输入验证"""
+    with pytest.raises(NegativeNumberError) as exc:
+        convert_many([1, -5])
+    assert exc.value.code == "NEGATIVE_NUMBER"
+
+    with pytest.raises(OverflowError) as exc:
+        convert_many([100000000000000])
+    assert exc.value.code == "NUMBER_TOO_LARGE"
+
+    with pytest.raises(OverflowError):
+        convert_many([10 ** 30])
+
+    with pytest.raises(InvalidFormatError):
+        convert_many([1.5])
+
+    with pytest.raises(InvalidFormatError):
+        convert_many([True])
+
+
+def test_mixed_bool_input_rejected_like_python():
+    """测试混有布尔值的列表在两条路径上同样报格式错误，不会被当作1分"""
+    np = pytest.importorskip("numpy")
+    for cents in ([1, True], [False, 5], (3, np.bool_(True))):
+        with pytest.raises(InvalidFormatError):
+            _convert_many_python(cents)
+        with pytest.raises(InvalidFormatError):
+            convert_many(cents)
+
+
+def test_convert_many_matches_per_item():
+    """测试批量转换与逐个转换结果一致（吞吐对比见 src.bench 的 batch_speedup）"""
+    pytest.importorskip("numpy")
+    rng = random.Random(42)
+    cents = [rng.randint(0, 99999999999999) for _ in range(20000)]
+    numbers = [f"{value // 100}.{value % 100:02d}" for value in cents]
+    assert convert_many(cents) == [convert_optimized(number) for number in numbers]
@@ -0,0 +1,119 @@
+"""
+基准测试模块的测试用例
+"""
+import json
+import random
+
+import pytest
+
+from src.bench import (
+    PROFILES,
+    TARGETS,
+    compare,
+    main,
+    measure,
+    run_benchmarks,
+    run_scaling,
+    thread_counts
+)
+from src.parser import split_number
+from src.validation import ConversionError
+
+
+def test_profiles():
+    """测试各负载生成的数据符合预期"""
+    for name, generate in PROFILES.items():
+        amounts = generate(random.Random(1), 200)
+        assert len(amounts) == 200
+        # 扩展量程负载超出默认范围，按32位上限检查
+        max_digits = 32 if name == "extended_range" else 12
+        valid = 0
+        for amount in amounts:
+            try:
+                split_number(amount, max_digits)
+                valid += 1
+            except ConversionError:
+                pass
+        assert valid == (0 if name == "invalid" else 200), name
+
+    # 同一种子生成相同的数据
+    assert PROFILES["retail"](random.Random(3), 50) == PROFILES["retail"](random.Random(3), 50)
+
+
+def test_measure():
+    """测试延迟分位数与内存统计"""
+    _, run = TARGETS["convert_optimized"]
+    result = measure(run, ["123.45", "abc"] * 50, repeat=2, sample_size=10)
+    assert result["calls"] == 200
+    assert result["errors"] == 50
+    assert 0 < result["p50_ns"] <= result["p95_ns"] <= result["p99_ns"] <= result["max_ns"]
+    assert result["peak_memory_bytes"] >= 0
+
+
+def test_run_benchmarks_skips_inapplicable_targets():
+    """测试非法输入负载不运行批量入口"""
+    report = run_benchmarks(profiles=["invalid", "retail"], size=50, repeat=1,
+                            memory=False, import_time=False)
+    assert "invalid/convert" in report["results"]
+    assert "invalid/convert_many" not in report["results"]
+    assert "retail/convert_many" in report["results"]
+    assert list(report["batch_speedup"]) == ["retail"]
+    json.dumps(report)
+
+
+def test_extended_range_runs_only_extended_target():
+    """测试扩展量程负载只运行扩展转换器，不把标准转换器的错误路径当作吞吐"""
+    report = run_benchmarks(profiles=["extended_range"], size=50, repeat=1,
+                            memory=False, import_time=False)
+    assert list(report["results"]) == ["extended_range/convert_extended"]
+    assert report["results"]["extended_range/convert_extended"]["errors"] == 0
+
+
+def test_compare():
+    """测试与基线对比"""
+    baseline = {"results": {"retail/convert": {"p50_ns": 100, "p95_ns": 200, "p99_ns": 300}},
+                "import_time_sec": 0.01}
+    current = {"results": {"retail/convert": {"p50_ns": 105, "p95_ns": 200, "p99_ns": 400},
+                           "retail/convert_many": {"p50_ns": 1, "p95_ns": 1, "p99_ns": 1}},
+               "import_time_sec": 0.05}
+    regressions = compare(current, baseline, threshold=0.1)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("retail/convert p99_ns")
+    assert regressions[1].startswith("import_time_sec")
+    assert compare(current, baseline, threshold=10) == []
+
+    baseline = {"results": {}, "batch_speedup": {"retail": 10.0}}
+    assert compare({"results": {}, "batch_speedup": {"retail": 9.5}}, baseline) == []
+    regressions = compare({"results": {}, "batch_speedup": {"retail": 4.0}}, baseline)
+    assert regressions == ["retail batch_speedup: 10.00x -> 4.00x"]
+
+
+def test_main_output_and_baseline(tmp_path, capsys):
+    """测试JSON输出与基线回归时的退出码"""
+    output = tmp_path / "bench.json"
+    args = ["--profiles", "retail", "--targets", "convert_optimized", "--size", "100",
+            "--repeat", "1", "--no-import-time", "--no-memory"]
+    main(args + ["-o", str(output)])
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert list(report["results"]) == ["retail/convert_optimized"]
+
+    # 把基线改得极快，必然判定为回归
+    for result in report["results"].values():
+        for metric in ("p50_ns", "p95_ns", "p99_ns"):
+            result[metric] = 0.001
+    output.write_text(json.dumps(report), encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main(args + ["--baseline", str(output)])
+    assert exc.value.code == 1
+    assert "性能回归" in capsys.readouterr().out
+
+
+def test_scaling():
+    """测试线程扩展测试的线程数与结果格式"""
+    assert thread_counts(1) == [1]
+    assert thread_counts(6) == [1, 2, 4, 6]
+    report = run_scaling(profiles=["retail", "invalid"], max_threads=2, size=200, repeat=1)
+    assert list(report["scaling"]) == ["retail"]
+    assert [result["threads"] for result in report["scaling"]["retail"]] == [1, 2]
+    assert report["scaling"]["retail"][0]["speedup"] == 1.0
+    json.dumps(report)
@@ -0,0 +1,115 @@
+"""
+缓存模块的测试用例
+"""
+import random
+
+import pytest
+
+from src import optimized_converter
+from src.cache import ConversionCache
+from src.converter import convert
+from src.optimized_converter import (
+    configure_cache,
+    convert_cents,
+    convert_optimized,
+    get_cache,
+    save_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_default_cache():
+    """每个用例结束后恢复默认缓存"""
+    yield
+    configure_cache()
+
+
+def _identity(key):
+    return key
+
+
+def test_counters_and_lru_eviction():
+    """测试 LRU 淘汰与计数"""
+    cache = ConversionCache(maxsize=2, doorkeeper=False)
+    cache.get_or_compute(1, _identity)
+    cache.get_or_compute(2, _identity)
+    cache.get_or_compute(1, _identity)   # 命中，1 变为最近使用
+    cache.get_or_compute(3, _identity)   # 淘汰 2
+    assert 1 in cache and 3 in cache and 2 not in cache
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+    assert stats["hit_rate"] == 0.25
+    assert cache.hot_keys() == [3, 1]
+
+
+def test_fifo_eviction():
+    """测试 FIFO 淘汰不受命中影响"""
+    cache = ConversionCache(maxsize=2, policy="fifo", doorkeeper=False)
+    cache.get_or_compute(1, _identity)
+    cache.get_or_compute(2, _identity)
+    cache.get_or_compute(1, _identity)
+    cache.get_or_compute(3, _identity)   # 淘汰最早写入的 1
+    assert 1 not in cache and 2 in cache and 3 in cache
+
+
+def test_doorkeeper():
+    """测试第二次未命中才写入缓存"""
+    cache = ConversionCache(maxsize=10)
+    cache.get_or_compute(1, _identity)
+    assert len(cache) == 0
+    cache.get_or_compute(1, _identity)
+    assert 1 in cache
+    assert cache.get_or_compute(1, _identity) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_zero_size_and_invalid_config():
+    """测试容量为0与非法参数"""
+    cache = ConversionCache(maxsize=0, doorkeeper=False)
+    cache.get_or_compute(1, _identity)
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        ConversionCache(key_level="digit")
+    with pytest.raises(ValueError):
+        ConversionCache(policy="random")
+    with pytest.raises(ValueError):
+        ConversionCache(maxsize=-1)
+
+
+@pytest.mark.parametrize("key_level", ["input", "integer", "group"])
+def test_key_levels_give_same_results(key_level):
+    """测试各缓存粒度的转换结果一致"""
+    cache = configure_cache(maxsize=100, key_level=key_level, doorkeeper=False)
+    rng = random.Random(key_level)
+    numbers = [f"{rng.randint(0, 999999999999)}.{rng.randint(0, 99):02d}" for _ in range(300)]
+    numbers += ["0", "100000001", "10000.05"] * 3
+    for number in numbers * 2:
+        assert convert_optimized(number) == convert(number)
+    assert convert_cents(10000000100) == "壹亿零壹元整"
+
+    stats = cache.stats()
+    assert stats["key_level"] == key_level
+    assert stats["hits"] > 0
+    assert stats["size"] <= 100
+
+
+def test_save_and_preload(tmp_path):
+    """测试保存热点并在启动时预热"""
+    path = str(tmp_path / "hot.json")
+    configure_cache(maxsize=10, key_level="group", doorkeeper=False)
+    convert_optimized("123456789.12")
+    save_cache(path)
+    saved_keys = get_cache().hot_keys()
+
+    cache = configure_cache(maxsize=10, key_level="group", preload=path)
+    assert cache.hot_keys() == saved_keys
+    assert cache.stats()["hits"] == 0
+    convert_optimized("123456789.12")
+    assert cache.stats()["hits"] == 3
+
+    with pytest.raises(ValueError):
+        configure_cache(key_level="integer", preload=path)
+    # 加载失败时保留原有缓存
+    assert optimized_converter.get_cache() is cache
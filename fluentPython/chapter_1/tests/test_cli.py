@@ -0,0 +1,62 @@
+"""
+命令行接口的测试用例
+"""
+import io
+
+import pytest
+
+from src.cli import convert_line, main, stream_convert
+
+
+def test_convert_line():
+    """测试单行转换与错误文本"""
+    assert convert_line("123.45\n") == "壹佰贰拾叁元肆角伍分"
+    assert convert_line("  \n") == ""
+    assert convert_line("-1").startswith("错误: ")
+    assert convert_line("abc").startswith("错误: ")
+
+
+def test_stream_convert_keeps_order():
+    """测试并行转换保持输入顺序"""
+    lines = [f"{i}.{i % 100:02d}\n" for i in range(2500)] + ["abc\n"]
+    expected = list(stream_convert(lines))
+    assert len(expected) == len(lines)
+    assert expected[-1].startswith("错误: ")
+
+    parallel = list(stream_convert(lines, workers=2, chunk_size=100))
+    assert parallel == expected
+
+    shared = list(stream_convert(lines, workers=2, chunk_size=100, shared_table=True))
+    assert shared == expected
+
+
+def test_main_single(capsys):
+    """测试单个数字的命令行调用"""
+    main(["123.45"])
+    assert capsys.readouterr().out == "壹佰贰拾叁元肆角伍分\n"
+
+    with pytest.raises(SystemExit) as exc:
+        main(["-1"])
+    assert exc.value.code == 1
+    assert capsys.readouterr().out.startswith("错误: ")
+
+
+def test_main_bulk_stdin(capsys, monkeypatch):
+    """测试从标准输入批量转换，错误逐行报告"""
+    monkeypatch.setattr("sys.stdin", io.StringIO("1.23\nabc\n100\n"))
+    with pytest.raises(SystemExit) as exc:
+        main(["-f", "-"])
+    assert exc.value.code == 1
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "壹元贰角叁分"
+    assert lines[1].startswith("错误: ")
+    assert lines[2] == "壹佰元整"
+
+
+def test_main_bulk_file(tmp_path, capsys):
+    """测试从文件批量转换"""
+    path = tmp_path / "amounts.txt"
+    path.write_text("0.05\n1001\n", encoding="utf-8")
+    main(["-f", str(path), "--workers", "2", "--chunk-size", "1"])
+    assert capsys.readouterr().out == "零元零伍分\n壹仟零壹元整\n"
@@ -0,0 +1,160 @@
+"""
+守护进程与轻量客户端的测试用例
+"""
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src import cli as cli_module
+from src import client
+from src.cli import convert_line, main as cli_main
+from src.client import DaemonClient, stream_lines
+from src.converter import convert
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _start_daemon(path, *extra):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.cli", "--daemon", "--socket", path, *extra],
+        cwd=ROOT, stdout=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            DaemonClient(path).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    pytest.fail("守护进程未能启动")
+
+
+@pytest.fixture
+def daemon_socket(tmp_path):
+    path = str(tmp_path / "rmb.sock")
+    process = _start_daemon(path, "--prefork", "2")
+    yield path
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=10)
+    assert not os.path.exists(path)
+
+
+def test_daemon_results_match_in_process(daemon_socket):
+    """测试守护进程的结果与进程内转换一致，空行与错误按原位置输出"""
+    lines = ["123.45", "", "-1", "100000001"] * 600
+    with DaemonClient(daemon_socket) as conn:
+        outputs = list(stream_lines(conn, lines))
+    assert len(outputs) == len(lines)
+    assert outputs[:4] == [convert("123.45"), "", outputs[2], convert("100000001")]
+    assert outputs[2].startswith("错误: ")
+
+
+def test_client_main(daemon_socket, monkeypatch, capsys):
+    """测试客户端与 --client 经守护进程转换"""
+    monkeypatch.setenv(client.SOCKET_ENV, daemon_socket)
+    client.main(["1.5"])
+    assert capsys.readouterr().out == "壹元伍角\n"
+
+    with pytest.raises(SystemExit) as exc:
+        client.main(["1", "abc"])
+    assert exc.value.code == 1
+    assert capsys.readouterr().out.splitlines()[0] == "壹元整"
+
+    cli_main(["--client", "--socket", daemon_socket, "100"])
+    assert capsys.readouterr().out == "壹佰元整\n"
+
+
+def test_fallback_without_daemon(tmp_path, monkeypatch, capsys):
+    """测试守护进程不可用时在本进程转换"""
+    path = str(tmp_path / "missing.sock")
+    monkeypatch.setenv(client.SOCKET_ENV, path)
+    client.main(["1.5"])
+    assert capsys.readouterr().out == "壹元伍角\n"
+
+    cli_main(["--client", "2", "3"])
+    assert capsys.readouterr().out == "贰元整\n叁元整\n"
+
+
+def test_fallback_when_daemon_dies_mid_stream(tmp_path):
+    """测试守护进程在转换中途退出时，当前块及其后的行在本进程转换"""
+    path = str(tmp_path / "rmb.sock")
+    process = _start_daemon(path)
+    lines = [f"{i}.5" for i in range(client.CHUNK_SIZE * 3)] + ["abc"]
+    try:
+        with DaemonClient(path) as conn:
+            outputs = stream_lines(conn, lines, convert_line)
+            first = [next(outputs) for _ in range(client.CHUNK_SIZE)]
+            process.kill()
+            process.wait(timeout=10)
+            rest = list(outputs)
+    finally:
+        if process.poll() is None:
+            process.kill()
+    assert first + rest == [convert_line(line) for line in lines]
+
+
+class _DeadClient:
+    """连接成功后守护进程即退出的客户端"""
+
+    def convert_many(self, numbers):
+        raise ConnectionResetError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+def test_cli_client_falls_back_and_reports_unknown_errors(monkeypatch, capsys):
+    """测试 --client 单个数字在连接中断时退回本进程，"未知错误: "同样以退出码1结束"""
+    monkeypatch.setattr(cli_module, "_connect", lambda path: _DeadClient())
+    cli_main(["--client", "1.5"])
+    assert capsys.readouterr().out == "壹元伍角\n"
+
+    def broken(number):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli_module, "convert_optimized", broken)
+    with pytest.raises(SystemExit) as exc:
+        cli_main(["--client", "1.5"])
+    assert exc.value.code == 1
+    assert capsys.readouterr().out == "未知错误: boom\n"
+
+
+def test_default_socket_is_private(tmp_path, monkeypatch):
+    """测试默认 socket 放在当前用户私有的目录中"""
+    monkeypatch.delenv(client.SOCKET_ENV, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert client.socket_path() == str(tmp_path / client.SOCKET_NAME)
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    path = client.socket_path()
+    client.ensure_socket_dir(path)
+    directory = os.path.dirname(path)
+    assert directory == str(tmp_path / f"rmb-converter-{os.getuid()}")
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    os.chmod(directory, 0o755)
+    with pytest.raises(PermissionError):
+        client.ensure_socket_dir(path)
+
+
+def test_refuses_non_socket(tmp_path):
+    """测试不连接、不删除不是 socket 的路径"""
+    from src.server import _remove_stale_socket
+
+    path = tmp_path / "rmb.sock"
+    path.write_text("not a socket")
+    with pytest.raises(PermissionError):
+        DaemonClient(str(path))
+    with pytest.raises(PermissionError):
+        _remove_stale_socket(str(path))
+    assert path.exists()
+    _remove_stale_socket(str(tmp_path / "missing.sock"))
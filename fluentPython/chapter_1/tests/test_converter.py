@@ -5,12 +5,13 @@ import pytest
 from src.converter import (
     convert,
     convert_integer,
-    convert_decimal,
-    _convert_4digits
+    convert_decimal
 )
+from src.group_table import get_group_texts
 
 def test_convert_4digits():
-    """测试4位数转换"""
+    """测试4位数转换（分组表）"""
+    _convert_4digits = get_group_texts().__getitem__
     assert _convert_4digits(1234) == "壹仟贰佰叁拾肆"
     assert _convert_4digits(1001) == "壹仟零壹"
     assert _convert_4digits(1100) == "壹仟壹佰"
@@ -80,4 +81,58 @@ def test_convert_edge_cases():
     ]
     
     for number, expected in test_cases:
-        assert convert(number) == expected 
\ No newline at end of file
+        assert convert(number) == expected 
+
+
+def _reference_integer(num):
+    """逐位读数的参考实现，与查表实现相互独立"""
+    if num == 0:
+        return "零"
+    digits = "零壹贰叁肆伍陆柒捌玖"
+    units = ["", "拾", "佰", "仟"]
+    large_units = ["", "万", "亿"]
+    num_str = str(num)
+    result = []
+    zero_pending = False
+    group_has_digit = False
+    for i, digit in enumerate(num_str):
+        position = len(num_str) - i - 1
+        if digit == "0":
+            zero_pending = True
+        else:
+            if zero_pending and result:
+                result.append("零")
+            result.append(digits[int(digit)] + units[position % 4])
+            zero_pending = False
+            group_has_digit = True
+        if position % 4 == 0 and position > 0:
+            if group_has_digit:
+                result.append(large_units[position // 4])
+                # 万、亿前的零省略
+                zero_pending = False
+            group_has_digit = False
+    return "".join(result)
+
+
+def test_convert_group_boundaries():
+    """测试分组边界上的零值规则（查表实现、缓存实现、批量实现一致）"""
+    from src.batch import convert_many
+    from src.optimized_converter import convert_optimized
+    
+    boundary = [0, 1, 9, 10, 11, 99, 100, 101, 110, 999, 1000, 1001, 1010, 1100, 9999]
+    numbers = []
+    for g2 in boundary:
+        for g1 in boundary:
+            for g0 in boundary:
+                numbers.append((g2 * 10000 + g1) * 10000 + g0)
+    
+    for num in numbers:
+        assert convert_integer(num) == _reference_integer(num), num
+    
+    for cents in (0, 5, 50, 55):
+        batch = convert_many([num * 100 + cents for num in numbers])
+        for num, batch_result in zip(numbers, batch):
+            number = f"{num}.{cents:02d}"
+            expected = convert(number)
+            assert convert_optimized(number) == expected, number
+            assert batch_result == expected, number
@@ -0,0 +1,131 @@
+"""
+CSV 列转换模块的测试用例
+"""
+import csv
+import io
+import random
+
+import pytest
+
+from src import csv_column
+from src.csv_column import convert_csv, main, split_ranges
+from src.optimized_converter import convert_optimized
+
+
+def _write_ledger(path, rows=3000, encoding="utf-8", newline="\n"):
+    rng = random.Random(14)
+    lines = ["id,memo,amount"]
+    for i in range(rows):
+        amount = f"{rng.randint(0, 999999999)}.{rng.randint(0, 99):02d}"
+        lines.append(f'{i},"备注, {i}",{amount}')
+    lines.append('9999,"坏数据",-1')
+    path.write_bytes(newline.join(lines).encode(encoding) + newline.encode())
+
+
+def _read(data, encoding="utf-8"):
+    return list(csv.reader(io.StringIO(data.decode(encoding), newline="")))
+
+
+def test_convert_csv_appends_column(tmp_path):
+    """测试追加大写金额列，保留引号内的逗号"""
+    path = tmp_path / "ledger.csv"
+    _write_ledger(path, rows=200)
+    output = io.BytesIO()
+    stats = convert_csv(str(path), output, "amount")
+    assert stats == {"rows": 201, "errors": 1}
+
+    rows = _read(output.getvalue())
+    assert rows[0] == ["id", "memo", "amount", "amount_大写"]
+    assert rows[1][1] == "备注, 0"
+    for row in rows[1:-1]:
+        assert row[3] == convert_optimized(row[2])
+    assert rows[-1][3].startswith("错误: ")
+
+
+def test_unexpected_cell_error_does_not_abort(tmp_path, monkeypatch):
+    """测试单元格转换中意外的异常只影响该单元格"""
+    def flaky(number):
+        if number == "2":
+            raise ValueError("boom")
+        return convert_optimized(number)
+
+    monkeypatch.setattr(csv_column, "convert_optimized", flaky)
+    path = tmp_path / "ledger.csv"
+    path.write_text("amount\n1\n2\n3\n", encoding="utf-8")
+    output = io.BytesIO()
+    assert convert_csv(str(path), output, "amount") == {"rows": 3, "errors": 1}
+
+    rows = _read(output.getvalue())
+    assert rows[1][1] == "壹元整"
+    assert rows[2][1] == "未知错误: boom"
+    assert rows[3][1] == "叁元整"
+
+
+@pytest.mark.parametrize("encoding,newline", [("utf-8", "\n"), ("gbk", "\r\n")])
+def test_parallel_output_matches_serial(tmp_path, encoding, newline):
+    """测试多进程按原顺序输出，与单进程结果逐字节一致"""
+    path = tmp_path / "ledger.csv"
+    _write_ledger(path, encoding=encoding, newline=newline)
+    serial = io.BytesIO()
+    convert_csv(str(path), serial, "amount", encoding=encoding, chunk_bytes=4096)
+    parallel = io.BytesIO()
+    stats = convert_csv(str(path), parallel, 2, workers=2, encoding=encoding, chunk_bytes=4096)
+    assert parallel.getvalue() == serial.getvalue()
+    assert stats["rows"] == 3001
+    assert serial.getvalue().count(newline.encode()) == 3002
+
+
+def test_parallel_with_shared_table(tmp_path):
+    """测试工作进程附加共享的分组表，输出与单进程一致"""
+    path = tmp_path / "ledger.csv"
+    _write_ledger(path, rows=500)
+    serial = io.BytesIO()
+    convert_csv(str(path), serial, "amount")
+    parallel = io.BytesIO()
+    convert_csv(str(path), parallel, "amount", workers=2, chunk_bytes=4096, shared_table=True)
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_split_ranges_end_on_newlines(tmp_path):
+    """测试分块首尾相接且在换行处切开"""
+    import mmap
+    path = tmp_path / "ledger.csv"
+    _write_ledger(path, rows=500)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        ranges = list(split_ranges(mapped, 0, 1000))
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(mapped)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and mapped[end - 1:end] == b"\n"
+
+
+def test_main(tmp_path, capsys):
+    """测试命令行：无表头、列号与退出码"""
+    path = tmp_path / "plain.csv"
+    path.write_text("a,1.5\nb,2\n", encoding="utf-8")
+    out = tmp_path / "out.csv"
+    main([str(path), "-c", "1", "--no-header", "-o", str(out), "-w", "1"])
+    assert out.read_text(encoding="utf-8") == "a,1.5,壹元伍角\nb,2,贰元整\n"
+
+    path.write_text("amount\nabc\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main([str(path), "-c", "amount", "-o", str(out), "-w", "1"])
+    assert exc.value.code == 1
+    with pytest.raises(SystemExit) as exc:
+        main([str(path), "-c", "missing", "-o", str(out)])
+    assert exc.value.code == 2
+    assert "找不到列" in capsys.readouterr().err
+
+
+def test_column_number_out_of_range(tmp_path, capsys):
+    """测试列号超出第一行的列数时报告找不到列，而不是抛出 IndexError"""
+    path = tmp_path / "ledger.csv"
+    path.write_text("id,amount\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="找不到列: 5"):
+        convert_csv(str(path), io.BytesIO(), 5)
+    with pytest.raises(ValueError, match="找不到列: 2"):
+        convert_csv(str(path), io.BytesIO(), "2", header=False)
+
+    with pytest.raises(SystemExit) as exc:
+        main([str(path), "--column", "5", "-o", str(tmp_path / "out.csv")])
+    assert exc.value.code == 2
+    assert "找不到列: 5" in capsys.readouterr().err
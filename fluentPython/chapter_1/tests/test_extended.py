@@ -0,0 +1,58 @@
+"""
+扩展量程模块的测试用例
+"""
+import random
+
+import pytest
+
+from src.converter import convert
+from src.extended import ExtendedConverter, convert_extended
+from src.validation import InvalidFormatError, NegativeNumberError, OverflowError
+
+
+def test_matches_default_range():
+    """测试千亿以内与默认转换一致"""
+    rng = random.Random(16)
+    for _ in range(3000):
+        number = f"{rng.randint(0, 999999999999)}.{rng.randint(0, 99):02d}"
+        assert convert_extended(number) == convert(number)
+
+
+def test_extended_units():
+    """测试兆、京等大单位与跨组补零"""
+    assert convert_extended("1000000000000") == "壹兆元整"
+    assert convert_extended("10000000000000000") == "壹京元整"
+    assert convert_extended("100000000000000000001") == "壹垓零壹元整"
+    assert convert_extended("12000000100000000.5") == "壹京贰仟兆零壹亿元伍角"
+    assert convert_extended("9" * 32) == "玖仟玖佰玖拾玖穰" + "玖仟玖佰玖拾玖秭玖仟玖佰玖拾玖垓" \
+        "玖仟玖佰玖拾玖京玖仟玖佰玖拾玖兆玖仟玖佰玖拾玖亿玖仟玖佰玖拾玖万玖仟玖佰玖拾玖元整"
+
+
+def test_configurable_units():
+    """测试自定义大单位与对应的量程"""
+    converter = ExtendedConverter(["", "万", "亿", "兆"])
+    assert converter.max_integer == 10 ** 16 - 1
+    assert converter.convert("1000100000000.01") == "壹兆零壹亿元零壹分"
+    assert converter.convert_cents(100000000000000) == "壹兆元整"
+    with pytest.raises(OverflowError) as exc:
+        converter.convert("10000000000000000")
+    assert "16位" in exc.value.message
+    with pytest.raises(OverflowError):
+        converter.convert_cents(10 ** 18)
+
+    with pytest.raises(ValueError):
+        ExtendedConverter(["万", "亿"])
+    with pytest.raises(ValueError):
+        ExtendedConverter(["", "万", "万"])
+
+
+def test_errors():
+    """测试与默认转换相同的错误类型"""
+    with pytest.raises(NegativeNumberError):
+        convert_extended("-1")
+    with pytest.raises(InvalidFormatError):
+        convert_extended("1e20")
+    with pytest.raises(OverflowError):
+        convert_extended("1" + "0" * 32)
+    with pytest.raises(InvalidFormatError):
+        ExtendedConverter().convert_cents(True)
@@ -0,0 +1,80 @@
+"""
+格式化模块的测试用例
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.formatter import (
+    CHEQUE_GRID,
+    POSITION_UNITS,
+    AmountTokens,
+    format_many,
+    render_grid,
+    render_numeric,
+    render_uppercase,
+    tokenize,
+    tokenize_cents
+)
+from src.optimized_converter import convert_optimized
+from src.validation import InvalidFormatError, OverflowError
+
+
+def test_tokenize():
+    """测试结构化表示与按位的 (数字, 单位) 对"""
+    tokens = tokenize("1005.6")
+    assert (tokens.integer, tokens.cents) == (1005, 60)
+    assert tokens.pairs() == [(1, "仟"), (0, "佰"), (0, "拾"), (5, "元"), (6, "角"), (0, "分")]
+    assert tokenize("0.05").pairs() == [(0, "元"), (0, "角"), (5, "分")]
+    assert len(tokenize("999999999999.99").pairs()) == len(POSITION_UNITS)
+    assert tokenize(Decimal("12.345"), rounding="half_up") == tokenize_cents(1235)
+    with pytest.raises(InvalidFormatError):
+        tokenize("1,234")
+
+
+def test_renderers():
+    """测试各格式的渲染结果"""
+    tokens = tokenize("1234567.89")
+    assert render_uppercase(tokens) == "壹佰贰拾叁万肆仟伍佰陆拾柒元捌角玖分"
+    assert render_numeric(tokens) == "¥1,234,567.89"
+    assert render_numeric(tokenize("0"), symbol="") == "0.00"
+    assert dict(zip(CHEQUE_GRID, render_grid(tokens))) == {
+        "亿": "零", "仟万": "零", "佰万": "壹", "拾万": "贰", "万": "叁", "仟": "肆",
+        "佰": "伍", "拾": "陆", "元": "柒", "角": "捌", "分": "玖",
+    }
+    assert render_grid(tokenize("100.05"), fill="") == ["", "", "", "", "", "", "壹", "零", "零", "零", "伍"]
+    assert render_grid(tokenize("999999999.99")) == ["玖"] * 11
+    with pytest.raises(OverflowError):
+        render_grid(tokenize("1000000000"))
+    assert render_grid(tokenize("1000000000"), labels=POSITION_UNITS)[2] == "壹"   # 拾亿
+
+
+def test_format_many():
+    """测试批量渲染与逐个转换一致"""
+    rng = random.Random(22)
+    numbers = [f"{rng.randint(0, 999999999)}.{rng.randint(0, 99):02d}" for _ in range(500)]
+    results = format_many(numbers)
+    for number, (uppercase, numeric, grid) in zip(numbers, results):
+        assert uppercase == convert_optimized(number)
+        assert numeric == f"¥{Decimal(number):,.2f}"
+        assert len(grid) == len(CHEQUE_GRID)
+    assert format_many([b"1", 2], formats=["numeric"]) == [("¥1.00",), ("¥2.00",)]
+    with pytest.raises(ValueError):
+        format_many(["1"], formats=["roman"])
+    assert AmountTokens(1, 2) != tokenize("1.2")
+
+
+def test_render_uppercase_from_positions():
+    """测试大写金额由按位数字串生成，与 convert_optimized 一致"""
+    rng = random.Random(2022)
+    values = [rng.randint(0, 99999999999999) for _ in range(2000)]
+    # 补充各分组为零、以零开头的边界值
+    for g2 in (0, 1, 10, 9999):
+        for g1 in (0, 1, 999, 1000):
+            for g0 in (0, 5, 100, 1000):
+                values.append(((g2 * 10000 + g1) * 10000 + g0) * 100 + rng.randint(0, 99))
+    for value in values:
+        number = f"{value // 100}.{value % 100:02d}"
+        assert render_uppercase(tokenize_cents(value)) == convert_optimized(number)
+    assert render_uppercase(AmountTokens(100000001, 5)) == "壹亿零壹元零伍分"
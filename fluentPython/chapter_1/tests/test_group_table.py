@@ -0,0 +1,188 @@
+"""
+分组表模块的测试用例
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src import group_table
+from src.bench import import_times
+from src.group_table import (
+    build_group_texts,
+    create_shared_group_table,
+    load_group_table,
+    release_shared_group_table,
+    save_group_table,
+    shared_group_table,
+    use_shared_group_table,
+    SharedGroupTable,
+    GROUP_SIZE
+)
+from src.symbols import CHINESE_DIGITS, UNITS
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 导入 src.optimized_converter 自身耗时的上限（微秒）
+IMPORT_BUDGET_US = 10000
+
+
+def _convert_4digits(num: int) -> str:
+    """逐位转换4位以内的数字，作为分组表的参照"""
+    result = []
+    digits = str(num).zfill(4)
+    for i, digit in enumerate(digits):
+        if digit != "0":
+            result.append(CHINESE_DIGITS[int(digit)] + UNITS[3 - i])
+        elif result and digits[i + 1:].strip("0") and digits[i - 1] != "0":
+            result.append(CHINESE_DIGITS[0])
+    return "".join(result)
+
+
+def test_build_group_texts():
+    """测试分组表与逐位转换一致"""
+    texts = build_group_texts()
+    assert len(texts) == GROUP_SIZE
+    for i in range(GROUP_SIZE):
+        assert texts[i] == _convert_4digits(i)
+
+
+def test_save_and_load(tmp_path):
+    """测试表文件的生成与内存映射加载"""
+    path = str(tmp_path / "groups.bin")
+    save_group_table(path)
+
+    table = load_group_table(path)
+    assert len(table) == GROUP_SIZE
+    assert table[1001] == "壹仟零壹"
+    assert table[-1] == "玖仟玖佰玖拾玖"
+    assert list(table) == build_group_texts()
+
+
+def test_load_rejects_corrupted_file(tmp_path):
+    """测试校验和不匹配的表文件被拒绝"""
+    path = tmp_path / "groups.bin"
+    save_group_table(str(path))
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        load_group_table(str(path))
+
+    path.write_bytes(b"not a table")
+    with pytest.raises(ValueError):
+        load_group_table(str(path))
+
+
+def test_env_fallback(tmp_path, monkeypatch):
+    """测试表文件不可用时退回现场构建"""
+    monkeypatch.setattr(group_table, "_TEXTS", None)
+    monkeypatch.setenv(group_table.TABLE_ENV, str(tmp_path / "missing.bin"))
+    with pytest.warns(UserWarning):
+        texts = group_table.get_group_texts()
+    assert texts == build_group_texts()
+
+
+def test_shared_group_table():
+    """测试共享内存中的分组表与现场构建的一致，关闭后可以释放"""
+    with shared_group_table() as name:
+        table = SharedGroupTable(name)
+        assert table[1001] == "壹仟零壹"
+        assert list(table) == build_group_texts()
+        table.close()
+        # 已解码的条目在关闭后仍可读取
+        assert table[1001] == "壹仟零壹"
+
+
+def test_shared_table_rejects_corrupted_segment():
+    """测试内容被改动的共享内存段被拒绝"""
+    segment = create_shared_group_table()
+    try:
+        segment.buf[group_table._HEADER.size + 100] ^= 0xFF
+        with pytest.raises(ValueError):
+            SharedGroupTable(segment.name)
+    finally:
+        release_shared_group_table(segment)
+
+
+def test_use_shared_group_table(monkeypatch):
+    """测试工作进程初始化时附加共享的分组表，不可用时给出警告"""
+    monkeypatch.setattr(group_table, "_TEXTS", None)
+    with shared_group_table() as name:
+        assert use_shared_group_table(name)
+        texts = group_table.get_group_texts()
+        assert isinstance(texts, SharedGroupTable)
+        assert texts[9999] == "玖仟玖佰玖拾玖"
+        texts.close()
+
+    monkeypatch.setattr(group_table, "_TEXTS", None)
+    with pytest.warns(UserWarning):
+        assert not use_shared_group_table(name)
+    assert group_table._TEXTS is None
+
+
+def _run_python(code: str, env=None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, env=env, check=True
+    )
+
+
+def test_import_does_not_build_table():
+    """测试导入时不构建分组表"""
+    result = _run_python(
+        "import src.optimized_converter, src.group_table as g; "
+        "print(g._TEXTS is None)"
+    )
+    assert result.stdout.strip() == "True"
+
+
+def test_import_time_budget():
+    """测试导入耗时不超过预算（-X importtime 的自身耗时）"""
+    times = import_times("src.optimized_converter")
+    own = times["src.optimized_converter"][0] + times["src.group_table"][0]
+    print(f"\nsrc.optimized_converter 导入耗时: {own}us")
+    assert own < IMPORT_BUDGET_US, "导入 src.optimized_converter 超出启动预算"
+
+
+def test_standalone_attach_keeps_segment():
+    """测试独立启动的进程附加并退出后，共享内存段仍然存在"""
+    with shared_group_table() as name:
+        result = _run_python(
+            f"from src.group_table import SharedGroupTable; "
+            f"t = SharedGroupTable({name!r}); print(t[1001]); t.close()"
+        )
+        assert result.stdout.strip() == "壹仟零壹"
+        assert "leaked" not in result.stderr
+        table = SharedGroupTable(name)
+        assert table[9999] == "玖仟玖佰玖拾玖"
+        table.close()
+
+
+def test_env_table_used(tmp_path):
+    """测试通过环境变量加载预生成的表文件"""
+    path = str(tmp_path / "groups.bin")
+    save_group_table(path)
+    env = dict(os.environ, **{group_table.TABLE_ENV: path})
+    result = _run_python(
+        "from src.optimized_converter import convert_optimized; "
+        "import src.group_table as g; "
+        "print(convert_optimized('1001.5'), type(g._TEXTS).__name__)",
+        env=env
+    )
+    assert result.stdout.split() == ["壹仟零壹元伍角", "MappedGroupTable"]
+
+
+def test_env_shared_table_used():
+    """测试通过环境变量附加共享的分组表"""
+    with shared_group_table() as name:
+        env = dict(os.environ, **{group_table.SHM_ENV: name})
+        result = _run_python(
+            "from src.optimized_converter import convert_optimized; "
+            "import src.group_table as g; "
+            "print(convert_optimized('1001.5'), type(g._TEXTS).__name__)",
+            env=env
+        )
+    assert result.stdout.split() == ["壹仟零壹元伍角", "SharedGroupTable"]
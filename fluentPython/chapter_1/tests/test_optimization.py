@@ -3,9 +3,22 @@
 """
 import time
 import random
+from decimal import Decimal
 from typing import List, Tuple
+import pytest
 from src.converter import convert
-from src.optimized_converter import convert_optimized
+from src.cache import KEY_INPUT
+from src.optimized_converter import (
+    configure_cache,
+    convert_optimized,
+    convert_cents,
+    convert_decimal_value
+)
+from src.validation import (
+    InvalidFormatError,
+    OverflowError,
+    NegativeNumberError
+)
 
 def generate_test_cases(count: int = 1000) -> List[str]:
     """生成测试数据"""
@@ -80,6 +93,82 @@ def test_optimization_correctness():
         assert optimized_result == original_result, \
             f"优化版本结果不一致：{number} -> {optimized_result} != {original_result}"
 
+def test_convert_cents():
+    """测试整数分值入口"""
+    test_cases = [
+        (0, "0"), (1, "0.01"), (10, "0.10"), (123, "1.23"),
+        (10005, "100.05"), (12345, "123.45"),
+        (99999999999999, "999999999999.99")
+    ]
+    
+    for cents, number in test_cases:
+        assert convert_cents(cents) == convert_optimized(number)
+    
+    with pytest.raises(NegativeNumberError):
+        convert_cents(-1)
+    
+    with pytest.raises(OverflowError):
+        convert_cents(100000000000000)
+    
+    for invalid in (1.5, "123", True):
+        with pytest.raises(InvalidFormatError):
+            convert_cents(invalid)
+
+def test_convert_decimal_value():
+    """测试 Decimal 入口"""
+    test_cases = [
+        "0", "0.01", "123.45", "123.456", "1001.00", "0.999",
+        "999999999999.99", "999999999999.999"
+    ]
+    
+    for number in test_cases:
+        assert convert_decimal_value(Decimal(number)) == convert_optimized(number)
+    
+    # 超出上下文精度的小数位也应截断而不是进位
+    assert convert_decimal_value(Decimal("0." + "9" * 40)) == "零元玖角玖分"
+    assert convert_decimal_value(Decimal("0E+20")) == "零元整"
+    assert convert_decimal_value(Decimal("1.5E+3")) == convert_optimized("1500")
+    
+    with pytest.raises(NegativeNumberError):
+        convert_decimal_value(Decimal("-0.01"))
+    
+    with pytest.raises(OverflowError):
+        convert_decimal_value(Decimal("1E+12"))
+    
+    with pytest.raises(InvalidFormatError):
+        convert_decimal_value(Decimal("NaN"))
+
+def test_rounding_modes():
+    """测试各入口的舍入方式一致，且不与整个输入的缓存混用"""
+    configure_cache(key_level=KEY_INPUT, doorkeeper=False)
+    try:
+        assert convert_optimized("1.005") == "壹元整"
+        assert convert_optimized("1.005", rounding="half_up") == "壹元零壹分"
+        assert convert_optimized("1.005") == "壹元整"
+    finally:
+        configure_cache()
+    for rounding in ("down", "half_up", "half_even", "up"):
+        for number in ("0.125", "0.135", "9999.999", "12.3401"):
+            expected = convert(number, rounding=rounding)
+            assert convert_optimized(number, rounding=rounding) == expected
+            assert convert_decimal_value(Decimal(number), rounding=rounding) == expected
+    assert convert("9999.999", rounding="half_even") == "壹万元整"
+
+def test_typed_inputs():
+    """测试非字符串输入不经过字符串转换，结果与字符串一致"""
+    configure_cache(key_level=KEY_INPUT, doorkeeper=False)
+    try:
+        # 0.29 与 Decimal(0.29) 相等，不能共用整个输入的缓存
+        assert convert_optimized(Decimal(0.29)) == "零元贰角捌分"
+        assert convert_optimized(0.29) == "零元贰角玖分"
+        assert convert_optimized(Decimal(0.29)) == "零元贰角捌分"
+    finally:
+        configure_cache()
+    for value in (123, Decimal("123.456"), b"123.45", memoryview(b"0.05"), 1.5):
+        expected = convert(str(value) if not isinstance(value, (bytes, memoryview)) else bytes(value).decode())
+        assert convert_optimized(value) == expected
+        assert convert(value) == expected
+
 if __name__ == "__main__":
     test_optimization_effect()
     test_optimization_correctness() 
\ No newline at end of file
@@ -1,9 +1,13 @@
 """
 解析模块的测试用例
 """
+import random
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP
 import pytest
-from src.parser import split_number
+from src.parser import split_number, split_value
 from src.validation import (
+    ROUNDING_MODES,
+    ConversionError,
     InvalidFormatError,
     OverflowError,
     NegativeNumberError
@@ -33,6 +37,17 @@ def test_split_number_clean_zeros():
     assert split_number("000.100") == (0, 10)
     assert split_number("012.340") == (12, 34)
 
+def test_split_number_long_leading_zeros():
+    """超过 int() 位数上限的前导零按数值解析"""
+    padded = '0' * 5000 + '1'
+    assert split_number(padded) == (1, 0)
+    assert split_number(padded + '.5', rounding='half_up') == (1, 50)
+    assert split_number('0' * 5000) == (0, 0)
+    assert split_value(padded.encode()) == (1, 0)
+    assert split_value(padded.encode() + b'.995', rounding='half_up') == (2, 0)
+    with pytest.raises(OverflowError):
+        split_number('0' * 5000 + '1' * 13)
+
 def test_split_number_validation():
     """测试输入验证"""
     with pytest.raises(NegativeNumberError):
@@ -48,4 +63,140 @@ def test_split_number_edge_cases():
     """测试边界情况"""
     assert split_number("0.00") == (0, 0)
     assert split_number("999999999999.99") == (999999999999, 99)
-    assert split_number("999999999999.999") == (999999999999, 99)  # 自动截断 
\ No newline at end of file
+    assert split_number("999999999999.999") == (999999999999, 99)  # 自动截断 
+
+def _reference_split(input_str):
+    """基于 Decimal 的参考实现"""
+    number = Decimal(input_str).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
+    return int(number), int(number % 1 * 100)
+
+def test_split_number_matches_decimal():
+    """测试单遍扫描结果与 Decimal 截断一致"""
+    rng = random.Random(2024)
+    for _ in range(2000):
+        integer = str(rng.randint(0, 999999999999)).zfill(rng.randint(1, 14))
+        fraction = "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 5)))
+        number = f"{integer}.{fraction}" if fraction else integer
+        assert split_number(number) == _reference_split(number)
+
+def test_split_number_error_codes():
+    """测试错误码与原有验证规则一致"""
+    cases = [
+        ("-0.5", "NEGATIVE_NUMBER"),
+        ("", "INVALID_FORMAT"),
+        (".5", "INVALID_FORMAT"),
+        ("100.", "INVALID_FORMAT"),
+        ("+1", "INVALID_FORMAT"),
+        ("1.2.3", "INVALID_FORMAT"),
+        ("1 000", "INVALID_FORMAT"),
+        ("１２３", "INVALID_FORMAT"),  # 全角数字
+        ("²", "INVALID_FORMAT"),
+        ("1000000000000", "NUMBER_TOO_LARGE"),
+        ("9" * 5000, "NUMBER_TOO_LARGE"),
+    ]
+    for number, code in cases:
+        with pytest.raises(ConversionError) as exc:
+            split_number(number)
+        assert exc.value.code == code, number
+        assert exc.value.original == number
+
+    # 前导零不计入位数
+    assert split_number("000000999999999999.99") == (999999999999, 99)
+
+def test_split_number_rounding():
+    """测试各舍入方式与 Decimal 的结果一致"""
+    decimal_modes = dict(zip(ROUNDING_MODES, (ROUND_DOWN, ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_CEILING)))
+    rng = random.Random(19)
+    samples = ["0.125", "0.135", "0.1250", "0.12501", "0.995", "9.999", "1.5", "7"]
+    for _ in range(2000):
+        fraction = "".join(rng.choice("0123455569") for _ in range(rng.randint(1, 6)))
+        samples.append(f"{rng.randint(0, 99999)}.{fraction}")
+    for rounding, mode in decimal_modes.items():
+        for number in samples:
+            cents = int(Decimal(number).quantize(Decimal("0.01"), rounding=mode).scaleb(2))
+            assert split_number(number, rounding=rounding) == divmod(cents, 100), (rounding, number)
+
+def test_split_number_rounding_overflow():
+    """测试范围检查在舍入之后进行"""
+    assert split_number("999999999999.995") == (999999999999, 99)
+    assert split_number("999999999999.994", rounding="half_up") == (999999999999, 99)
+    for rounding in ("half_up", "half_even", "up"):
+        with pytest.raises(OverflowError):
+            split_number("999999999999.995", rounding=rounding)
+    assert split_number("9999.995", max_digits=4, rounding="down") == (9999, 99)
+    with pytest.raises(OverflowError):
+        split_number("9999.991", max_digits=4, rounding="up")
+    with pytest.raises(ValueError):
+        split_number("1.005", rounding="ceiling")
+
+def test_split_value_types():
+    """测试按类型分派的解析与字符串解析一致"""
+    rng = random.Random(20)
+    for _ in range(1000):
+        number = f"{rng.randint(0, 999999999999)}.{rng.randint(0, 99999):05d}"
+        expected = split_number(number)
+        assert split_value(number) == expected
+        assert split_value(Decimal(number)) == expected
+        assert split_value(number.encode()) == expected
+        assert split_value(memoryview(bytearray(number.encode()))) == expected
+        assert split_value(number.encode(), rounding="half_even") == split_number(number, rounding="half_even")
+        assert split_value(Decimal(number), rounding="half_up") == split_number(number, rounding="half_up")
+    assert split_value(123) == (123, 0)
+    assert split_value(999999999999) == (999999999999, 0)
+    assert split_value(Decimal("1.5E+3")) == (1500, 0)
+    assert split_value(Decimal("1234567890123.5"), max_digits=16) == (1234567890123, 50)
+
+def test_split_value_float_policy():
+    """测试浮点数按最短十进制表示解释"""
+    assert split_value(0.29) == (0, 29)          # 二进制值为 0.28999…
+    assert split_value(123.45) == (123, 45)
+    assert split_value(1e-05) == (0, 0)
+    assert split_value(0.125, rounding="half_even") == (0, 12)
+    for value, error in [(float("nan"), InvalidFormatError), (float("inf"), InvalidFormatError),
+                         (-0.0, NegativeNumberError), (1e12, OverflowError)]:
+        with pytest.raises(error):
+            split_value(value)
+
+def test_split_value_errors():
+    """测试各类型的错误码"""
+    cases = [
+        (True, "INVALID_FORMAT"),
+        (-1, "NEGATIVE_NUMBER"),
+        (10 ** 12, "NUMBER_TOO_LARGE"),
+        (Decimal("NaN"), "INVALID_FORMAT"),
+        (Decimal("-0"), "NEGATIVE_NUMBER"),
+        (Decimal("999999999999.995"), None),
+        (b"-1", "NEGATIVE_NUMBER"),
+        (b"1a", "INVALID_FORMAT"),
+        (b" 1", "INVALID_FORMAT"),
+        (b"\xef\xbc\x91", "INVALID_FORMAT"),  # 全角数字
+        (b"1" * 13, "NUMBER_TOO_LARGE"),
+        (object(), "INVALID_FORMAT"),
+    ]
+    for value, code in cases:
+        if code is None:
+            split_value(value)
+            continue
+        with pytest.raises(ConversionError) as exc:
+            split_value(value)
+        assert exc.value.code == code, value
+    with pytest.raises(OverflowError):
+        split_value(Decimal("999999999999.995"), rounding="half_up")
+
+
+@pytest.mark.parametrize("max_digits", [12, 32])
+def test_split_value_extreme_exponents(max_digits):
+    """测试指数极端的 Decimal 不展开成超长的数字，结果与同数量级的普通值相同"""
+    for value, code in [(Decimal("1E+999999999"), "NUMBER_TOO_LARGE"),
+                        (Decimal("-1E+999999999"), "NEGATIVE_NUMBER"),
+                        (Decimal("-1E-999999999"), "NEGATIVE_NUMBER")]:
+        with pytest.raises(ConversionError) as exc:
+            split_value(value, max_digits)
+        assert exc.value.code == code
+    tiny = Decimal("7E-999999999")
+    assert split_value(tiny, max_digits) == (0, 0)
+    assert split_value(tiny, max_digits, rounding="half_even") == (0, 0)
+    assert split_value(tiny, max_digits, rounding="up") == (0, 1)
+    assert split_value(Decimal("0E-999999999"), max_digits) == (0, 0)
+    assert split_value(Decimal("0E+999999999"), max_digits) == (0, 0)
+    assert split_value(Decimal("12.345E-1"), max_digits, rounding="up") == (1, 24)
@@ -0,0 +1,81 @@
+"""
+币种配置模块的测试用例
+"""
+import random
+import threading
+
+import pytest
+
+from src import profiles
+from src.converter import convert
+from src.profiles import (
+    TRADITIONAL_DIGITS,
+    CurrencyProfile,
+    convert_currency,
+    get_profile
+)
+from src.validation import NegativeNumberError
+
+
+def test_cny_matches_convert():
+    """测试人民币配置与默认转换一致"""
+    rng = random.Random(17)
+    profile = get_profile("CNY")
+    for _ in range(2000):
+        number = f"{rng.randint(0, 999999999999)}.{rng.randint(0, 99):02d}"
+        assert profile.convert(number) == convert(number)
+
+
+@pytest.mark.parametrize("currency,expected", [
+    ("HKD", ["港幣壹億零貳拾萬元伍毫", "港幣零元零伍仙", "港幣壹佰元正"]),
+    ("TWD", ["新臺幣壹億零貳拾萬元伍角", "新臺幣零元零伍分", "新臺幣壹佰元整"]),
+    ("MOP", ["澳門幣壹億零貳拾萬元伍毫", "澳門幣零元零伍仙", "澳門幣壹佰元正"]),
+])
+def test_builtin_profiles(currency, expected):
+    """测试内置的繁体币种配置"""
+    numbers = ["100200000.5", "0.05", "100"]
+    assert [convert_currency(number, currency) for number in numbers] == expected
+    profile = get_profile(currency)
+    assert profile.convert_many([10020000050, 5, 10000]) == expected
+    assert profile.convert_many(iter([10020000050, 5, 10000])) == expected
+    assert profile.convert_cents(5) == expected[1]
+
+
+def test_tables_compiled_once_across_threads(monkeypatch):
+    """测试多个线程同时首次使用时只编译一次查询表"""
+    calls = []
+    original = profiles.build_group_texts
+
+    def counting_build(*args):
+        calls.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(profiles, "build_group_texts", counting_build)
+    profile = CurrencyProfile("TEST", TRADITIONAL_DIGITS, whole="正")
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(profile.convert("10.5"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["壹拾元伍角"] * 8
+    assert len(calls) == 1
+    assert profile.tables() is profile.tables()
+
+
+def test_errors():
+    """测试错误处理"""
+    with pytest.raises(ValueError):
+        get_profile("USD")
+    with pytest.raises(ValueError):
+        CurrencyProfile("BAD", digits={0: "零"})
+    with pytest.raises(NegativeNumberError):
+        convert_currency("-1", "HKD")
+    with pytest.raises(NegativeNumberError):
+        get_profile("HKD").convert_many([1, -1])
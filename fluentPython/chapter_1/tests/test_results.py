@@ -0,0 +1,81 @@
+"""
+字典编码结果模块的测试用例
+"""
+import random
+
+import pytest
+
+from src.batch import convert_many
+from src.results import ConversionColumn, _unique_python, convert_unique
+from src.validation import InvalidFormatError, NegativeNumberError
+
+
+def _ledger(rows=20000, unique=300):
+    rng = random.Random(13)
+    pool = [rng.randint(0, 99999999999999) for _ in range(unique)]
+    return [rng.choice(pool) for _ in range(rows)]
+
+
+def test_convert_unique_matches_convert_many():
+    """测试去重结果与逐行转换一致，且每个不同金额只保存一份"""
+    cents = _ledger()
+    expected = convert_many(cents)
+    for column in (convert_unique(cents), _unique_python(cents), _unique_python(iter(cents))):
+        assert isinstance(column, ConversionColumn)
+        assert len(column) == len(cents)
+        assert len(column.values) == len(set(cents))
+        assert column.codes.typecode == "H"
+        assert column.to_list() == expected
+        assert column[5] == expected[5] and column[-1] == expected[-1]
+        assert list(column[100:200:3]) == expected[100:200:3]
+
+
+def test_memory_is_compact():
+    """测试内存占用远小于逐行保存字符串"""
+    column = convert_unique(_ledger(rows=100000, unique=50))
+    assert column.codes.typecode == "B"
+    assert column.nbytes() < 110000
+
+
+def test_python_codes_widen_at_boundary():
+    """测试纯 Python 实现的下标数组在不同金额超过 256 个时才加宽"""
+    cents = list(range(256)) * 2
+    column = _unique_python(cents)
+    assert column.codes.typecode == "B"
+    assert list(column.codes) == cents
+
+    column = _unique_python(cents + [256, 0])
+    assert column.codes.typecode == "H"
+    assert list(column.codes) == cents + [256, 0]
+    assert column.to_list() == convert_many(cents + [256, 0])
+
+
+def test_convert_unique_validation():
+    """测试输入验证"""
+    assert len(convert_unique([])) == 0
+    with pytest.raises(NegativeNumberError):
+        convert_unique([1, -1])
+    with pytest.raises(InvalidFormatError):
+        convert_unique([True])
+    with pytest.raises(InvalidFormatError):
+        convert_unique([1, 1.5])
+    with pytest.raises(InvalidFormatError):
+        _unique_python([1, True])
+
+
+def test_export_arrow():
+    """测试导出 Arrow 字典列"""
+    pa = pytest.importorskip("pyarrow")
+    cents = _ledger(rows=1000)
+    array = convert_unique(cents).to_arrow()
+    assert isinstance(array, pa.DictionaryArray)
+    assert array.to_pylist() == convert_many(cents)
+
+
+def test_export_pandas():
+    """测试导出 pandas 类别列"""
+    pytest.importorskip("pandas")
+    cents = _ledger(rows=1000)
+    series = convert_unique(cents).to_pandas()
+    assert str(series.dtype) == "category"
+    assert series.tolist() == convert_many(cents)
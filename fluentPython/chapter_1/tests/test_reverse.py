@@ -0,0 +1,84 @@
+"""
+反向解析模块的测试用例
+"""
+import random
+import threading
+
+import pytest
+
+from src import reverse
+from src.converter import convert
+from src.reverse import parse_amount, verify, verify_cents, verify_many
+from src.validation import InvalidFormatError, NegativeNumberError
+
+
+def test_parse_amount():
+    """测试解析为分"""
+    assert parse_amount("壹佰贰拾叁元肆角伍分") == 12345
+    assert parse_amount("零元整") == 0
+    assert parse_amount("零元零伍分") == 5
+    assert parse_amount("壹拾元整") == 1000
+    assert parse_amount("壹亿零壹仟元整") == 10000100000
+    assert parse_amount("壹仟万壹仟元整") == 1000100000
+
+
+def test_roundtrip():
+    """测试与正向转换互逆，覆盖分组边界与多零的数值"""
+    rng = random.Random(11)
+    numbers = [0, 10, 1000, 1001, 10000, 10010, 100000001, 100001000, 999999999999]
+    numbers += [rng.randint(0, 999999999999) for _ in range(2000)]
+    numbers += [int("".join(rng.choice("0001") for _ in range(12))) for _ in range(2000)]
+    for number in numbers:
+        cents = rng.randint(0, 99)
+        assert parse_amount(convert(f"{number}.{cents:02d}")) == number * 100 + cents
+
+
+@pytest.mark.parametrize("text", [
+    "", "壹元", "元整", "拾元整", "零壹元整", "壹佰零元整", "壹万零壹仟元整",
+    "壹亿壹仟元整", "壹万万元整", "壹亿壹万元", "壹元零角伍分", "壹元伍分角", "123元整", None,
+])
+def test_reject_malformed(text):
+    """测试拒绝不规范的大写金额"""
+    with pytest.raises(InvalidFormatError):
+        parse_amount(text)
+    assert verify(0, text) is False
+
+
+def test_verify():
+    """测试核对数字与大写金额"""
+    assert verify("123.45", "壹佰贰拾叁元肆角伍分")
+    assert verify(123, "壹佰贰拾叁元整")
+    assert verify(5, convert(5))
+    assert not verify(12345, "壹佰贰拾叁元肆角伍分")
+    assert verify_cents(12345, "壹佰贰拾叁元肆角伍分")
+    assert not verify_cents(123, "壹佰贰拾叁元整")
+    assert not verify("123.46", "壹佰贰拾叁元肆角伍分")
+    assert not verify("124.45", "壹佰贰拾叁元肆角伍分")
+    with pytest.raises(NegativeNumberError):
+        verify("-1", "壹元整")
+
+    assert verify_many(["1", "2", 3], ["壹元整", "壹元整", "叁元整"]) == [True, False, True]
+    with pytest.raises(ValueError):
+        verify_many(["1"], [])
+
+
+def test_tables_published_once(monkeypatch):
+    """测试多个线程同时首次解析时，各线程使用同一份查询表"""
+    monkeypatch.setattr(reverse, "_GROUP_VALUES", None)
+    monkeypatch.setattr(reverse, "_DECIMAL_VALUES", None)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append((reverse._group_values(), reverse._decimal_values(),
+                        parse_amount("壹万零伍元伍角")))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8
+    assert all(groups is results[0][0] and decimals is results[0][1] and cents == 1000550
+               for groups, decimals, cents in results)
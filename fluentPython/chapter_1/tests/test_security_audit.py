@@ -0,0 +1,136 @@
+"""
+安全审计脚本的测试用例
+"""
+import hashlib
+import os
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "scripts"))
+
+import security_audit  # noqa: E402
+from security_audit import AuditCache, SecurityAuditor, audit, check_patterns  # noqa: E402
+
+
+def _write_tree(root):
+    (root / "pkg").mkdir()
+    (root / "a.py").write_text("import pickle\nx = eval('1')\n", encoding="utf-8")
+    (root / "pkg" / "b.py").write_text("print('%s' % 1)\nprint('{}'.format(2))\n",
+                                       encoding="utf-8")
+    (root / "pkg" / "c.py").write_text("import os\nos.system('ls')\n", encoding="utf-8")
+    (root / "pkg" / "clean.py").write_text("x = 1\n", encoding="utf-8")
+    (root / "notes.txt").write_text("eval(", encoding="utf-8")
+
+
+def test_check_patterns():
+    """测试每个模式最多报告一次，顺序与规则一致"""
+    issues = check_patterns("exec(a); eval(b); eval(c); '%d'", "f.py")
+    assert [issue["message"] for issue in issues] == [
+        security_audit.PATTERNS[r"eval\("],
+        security_audit.PATTERNS[r"exec\("],
+        security_audit.PATTERNS[r"%[sd]"],
+    ]
+    assert check_patterns("x = 1", "f.py") == []
+
+
+def test_parallel_and_cached_reports_match(tmp_path):
+    """测试多进程与缓存命中时的报告与单进程冷启动相同"""
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _write_tree(tree)
+    cache_path = str(tmp_path / "cache.json")
+
+    cold = audit(str(tree))
+    assert "导入了不安全的模块: pickle" in cold
+    assert "notes.txt" not in cold
+    assert audit(str(tree), workers=2) == cold
+    assert audit(str(tree), cache_path=cache_path) == cold
+
+    cache = AuditCache(cache_path)
+    auditor = SecurityAuditor(workers=2, cache=cache)
+    auditor.audit_directory(str(tree))
+    assert auditor.generate_report() == cold
+    assert (cache.hits, cache.misses) == (4, 0)
+
+
+def test_cache_detects_changes(tmp_path):
+    """测试修改过的文件重新检查，内容未变时复用结果"""
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _write_tree(tree)
+    cache_path = str(tmp_path / "cache.json")
+    audit(str(tree), cache_path=cache_path)
+
+    # 只更新修改时间：按内容哈希复用
+    clean = tree / "pkg" / "clean.py"
+    stat = clean.stat()
+    os.utime(clean, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    # 修改内容：重新检查
+    (tree / "pkg" / "c.py").write_text("import marshal\n", encoding="utf-8")
+    # 删除文件：不再出现在报告和缓存中
+    (tree / "a.py").unlink()
+
+    cache = AuditCache(cache_path)
+    auditor = SecurityAuditor(cache=cache)
+    auditor.audit_directory(str(tree))
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert auditor.generate_report() == audit(str(tree))
+    assert "导入了不安全的模块: marshal" in auditor.generate_report()
+    assert sorted(AuditCache(cache_path).entries) == sorted(
+        str(path) for path in (tree / "pkg").glob("*.py"))
+
+
+def test_cache_records_scanned_content(tmp_path, monkeypatch):
+    """测试写入缓存的哈希与状态来自检查时读取的内容，不再重新读取文件"""
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _write_tree(tree)
+    (tree / "crlf.py").write_bytes(b"import pickle\r\nx = 1\r\n")
+
+    def fail(*args):
+        raise AssertionError("不应重新读取文件")
+
+    monkeypatch.setattr(security_audit, "_file_hash", fail)
+    monkeypatch.setattr(security_audit.os, "stat", fail)
+    cache = AuditCache(str(tmp_path / "cache.json"))
+    auditor = SecurityAuditor(cache=cache)
+    auditor.audit_directory(str(tree))
+    monkeypatch.undo()
+
+    assert auditor.generate_report() == audit(str(tree))
+    assert "文件: " + str(tree / "crlf.py") in auditor.generate_report()
+    for filepath, entry in cache.entries.items():
+        data = open(filepath, "rb").read()
+        stat = os.stat(filepath)
+        assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+        assert (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size)
+
+
+def test_cache_invalidated_by_rules(tmp_path, monkeypatch):
+    """测试检查规则变化后缓存失效，损坏的缓存文件被忽略"""
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    _write_tree(tree)
+    cache_path = tmp_path / "cache.json"
+    audit(str(tree), cache_path=str(cache_path))
+    assert AuditCache(str(cache_path)).entries
+
+    monkeypatch.setattr(security_audit, "DANGEROUS_MODULES", ["pickle", "marshal", "shelve"])
+    assert AuditCache(str(cache_path)).entries == {}
+
+    cache_path.write_text("{", encoding="utf-8")
+    assert AuditCache(str(cache_path)).entries == {}
+
+
+def test_main_benchmark(tmp_path, capsys):
+    """测试基准模式输出冷启动与缓存命中的耗时，并确认报告相同"""
+    _write_tree(tmp_path)
+    security_audit.main([str(tmp_path), "--benchmark", "--workers", "2"])
+    out = capsys.readouterr().out
+    assert "缓存命中" in out
+    assert out.strip().endswith("各方式的报告相同")
+
+    with pytest.raises(SystemExit):
+        security_audit.main([str(tmp_path / "missing")])
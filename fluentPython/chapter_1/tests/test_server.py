@@ -0,0 +1,162 @@
+"""
+转换服务的测试用例
+"""
+import asyncio
+import json
+
+from src import server as server_module
+from src.server import ConversionServer, handle_batch, handle_request
+
+
+def test_handle_request():
+    """测试请求处理"""
+    assert handle_request({"number": "1.5"}) == {"result": "壹元伍角"}
+    assert handle_request({"number": 100}) == {"result": "壹佰元整"}
+    assert handle_request({"number": "-1"})["error"]["code"] == "NEGATIVE_NUMBER"
+    assert handle_request({"number": None})["error"]["code"] == "INVALID_FORMAT"
+    assert handle_request({"number": [1]})["error"]["code"] == "INVALID_FORMAT"
+
+    response = handle_request({"numbers": ["1", "abc"]})
+    assert response["results"][0] == {"result": "壹元整"}
+    assert response["results"][1]["error"]["code"] == "INVALID_FORMAT"
+
+    assert handle_request({})["error"]["code"] == "BAD_REQUEST"
+    assert handle_request({"numbers": "1"})["error"]["code"] == "BAD_REQUEST"
+    assert handle_request([1])["error"]["code"] == "BAD_REQUEST"
+
+
+def test_handle_batch_converts_once(monkeypatch):
+    """测试一批请求中的全部数字只经过一次批量转换"""
+    calls = []
+    original = server_module.try_convert_many
+
+    def counting(numbers):
+        calls.append(list(numbers))
+        return original(numbers)
+
+    monkeypatch.setattr(server_module, "try_convert_many", counting)
+    responses = handle_batch([{"number": "1"}, {"numbers": ["2", "x"]}, "bad", {"number": 3}])
+    assert calls == [["1", "2", "x", "3"]]
+    assert responses[0] == {"result": "壹元整"}
+    assert responses[1]["results"][0] == {"result": "贰元整"}
+    assert responses[1]["results"][1]["error"]["code"] == "INVALID_FORMAT"
+    assert responses[2]["error"]["code"] == "BAD_REQUEST"
+    assert responses[3] == {"result": "叁元整"}
+
+
+async def _exchange(port, lines):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in lines]
+    writer.close()
+    return responses
+
+
+def test_server_roundtrip():
+    """测试连接上的请求按顺序响应，并发请求被合并成批"""
+    async def scenario():
+        server = ConversionServer(max_batch=64, max_delay=0.005)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            lines = [json.dumps({"id": i, "number": f"{i}.05"}) for i in range(200)]
+            lines.append(json.dumps({"id": "b", "numbers": ["0", "1e5"]}))
+            lines.append("not json")
+            results = await asyncio.gather(_exchange(port, lines), _exchange(port, lines))
+        finally:
+            await server.close()
+        return server, results
+
+    server, results = asyncio.run(scenario())
+    for responses in results:
+        for i in range(200):
+            assert responses[i]["id"] == i
+            assert responses[i]["result"].endswith("零伍分")
+        assert responses[200]["id"] == "b"
+        assert responses[200]["results"][0] == {"result": "零元整"}
+        assert responses[200]["results"][1]["error"]["code"] == "INVALID_FORMAT"
+        assert responses[201]["error"]["code"] == "BAD_REQUEST"
+
+    assert server.requests == 402
+    assert server.batches < server.requests
+
+
+def test_server_survives_failing_request(monkeypatch):
+    """测试转换中抛出异常的请求只得到错误响应，之后的请求照常处理"""
+    original = server_module.try_convert_many
+
+    def failing(numbers):
+        if "boom" in numbers:
+            raise ValueError("boom")
+        return original(numbers)
+
+    monkeypatch.setattr(server_module, "try_convert_many", failing)
+
+    async def scenario():
+        server = ConversionServer()
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            first = await asyncio.wait_for(_exchange(port, [
+                json.dumps({"id": 1, "number": "boom"}),
+                json.dumps({"id": 2, "number": "2"}),
+            ]), 5)
+            second = await asyncio.wait_for(_exchange(port, [json.dumps({"id": 3, "number": "3"})]), 5)
+        finally:
+            await server.close()
+        return first + second
+
+    bad, good, later = asyncio.run(scenario())
+    assert bad["id"] == 1
+    assert bad["error"]["code"] == "INTERNAL_ERROR"
+    assert good == {"id": 2, "result": "贰元整"}
+    assert later == {"id": 3, "result": "叁元整"}
+
+
+def test_server_unix_socket(tmp_path):
+    """测试 Unix socket 监听"""
+    path = str(tmp_path / "rmb.sock")
+
+    async def scenario():
+        server = ConversionServer()
+        await server.start(path=path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(b'{"number": "123.45"}\n')
+            response = json.loads(await reader.readline())
+            writer.close()
+        finally:
+            await server.close()
+        return response
+
+    assert asyncio.run(scenario()) == {"result": "壹佰贰拾叁元肆角伍分"}
+
+
+class _BrokenWriter:
+    """写入时连接已断开的 StreamWriter"""
+
+    def write(self, data):
+        raise ConnectionResetError
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_connection_finishes_after_writer_fails():
+    """测试写任务因连接断开退出、在途队列已满时，连接任务仍能结束"""
+    async def scenario():
+        server = ConversionServer(pipeline=1)
+        await server.start("127.0.0.1", 0)
+        try:
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'{"number": "1"}\n' * 20)
+            reader.feed_eof()
+            await asyncio.wait_for(server._handle_connection(reader, _BrokenWriter()), 5)
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
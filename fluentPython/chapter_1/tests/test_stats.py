@@ -0,0 +1,91 @@
+"""
+运行统计模块的测试用例
+"""
+import json
+import pstats
+
+import pytest
+
+from src import stats
+from src.cli import main
+from src.converter import convert
+from src.optimized_converter import configure_cache, convert_optimized
+from src.validation import validate
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    """每个用例前后关闭并清空统计"""
+    stats.disable()
+    stats.reset_stats()
+    yield
+    stats.disable()
+    stats.reset_stats()
+    configure_cache()
+
+
+def test_disabled_records_nothing():
+    """测试关闭时不计数"""
+    convert("1.5")
+    convert_optimized("1.5")
+    with pytest.raises(Exception):
+        convert("-1")
+    data = stats.get_stats()
+    assert data["enabled"] is False
+    assert all(stage["count"] == 0 for stage in data["stages"].values())
+    assert data["errors"] == {}
+
+
+def test_stage_counters_and_errors():
+    """测试分阶段计数、直方图与错误码计数"""
+    stats.enable()
+    for number in ("1.5", "123456789.01", "100"):
+        assert convert(number) == convert_optimized(number)
+    validate("12.5")
+    for number in ("-1", "abc", "1000000000000"):
+        with pytest.raises(Exception):
+            convert_optimized(number)
+
+    data = stats.get_stats()
+    stages = data["stages"]
+    assert stages["total"]["count"] == 6
+    assert stages["parse"]["count"] == stages["integer"]["count"] == 6
+    assert stages["validate"]["count"] == 1
+    total = stages["total"]
+    assert 0 < total["p50_ns"] <= total["p99_ns"] <= total["max_ns"]
+    assert sum(count for _, count in total["histogram"]) == 6
+    assert data["errors"] == {"NEGATIVE_NUMBER": 1, "INVALID_FORMAT": 1, "NUMBER_TOO_LARGE": 1}
+    assert "hit_rate" in data["caches"]["conversion"]
+    json.dumps(data)
+
+
+def test_input_level_cache_records_total():
+    """测试按整个输入缓存时只记录总耗时"""
+    configure_cache(key_level="input", doorkeeper=False)
+    stats.enable()
+    convert_optimized("1.5")
+    convert_optimized("1.5")
+    data = stats.get_stats()
+    assert data["stages"]["total"]["count"] == 2
+    assert data["stages"]["parse"]["count"] == 0
+    assert data["caches"]["conversion"]["hits"] == 1
+
+
+def test_cli_stats_and_profile(tmp_path, capsys):
+    """测试命令行的 --stats 与 --profile"""
+    with pytest.raises(SystemExit):
+        main(["1.5", "abc", "--stats"])
+    captured = capsys.readouterr()
+    assert captured.out.splitlines()[0] == "壹元伍角"
+    assert "错误 INVALID_FORMAT: 1" in captured.err
+
+    # 命令行与 convert_optimized 共用转换缓存
+    configure_cache(doorkeeper=False)
+    stats.reset_stats()
+    main(["1.5", "1.5", "1.5", "--stats"])
+    assert "缓存 conversion: 命中率 66.7%（命中 2，未命中 1）" in capsys.readouterr().err
+
+    path = tmp_path / "run.pstats"
+    main(["1.5", "--profile", str(path)])
+    assert capsys.readouterr().out == "壹元伍角\n"
+    assert pstats.Stats(str(path)).total_calls > 0
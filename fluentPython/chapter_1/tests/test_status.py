@@ -0,0 +1,121 @@
+"""
+不抛异常的转换模块的测试用例
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from src import status as status_module
+from src.optimized_converter import convert_optimized
+from src.parser import scan_number, split_number
+from src.status import count_statuses, try_convert, try_convert_cents, try_convert_many
+from src.validation import (
+    STATUS_CODES,
+    STATUS_INVALID_FORMAT,
+    STATUS_NEGATIVE,
+    STATUS_OK,
+    STATUS_OVERFLOW,
+    ConversionError,
+)
+
+
+def _expected(number):
+    """用抛异常的接口得到期望的结果与状态码"""
+    try:
+        return convert_optimized(number), STATUS_OK
+    except ConversionError as e:
+        return None, STATUS_CODES.index(e.code)
+
+
+def test_scan_number_matches_split_number():
+    """测试 scan_number 与 split_number 的判断一致"""
+    rng = random.Random(18)
+    samples = ["", ".", "1.", ".5", "-0", "1.2.3", "１２", "0001", "1" * 13, "0" * 20 + "1"]
+    for _ in range(2000):
+        samples.append("".join(rng.choice("0123456789.-a") for _ in range(rng.randint(1, 16))))
+    for number in samples:
+        status, integer_part, decimal_part = scan_number(number)
+        try:
+            assert split_number(number) == (integer_part, decimal_part)
+            assert status == STATUS_OK
+        except ConversionError as e:
+            assert STATUS_CODES[status] == e.code
+
+
+def test_try_convert():
+    """测试单个转换"""
+    assert try_convert("123.45") == ("壹佰贰拾叁元肆角伍分", STATUS_OK)
+    assert try_convert("-1") == (None, STATUS_NEGATIVE)
+    assert try_convert("1e5") == (None, STATUS_INVALID_FORMAT)
+    assert try_convert("1" * 13) == (None, STATUS_OVERFLOW)
+
+
+def test_try_convert_many():
+    """测试批量转换字符串"""
+    numbers = ["100", "abc", "-2", "0.05", "1000000000000", "999999999999.999"]
+    results, statuses = try_convert_many(numbers)
+    assert statuses.typecode == "B"
+    assert list(zip(results, statuses)) == [_expected(number) for number in numbers]
+    assert count_statuses(statuses) == {
+        "INVALID_FORMAT": 1, "NEGATIVE_NUMBER": 1, "NUMBER_TOO_LARGE": 1}
+    assert try_convert_many([]) == ([], statuses[:0])
+
+
+def test_try_convert_many_long_zero_padding():
+    """测试超长前导零的合法输入不抛出异常"""
+    padded = "0" * 5000 + "1"
+    numbers = [padded, padded + ".25", padded.encode(), "0" * 5000 + "1" * 13, "-" + padded]
+    results, statuses = try_convert_many(numbers)
+    assert list(statuses) == [STATUS_OK, STATUS_OK, STATUS_OK, STATUS_OVERFLOW, STATUS_NEGATIVE]
+    assert results[:3] == ["壹元整", "壹元贰角伍分", "壹元整"]
+    assert try_convert(padded, rounding="half_even") == ("壹元整", STATUS_OK)
+
+
+def test_try_convert_typed_inputs():
+    """测试与 convert 接受相同的输入类型"""
+    numbers = [b"12.5", bytearray(b"7"), memoryview(b"0.05"), b"-1", b"\xef\xbc\x91",
+               100, True, -3, 10 ** 12, Decimal("1.005"), Decimal("NaN"), 0.29, float("inf")]
+    results, statuses = try_convert_many(numbers)
+    assert list(zip(results, statuses)) == [_expected(number) for number in numbers]
+    assert try_convert(b"12.5") == ("壹拾贰元伍角", STATUS_OK)
+    assert try_convert(memoryview(b"1.005"), rounding="up") == try_convert("1.005", rounding="up")
+
+
+def test_try_convert_typed_failures_construct_no_exception(monkeypatch):
+    """测试非字符串输入的失败路径同样不构造 ConversionError"""
+    def forbidden(self, *args):
+        raise AssertionError("构造了 ConversionError")
+
+    monkeypatch.setattr(ConversionError, "__init__", forbidden)
+    numbers = [b"-1", b"1.2.3", bytearray(b"1" * 13), True, -3, 10 ** 12,
+               Decimal("NaN"), Decimal("-0"), Decimal("1E+20"), -0.5, float("inf")]
+    results, statuses = try_convert_many(numbers)
+    assert results == [None] * len(numbers)
+    assert list(statuses) == [STATUS_NEGATIVE, STATUS_INVALID_FORMAT, STATUS_OVERFLOW,
+                              STATUS_INVALID_FORMAT, STATUS_NEGATIVE, STATUS_OVERFLOW,
+                              STATUS_INVALID_FORMAT, STATUS_NEGATIVE, STATUS_OVERFLOW,
+                              STATUS_NEGATIVE, STATUS_INVALID_FORMAT]
+    assert try_convert(Decimal("999999999999.995"), rounding="half_up") == (None, STATUS_OVERFLOW)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_try_convert_cents(monkeypatch, use_numpy):
+    """测试批量转换分值，NumPy 与纯 Python 路径结果一致"""
+    if not use_numpy:
+        monkeypatch.setattr(status_module, "_as_int_array", lambda cents: None)
+    elif status_module.np is None:
+        pytest.skip("未安装 NumPy")
+    cents = [12345, -1, 99999999999999, 100000000000000, 0]
+    results, statuses = try_convert_cents(cents)
+    assert results == ["壹佰贰拾叁元肆角伍分", None, "玖仟玖佰玖拾玖亿玖仟玖佰玖拾玖万玖仟玖佰玖拾玖元玖角玖分",
+                       None, "零元整"]
+    assert list(statuses) == [STATUS_OK, STATUS_NEGATIVE, STATUS_OK, STATUS_OVERFLOW, STATUS_OK]
+    assert try_convert_cents([-1, -2])[0] == [None, None]
+
+
+def test_try_convert_cents_non_integers():
+    """测试非整数元素的状态"""
+    results, statuses = try_convert_cents([1, True, 1.5, "1"])
+    assert results == ["零元零壹分", None, None, None]
+    assert list(statuses) == [STATUS_OK] + [STATUS_INVALID_FORMAT] * 3
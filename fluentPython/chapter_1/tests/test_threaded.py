@@ -0,0 +1,97 @@
+"""
+多线程批量转换与并发首次使用的测试用例
+"""
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from src import batch, group_table
+from src.cache import ConversionCache
+from src.optimized_converter import convert_optimized
+from src.threaded import convert_cents_threaded, convert_many_threaded, convert_uncached
+from src.validation import NegativeNumberError
+
+
+def _run_concurrently(func, count: int = 8) -> list:
+    """让 count 个线程同时开始执行 func，返回各线程的结果"""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        results[index] = func()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_convert_many_threaded():
+    """测试多线程结果与逐个转换一致，顺序不变"""
+    rng = random.Random(21)
+    numbers = [f"{rng.randint(0, 999999999999)}.{rng.randint(0, 99):02d}" for _ in range(3000)]
+    expected = [convert_optimized(number) for number in numbers]
+    assert convert_many_threaded(numbers, workers=4, chunk_size=100) == expected
+    assert convert_many_threaded(iter(numbers), workers=1) == expected
+    with ThreadPoolExecutor(3) as executor:
+        assert convert_many_threaded(numbers, chunk_size=7, executor=executor) == expected
+    assert convert_many_threaded([]) == []
+    assert convert_uncached(Decimal("0.125"), "half_even") == "零元壹角贰分"
+
+
+def test_convert_many_threaded_errors():
+    """测试出错时抛出异常"""
+    with pytest.raises(NegativeNumberError):
+        convert_many_threaded(["1"] * 10 + ["-1"], workers=2, chunk_size=3)
+    with pytest.raises(ValueError):
+        convert_many_threaded(["1"], chunk_size=0)
+
+
+def test_convert_cents_threaded():
+    """测试多线程分值批量转换"""
+    cents = list(range(0, 10 ** 14, 10 ** 14 // 997))
+    expected = batch.convert_many(cents)
+    assert convert_cents_threaded(cents, workers=3, chunk_size=50) == expected
+    if batch.np is not None:
+        assert convert_cents_threaded(batch.np.array(cents), workers=3, chunk_size=50) == expected
+
+
+def test_tables_published_once(monkeypatch):
+    """测试多个线程同时首次使用时分组表与批量查询表只构建一次"""
+    calls = []
+    original = group_table.build_group_texts
+
+    def counting_build(*args):
+        calls.append(1)
+        return original(*args)
+
+    monkeypatch.delenv(group_table.TABLE_ENV, raising=False)
+    monkeypatch.setattr(group_table, "build_group_texts", counting_build)
+    monkeypatch.setattr(group_table, "_TEXTS", None)
+    monkeypatch.setattr(batch, "_TABLES", None)
+    results = _run_concurrently(lambda: (group_table.get_group_texts(), batch._build_tables()))
+    assert len(calls) == 1
+    assert all(texts is results[0][0] and tables is results[0][1] for texts, tables in results)
+
+
+def test_cache_concurrent_access():
+    """测试多线程同时读写一个小容量 LRU 缓存"""
+    cache = ConversionCache(maxsize=50, doorkeeper=False)
+
+    def hammer():
+        rng = random.Random(threading.get_ident())
+        for _ in range(5000):
+            key = rng.randint(0, 200)
+            assert cache.get_or_compute(key, str) == str(key)
+        return True
+
+    assert all(_run_concurrently(hammer))
+    assert len(cache) <= 50
+    stats = cache.stats()
+    assert stats["misses"] > 0 and stats["evictions"] > 0
@@ -2,8 +2,11 @@
 验证模块的测试用例
 """
 import pytest
+from decimal import Decimal
 from src.validation import (
+    round_fraction,
     validate,
+    validate_decimal,
     InvalidFormatError,
     OverflowError,
     NegativeNumberError
@@ -50,4 +53,47 @@ def test_overflow():
     
     with pytest.raises(OverflowError) as exc:
         validate("999999999999.999")
-    assert exc.value.code == "NUMBER_TOO_LARGE" 
\ No newline at end of file
+    assert exc.value.code == "NUMBER_TOO_LARGE" 
+
+def test_rounding():
+    """测试舍入方式与舍入后的范围检查"""
+    assert round_fraction("125", "half_even") == 12
+    assert round_fraction("135", "half_even") == 14
+    assert round_fraction("995", "half_up") == 100
+    assert round_fraction("", "up") == 0
+    assert validate("999999999999.994", rounding="half_up") == True
+    with pytest.raises(InvalidFormatError):
+        validate("0.１２５", rounding="half_even")
+    with pytest.raises(OverflowError):
+        validate("999999999999.995", rounding="half_up")
+    with pytest.raises(OverflowError):
+        validate_decimal(Decimal("999999999999.995"), rounding="half_even")
+    assert validate_decimal(Decimal("0.125"), rounding="half_even") == 12
+    assert validate_decimal(Decimal("0.121"), rounding="up") == 13
+    with pytest.raises(ValueError):
+        validate("1.005", rounding="nearest")
+
+def test_agrees_with_converter():
+    """测试 validate 与转换使用同一解析器：全角等非ASCII数字同样被拒绝"""
+    from src.converter import convert
+
+    for number in ["１２３", "1.２", "٣", "12.5"]:
+        try:
+            convert(number)
+        except InvalidFormatError:
+            with pytest.raises(InvalidFormatError):
+                validate(number)
+        else:
+            assert validate(number) == True
+
+def test_typed_inputs():
+    """测试非字符串输入按类型检查"""
+    assert validate(Decimal("999999999999.99")) == True
+    assert validate(b"123.45") == True
+    assert validate(0.1) == True
+    with pytest.raises(InvalidFormatError):
+        validate(Decimal("Infinity"))
+    with pytest.raises(NegativeNumberError):
+        validate(memoryview(b"-1"))
+    with pytest.raises(OverflowError):
+        validate(10 ** 12)
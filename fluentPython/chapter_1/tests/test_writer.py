@@ -0,0 +1,95 @@
+"""
+编码输出模块的测试用例
+"""
+import io
+import random
+import threading
+
+import pytest
+
+from src import writer
+from src.batch import convert_many
+from src.validation import NegativeNumberError
+from src.writer import encode_into, max_row_bytes, read_record, write_many
+
+ENCODINGS = ["utf-8", "gbk", "gb18030"]
+
+
+def _sample():
+    rng = random.Random(12)
+    cents = [rng.randint(0, 99999999999999) for _ in range(3000)]
+    cents += [0, 5, 100, 10005000, 10000000100, 100001000000, 99999999999999]
+    return cents
+
+
+@pytest.fixture(params=["numpy", "python"])
+def path(request, monkeypatch):
+    """分别走向量化路径与纯 Python 路径"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(writer, "_as_int_array", lambda cents: None)
+    return request.param
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_write_many_matches_convert_many(path, encoding):
+    """测试写出的字节与先转换再编码的结果一致"""
+    cents = _sample()
+    expected = "".join(text + "\n" for text in convert_many(cents)).encode(encoding)
+    output = io.BytesIO()
+    assert write_many(cents, output, encoding, chunk_rows=500) == len(expected)
+    assert output.getvalue() == expected
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_fixed_width_records(path, encoding):
+    """测试定长记录可按行号随机访问"""
+    cents = _sample()
+    expected = convert_many(cents)
+    record_size = max_row_bytes(encoding)
+    buffer = bytearray(record_size * len(cents))
+    assert encode_into(cents, buffer, encoding=encoding, record_size=record_size) == len(buffer)
+    for index in (0, 1, len(cents) // 2, len(cents) - 1):
+        assert read_record(buffer, index, record_size, encoding) == expected[index]
+
+    output = io.BytesIO()
+    write_many(cents, output, encoding, record_size=record_size, chunk_rows=700)
+    assert output.getvalue() == buffer
+
+
+def test_encode_into_offset_and_errors(path):
+    """测试写入位置、空间不足与非法输入"""
+    buffer = bytearray(b"#" * 64)
+    end = encode_into([100], buffer, offset=2)
+    assert buffer[:end] == b"##" + "壹元整\n".encode("utf-8")
+
+    with pytest.raises(ValueError):
+        encode_into([12345], bytearray(10))
+    with pytest.raises(ValueError):
+        encode_into([99999999999999], bytearray(100), record_size=20)
+    with pytest.raises(NegativeNumberError):
+        encode_into([1, -1], bytearray(100))
+
+
+def test_tables_published_once(monkeypatch):
+    """测试多个线程同时首次使用时，各线程拿到同一份字节表"""
+    monkeypatch.setattr(writer, "_ENCODED", {})
+    monkeypatch.setattr(writer, "_NUMPY_ENCODED", {})
+    numpy_available = writer.np is not None
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        tables = writer._encoded_tables("gbk")
+        results.append((tables, writer._numpy_encoded("gbk") if numpy_available else None))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8
+    assert all(tables is results[0][0] for tables, _ in results)
+    assert all(arrays is results[0][1] for _, arrays in results)